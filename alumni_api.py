@@ -0,0 +1,186 @@
+"""Read-only JSON API over the alumni_service repositories, without Tk.
+
+    python alumni_api.py --port 8080 --user student --password student@123
+
+Requests are served by aiohttp and queries run on an aiomysql pool, so one
+process handles many clients without a thread per request. The SQL is the
+same the GUI runs: repositories build it, alumni_service.AsyncDatabase
+executes it.
+What a client may see is decided by the MySQL account the API logs in
+with; permission errors come back as 403.
+
+Listings are keyset-paged: pass the "next_after" of one response as
+?after= to get the next page.
+"""
+import argparse
+import functools
+import json
+import sys
+
+import alumni_db
+import alumni_service
+
+try:
+    import aiomysql
+    from aiohttp import web
+except ImportError:  # only needed to serve the API
+    aiomysql = None
+    web = None
+
+# Largest page a client may ask for
+MAX_LIMIT = 1000
+DEFAULT_PORT = 8080
+POOL_SIZE = 10
+
+# MySQL errors that mean the API account lacks a privilege
+PERMISSION_ERRNOS = (1044, 1142, 1143, 1370)
+
+
+# =============================================
+#  Handlers
+# =============================================
+def _int_param(request, name, default=None, maximum=None):
+    value = request.query.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        number = alumni_db.parse_int(value)
+    except ValueError:
+        raise web.HTTPBadRequest(reason=f"{name} must be a number") from None
+    if number < 0:
+        raise web.HTTPBadRequest(reason=f"{name} must not be negative")
+    return min(number, maximum) if maximum is not None else number
+
+
+def _limit(request):
+    return _int_param(request, "limit", alumni_service.DEFAULT_PAGE_SIZE, MAX_LIMIT)
+
+
+def _json(result, limit=None):
+    """Rows as objects; with a limit, next_after is the key to continue from (None on the last page)"""
+    rows, columns = result
+    body = {"columns": columns, "rows": [dict(zip(columns, row)) for row in rows]}
+    if limit is not None:
+        body["next_after"] = rows[-1][0] if rows and len(rows) >= limit else None
+    return web.json_response(body, dumps=functools.partial(json.dumps, default=str))
+
+
+def _listing(repository_name):
+    async def handler(request):
+        repository = getattr(request.app["sql"], repository_name)
+        limit = _limit(request)
+        return _json(await repository.list_page(after=_int_param(request, "after"), limit=limit), limit)
+    return handler
+
+
+async def search_alumni(request):
+    text = request.query.get("q", "").strip()
+    if not text:
+        raise web.HTTPBadRequest(reason="q is required")
+    return _json(await request.app["sql"].alumni.search(text, _limit(request), _int_param(request, "offset", 0)))
+
+
+async def mentorships_by_alumni(request):
+    try:
+        alumni_id = alumni_db.parse_int(request.match_info["alumni_id"])
+    except ValueError:
+        raise web.HTTPNotFound() from None
+    return _json(await request.app["sql"].mentorships.by_alumni(alumni_id))
+
+
+async def alumni_profile(request):
+    try:
+        alumni_id = alumni_db.parse_int(request.match_info["alumni_id"])
+    except ValueError:
+        raise web.HTTPNotFound() from None
+    result_sets = await request.app["sql"].alumni.profile(alumni_id)
+    sections = dict(zip(alumni_service.AlumniRepository.PROFILE_SECTIONS, result_sets))
+    if not sections.get("Alumni", ([], []))[0]:
+        raise web.HTTPNotFound()
+    body = {name: [dict(zip(columns, row)) for row in rows] for name, (rows, columns) in sections.items()}
+    return web.json_response(body, dumps=functools.partial(json.dumps, default=str))
+
+
+async def attendance_leaderboard(request):
+    return _json(await request.app["sql"].alumni.attendance_leaderboard(_limit(request)))
+
+
+async def participant_counts(request):
+    return _json(await request.app["sql"].events.participant_counts())
+
+
+async def departments(request):
+    return _json(await request.app["sql"].departments.list_all())
+
+
+async def committees(request):
+    return _json(await request.app["sql"].committees.list_all())
+
+
+async def database_errors(request, handler):
+    """Turn MySQL errors into HTTP errors: 403 for missing privileges, else 500"""
+    try:
+        return await handler(request)
+    except aiomysql.Error as err:
+        code = err.args[0] if err.args else None
+        if code in PERMISSION_ERRNOS:
+            raise web.HTTPForbidden(reason="The API account lacks the privileges for this query") from None
+        raise web.HTTPInternalServerError(reason=f"Database error {code}") from None
+
+
+# =============================================
+#  Application
+# =============================================
+def create_app(user, password, host=alumni_db.DB_HOST, database=alumni_db.DB_NAME, pool_size=POOL_SIZE):
+    if web is None:
+        raise RuntimeError("The HTTP API needs aiohttp and aiomysql (pip install aiohttp aiomysql)")
+    app = web.Application(middlewares=[web.middleware(database_errors)])
+
+    async def open_pool(app):
+        # Every route is a read, so each query is its own transaction
+        app["pool"] = await aiomysql.create_pool(host=host, user=user, password=password, db=database,
+                                                 minsize=1, maxsize=pool_size, autocommit=True)
+        app["sql"] = alumni_service.Repositories(alumni_service.AsyncDatabase(app["pool"]))
+
+    async def close_pool(app):
+        app["pool"].close()
+        await app["pool"].wait_closed()
+
+    app.on_startup.append(open_pool)
+    app.on_cleanup.append(close_pool)
+    app.add_routes([
+        web.get("/alumni", _listing("alumni")),
+        web.get("/alumni/search", search_alumni),
+        web.get("/alumni/leaderboard", attendance_leaderboard),
+        web.get("/alumni/{alumni_id}/mentorships", mentorships_by_alumni),
+        web.get("/alumni/{alumni_id}/profile", alumni_profile),
+        web.get("/students", _listing("students")),
+        web.get("/mentorships", _listing("mentorships")),
+        web.get("/events", _listing("events")),
+        web.get("/events/participants", participant_counts),
+        web.get("/departments", departments),
+        web.get("/committees", committees),
+    ])
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the alumni database as a read-only JSON API")
+    parser.add_argument("--user", default="student")
+    parser.add_argument("--password", default="student@123")
+    parser.add_argument("--db-host", default=alumni_db.DB_HOST)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    try:
+        app = create_app(args.user, args.password, host=args.db_host)
+    except RuntimeError as err:
+        print(err, file=sys.stderr)
+        return 2
+    web.run_app(app, host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,59 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, filedialog
 import mysql.connector
-from prettytable import PrettyTable
+import alumni_db
+import alumni_service
+import async_backend
+import bulk_import
+import result_export
+import table_format
+import functools
+import logging
 import sys
-from datetime import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# Upper bound on database jobs running at the same time from the GUI
+MAX_CONCURRENT_QUERIES = 4
+# Pooled connections per role: one per background worker, one for the Tk
+# thread, and two for the grid's row streams, which stay open between jobs
+# (the one on screen and the one about to replace it). Exports stream on a
+# connection of their own.
+POOL_SIZE = MAX_CONCURRENT_QUERIES + 3
+# Rows per page for the keyset-paginated "View All" screens
+DEFAULT_PAGE_SIZE = 100
+# Type-ahead picker result cache: seconds per entry and number of prefixes kept
+PICKER_CACHE_TTL = 60
+PICKER_CACHE_SIZE = 200
+# Event check-in: save scanned attendees every this many ms, or sooner once this many are waiting
+CHECKIN_FLUSH_MS = 3000
+CHECKIN_FLUSH_ROWS = 200
+# Alumni profiles kept in memory (one entry per alumni_id)
+PROFILE_CACHE_SIZE = 100
+# Query stats panel refresh interval
+QUERY_STATS_REFRESH_MS = 2000
+
+
+def requires(*needs):
+    """Mark an AlumniDBGUI handler as needing every (privilege, table or routine) in needs.
+
+    Screens only offer handlers the account's privileges allow, and a
+    handler reached anyway stops before sending any SQL.
+    """
+    def decorate(handler):
+        @functools.wraps(handler)
+        def gated(self, *args, **kwargs):
+            if not self.allowed(gated):
+                messagebox.showinfo("Not Allowed", f"The {self.current_role} role cannot do this.")
+                return None
+            return handler(self, *args, **kwargs)
+        gated.requires = needs
+        return gated
+    return decorate
+
 
 class LoginWindow:
     def __init__(self, root):
@@ -49,13 +99,11 @@ class LoginWindow:
             return
 
         try:
-            conn = mysql.connector.connect(
-                host="localhost",
-                user=user,
-                password=pw,
-                database="AlumniDB"
-            )
-            conn.close()
+            conn = alumni_db.connect(user, pw)
+            # Keep the probe connection as the first pooled connection for this role
+            pool = alumni_db.get_pool(user, pw, first_connection=conn, size=POOL_SIZE)
+            # What the role may do, read once here and kept with the pool
+            pool.privileges()
 
             messagebox.showinfo("Success", f"Login successful as {role}!")
             self.root.withdraw()
@@ -65,6 +113,460 @@ class LoginWindow:
             messagebox.showerror("Login Failed", f"Database connection error:\n{err}")
 
 
+# =============================================
+#  Background Query Executor
+# =============================================
+class BackgroundQueryExecutor:
+    """Run database work on a bounded thread pool and hand results back to Tk.
+
+    Jobs are submitted under a key (normally the name of the handler that
+    issued them). A new job under a key that is still pending supersedes the
+    old one: a queued job is cancelled, a running one finishes but its result
+    is dropped. Results are passed to the callback on the Tk thread by polling
+    a queue with root.after, since Tk widgets must not be touched from workers.
+
+    Jobs submitted with screen=True fill widgets of the current screen; their
+    results are dropped once new_screen() has been called, i.e. after the
+    user has moved on and those widgets are gone. An exception raised by a
+    callback is reported through Tk's report_callback_exception and does not
+    stop later results from being delivered.
+    """
+
+    POLL_MS = 30
+
+    def __init__(self, root, max_workers=MAX_CONCURRENT_QUERIES, on_busy_change=None):
+        self.root = root
+        self.on_busy_change = on_busy_change
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._done = queue.Queue()
+        self._calls = queue.Queue()  # (fn, args) posted by workers, e.g. progress updates
+        self._lock = threading.Lock()
+        self._latest = {}  # key -> most recent Future submitted under that key
+        self._in_flight = 0
+        self._screen = 0  # bumped by new_screen()
+        self._closed = False
+        self.root.after(self.POLL_MS, self._poll)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def submit(self, key, work, callback, on_discard=None, screen=False):
+        """Run work() in the pool, then call callback(result, error) on the Tk thread.
+
+        on_discard(result) is called instead if the job completed but was
+        superseded, so results holding resources (e.g. open cursors) can be
+        released. screen=True ties the job to the current screen.
+        """
+        if self._closed:
+            return None
+        return self.track(key, self._pool.submit(self._run_as, key, work), callback, on_discard, screen)
+
+    def track(self, key, future, callback, on_discard=None, screen=False):
+        """Deliver a future started elsewhere (e.g. on the async backend) like a submitted job"""
+        if self._closed:
+            future.cancel()
+            return None
+        generation = self._screen if screen else None
+        with self._lock:
+            previous = self._latest.get(key)
+            if previous is not None and previous is not future:
+                previous.cancel()  # no-op if it has already started
+            self._latest[key] = future
+            self._in_flight += 1
+        future.add_done_callback(lambda f: self._done.put((key, f, callback, on_discard, generation)))
+        self._notify()
+        return future
+
+    def cancel(self, key):
+        """Forget the pending job under key so its result is never delivered."""
+        with self._lock:
+            future = self._latest.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def new_screen(self):
+        """Drop the results of pending screen=True jobs; called when the screen's widgets are destroyed"""
+        self._screen += 1
+
+    def post(self, fn, *args):
+        """Call fn(*args) on the Tk thread at the next poll. Safe to call from workers."""
+        self._calls.put((fn, args))
+
+    def shutdown(self):
+        self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run_as(key, work):
+        # Queries are attributed to the job's key (the handler name) in the query stats
+        with alumni_db.query_caller(str(key[0] if isinstance(key, tuple) else key)):
+            return work()
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    job = self._done.get_nowait()
+                except queue.Empty:
+                    break
+                self._guarded(self._deliver, *job)
+            while True:
+                try:
+                    fn, args = self._calls.get_nowait()
+                except queue.Empty:
+                    break
+                self._guarded(fn, *args)
+        finally:
+            if not self._closed:
+                self.root.after(self.POLL_MS, self._poll)
+
+    def _guarded(self, fn, *args):
+        try:
+            fn(*args)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def _deliver(self, key, future, callback, on_discard, generation):
+        with self._lock:
+            self._in_flight -= 1
+            current = self._latest.get(key) is future
+            if current:
+                del self._latest[key]
+        self._notify()
+
+        # Cancelled or superseded by a newer request under the same key, or its screen is gone
+        if future.cancelled():
+            return
+        error = future.exception()
+        if not current or generation not in (None, self._screen):
+            if error is None and on_discard:
+                on_discard(future.result())
+            return
+        callback(None if error else future.result(), error)
+
+    def _notify(self):
+        if self.on_busy_change:
+            self.on_busy_change(self._in_flight)
+
+
+# =============================================
+#  Virtualized Result Grid
+# =============================================
+class ResultGrid:
+    """Treeview that only materializes the rows currently on screen.
+
+    Rows live in a plain list and the tree holds one item per visible line;
+    scrolling rewrites those items instead of inserting every row into Tk.
+    When the grid is fed from an alumni_db.RowStream, further pages are fetched
+    in the background as the user scrolls towards the end of what is loaded.
+    Clicking a heading sorts the loaded rows in memory, unless the rows were
+    loaded with sortable=False (grouped views, whose blanked keys only make
+    sense in the order the query returned). The selection is kept
+    per row rather than per tree item, so it survives scrolling and sorting.
+    Ctrl+C copies the selected rows as a text table.
+    """
+
+    ROW_HEIGHT = 20
+    HEADING_HEIGHT = 25
+    PAGE_SIZE = 500
+    # Start fetching the next page when this close to the end of the loaded rows
+    PREFETCH_MARGIN = 100
+    MAX_COLUMN_WIDTH = 300
+
+    def __init__(self, parent, executor):
+        self.executor = executor
+        self.columns = []
+        self.rows = []
+        self.stream = None
+        self.offset = 0
+        self.visible = 1
+        self.sort_column = None
+        self.sort_descending = False
+        self.selected = set()  # id() of the selected row tuples
+        self._fetching = False
+
+        self.frame = ttk.Frame(parent)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        ttk.Style(self.frame).configure("Results.Treeview", rowheight=self.ROW_HEIGHT)
+        self.tree = ttk.Treeview(self.frame, show="headings", selectmode="extended", style="Results.Treeview")
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.vscroll = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.vscroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        hscroll = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        hscroll.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.tree.configure(xscrollcommand=hscroll.set)
+
+        self.status = tk.Label(self.frame, text="", anchor=tk.W, fg='gray', font=('Arial', 8))
+        self.status.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E))
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_by(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self.visible))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self.visible))
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<ButtonPress-1>", self.on_click)
+        self.tree.bind("<Control-a>", self.select_all)
+        self.tree.bind("<Control-c>", self.copy_selection)
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def load(self, columns, rows, stream=None, sortable=True):
+        """Show rows under the given headings; stream supplies any further rows."""
+        self.close_stream()
+        self.columns = list(columns)
+        self.rows = list(rows)
+        self.stream = stream
+        self.offset = 0
+        self.sort_column = None
+        self.sort_descending = False
+        self.selected = set()
+
+        self.tree.delete(*self.tree.get_children())
+        self.tree["columns"] = [str(i) for i in range(len(self.columns))]
+        widths = table_format.column_widths(self.columns, self.rows[:100])
+        for i, name in enumerate(self.columns):
+            self.tree.heading(str(i), text=name, command=(lambda c=i: self.sort_by(c)) if sortable else "")
+            self.tree.column(str(i), width=min(self.MAX_COLUMN_WIDTH, 20 + 8 * widths[i]),
+                             stretch=False, anchor=tk.W)
+        self.render()
+
+    def show_message(self, text):
+        """Replace the grid contents with a single line of text."""
+        self.load(["Message"], [(text,)])
+        self.tree.column("0", width=600, stretch=True)
+
+    def close_stream(self):
+        if self.stream is not None:
+            stream, self.stream = self.stream, None
+            self.executor.cancel("grid_fetch")
+            self._fetching = False
+            # Closing may wait on a fetch still running in a worker, so do it there too
+            self.executor.submit(("close_stream", id(stream)), stream.close, lambda res, err: None)
+
+    def has_more(self):
+        return self.stream is not None and not self.stream.exhausted
+
+    def render(self):
+        """Write the visible slice of rows into the tree items."""
+        end = min(self.offset + self.visible, len(self.rows))
+        window = self.rows[self.offset:end]
+        items = self.tree.get_children()
+        for i, row in enumerate(window):
+            values = ["NULL" if v is None else v for v in row]
+            if i < len(items):
+                self.tree.item(items[i], values=values)
+            else:
+                self.tree.insert("", tk.END, values=values)
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+        items = self.tree.get_children()
+        self.tree.selection_set([item for item, row in zip(items, window) if id(row) in self.selected])
+
+        total = self._scroll_extent()
+        if total:
+            self.vscroll.set(self.offset / total, end / total)
+        else:
+            self.vscroll.set(0, 1)
+        self.update_status()
+
+        if self.has_more() and end + self.PREFETCH_MARGIN >= len(self.rows):
+            self.fetch_more()
+
+    def update_status(self):
+        end = min(self.offset + self.visible, len(self.rows))
+        more = "+" if self.has_more() else ""
+        text = f"Rows {self.offset + 1 if end else 0}-{end} of {len(self.rows)}{more}"
+        if self.selected:
+            text += f" — {len(self.selected)} selected"
+        self.status.config(text=text)
+
+    def on_select(self, event=None):
+        # Mirror the tree's selection of the visible items onto their rows
+        items = self.tree.get_children()
+        chosen = set(self.tree.selection())
+        for item, row in zip(items, self.rows[self.offset:self.offset + len(items)]):
+            if item in chosen:
+                self.selected.add(id(row))
+            else:
+                self.selected.discard(id(row))
+        self.update_status()
+
+    def on_click(self, event):
+        # A plain click starts a new selection, including rows scrolled out of view
+        if not event.state & 0x0005:  # Shift or Control held
+            self.selected.clear()
+
+    def select_all(self, event=None):
+        """Select every loaded row (rows not yet fetched from a stream are not included)"""
+        self.selected = {id(row) for row in self.rows}
+        self.render()
+        return "break"
+
+    def selected_rows(self):
+        """The selected rows, in display order"""
+        return [row for row in self.rows if id(row) in self.selected]
+
+    def copy_selection(self, event=None):
+        """Put the selected rows on the clipboard as a text table, formatted in a worker"""
+        rows = self.selected_rows()
+        if not rows:
+            return "break"
+        columns = self.columns
+        self.status.config(text=f"Copying {len(rows):,} rows...")
+
+        def done(text, error):
+            if error is not None:
+                self.status.config(text=f"Could not copy: {error}")
+                return
+            self.tree.clipboard_clear()
+            self.tree.clipboard_append(text)
+            self.status.config(text=f"Copied {len(rows):,} rows")
+
+        self.executor.submit("grid_copy", lambda: table_format.format_table(columns, rows), done)
+        return "break"
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.rows) - self.visible))
+        self.render()
+
+    def scroll_by(self, delta):
+        self.scroll_to(self.offset + delta)
+        return "break"
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == tk.MOVETO:
+            self.scroll_to(int(float(amount) * self._scroll_extent()))
+        elif action == tk.SCROLL:
+            step = self.visible if unit == tk.PAGES else 1
+            self.scroll_by(int(amount) * step)
+
+    def on_resize(self, event):
+        visible = max(1, (event.height - self.HEADING_HEIGHT) // self.ROW_HEIGHT)
+        if visible != self.visible:
+            self.visible = visible
+            self.scroll_to(self.offset)
+
+    def fetch_more(self, then=None):
+        """Fetch the next page from the stream in the background."""
+        if self._fetching or not self.has_more():
+            return
+        self._fetching = True
+        stream = self.stream
+        work = (lambda: stream.fetch_all()) if then else (lambda: stream.fetch(self.PAGE_SIZE))
+
+        def done(rows, error):
+            self._fetching = False
+            if stream is not self.stream:
+                return
+            if error is not None:
+                self.status.config(text=f"Could not load more rows: {error}")
+                self.stream = None
+                return
+            self.rows.extend(rows)
+            if then:
+                then()
+            else:
+                self.render()
+
+        self.executor.submit("grid_fetch", work, done)
+
+    def sort_by(self, column):
+        """Sort the rows by a column, toggling the direction on repeated clicks."""
+        if self.has_more():
+            # Sorting needs every row; read the rest of the stream first
+            self.fetch_more(then=lambda: self.sort_by(column))
+            return
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column, self.sort_descending = column, False
+        self.rows.sort(key=lambda r: (r[column] is None, r[column]), reverse=self.sort_descending)
+        for i, name in enumerate(self.columns):
+            arrow = (" ▼" if self.sort_descending else " ▲") if i == column else ""
+            self.tree.heading(str(i), text=name + arrow)
+        self.scroll_to(0)
+
+    def _scroll_extent(self):
+        # Leave room below the loaded rows while more can still be fetched
+        return len(self.rows) + (self.PAGE_SIZE if self.has_more() else 0)
+
+
+
+# =============================================
+#  Type-ahead Entity Picker
+# =============================================
+class EntityPicker:
+    """Editable combobox that searches alumni, students or events as the user types.
+
+    Each keystroke (after a short debounce) runs a LIMITed prefix query on
+    the indexed name column, or an exact lookup when the text is a number,
+    so nothing scales with table size. Recent answers are kept in the GUI's
+    picker cache. Values have the usual "id - name" form.
+    """
+
+    DEBOUNCE_MS = 250
+    LIMIT = 20
+    IGNORED_KEYS = {"Up", "Down", "Left", "Right", "Return", "Tab", "Escape",
+                    "Shift_L", "Shift_R", "Control_L", "Control_R"}
+
+    # entity -> attribute of the GUI's Repositories
+    ENTITIES = {"alumni": "alumni", "student": "students", "event": "events"}
+
+    def __init__(self, parent, gui, entity, textvariable=None, width=None):
+        self.gui = gui
+        self.entity = entity
+        self.var = textvariable or tk.StringVar()
+        self._after_id = None
+        self.combo = ttk.Combobox(parent, textvariable=self.var, width=width)
+        self.combo.bind("<KeyRelease>", self.on_key)
+
+    def grid(self, **kwargs):
+        self.combo.grid(**kwargs)
+
+    def set_choices(self, rows):
+        """Fill the dropdown from (id, name) rows"""
+        if self.combo.winfo_exists():
+            self.combo["values"] = [f"{r[0]} - {r[1]}" for r in rows]
+
+    def first_choices(self):
+        """Statement for the first LIMIT names, to fill the dropdown before anything is typed"""
+        return getattr(self.gui.sql, self.ENTITIES[self.entity]).pick("", self.LIMIT)
+
+    def on_key(self, event):
+        if event.keysym in self.IGNORED_KEYS:
+            return
+        if self._after_id is not None:
+            self.combo.after_cancel(self._after_id)
+        self._after_id = self.combo.after(self.DEBOUNCE_MS, self.search)
+
+    def search(self):
+        self._after_id = None
+        text = self.var.get().strip()
+        if not text or text in self.combo["values"]:
+            return
+
+        repository = getattr(self.gui.sql, self.ENTITIES[self.entity])
+        query, params = repository.pick(text, self.LIMIT)
+        cache_key = f"{self.entity}:{text.lower()}"
+        work = lambda: self.gui.picker_cache.get(cache_key, (repository.TABLE,),
+                                                 lambda: self.gui.run_query(query, params)[0])
+
+        def done(rows, error):
+            if error is not None:
+                self.gui.report_error(error)
+                return
+            self.set_choices(rows)
+
+        self.gui.executor.submit(f"picker:{id(self)}", work, done, screen=True)
+
+
 # =============================================
 #  Main GUI Class
 # =============================================
@@ -78,103 +580,243 @@ class AlumniDBGUI:
         self.root.geometry("1200x800")
         self.root.configure(bg="#2c3e50")
 
-        self.connection = None
+        self.pool = None
+        self.async_backend = None
+        self.query_stats = alumni_db.QueryStats()
+        # Repositories hand back (sql, params) for the GUI to run on its executor
+        self.sql = alumni_service.Repositories(alumni_service.StatementDatabase())
         self.connect_to_db()
 
         # Only set up the GUI after successful DB connection
-        if self.connection:
+        if self.pool:
+            self.lookup_cache = alumni_db.LookupCache()
+            self.picker_cache = alumni_db.LookupCache(ttl=PICKER_CACHE_TTL, max_entries=PICKER_CACHE_SIZE)
+            self.result_cache = alumni_db.ResultCache()
+            self.profile_cache = alumni_db.LookupCache(ttl=alumni_db.RESULT_CACHE_TTL, max_entries=PROFILE_CACHE_SIZE)
+            self.executor = BackgroundQueryExecutor(self.root, on_busy_change=self.update_busy_indicator)
+            self.save_pending_checkins = None  # set while the check-in screen is open, see shutdown
+            self.current_screen = "ui"  # handler last opened from a button, for query stats
             self.setup_gui()
-            self.apply_role_restrictions()  
 
     def connect_to_db(self):
-        """Connect to MySQL database using credentials from login"""
+        """Attach to the connection pool for the logged-in user"""
         try:
-            self.connection = mysql.connector.connect(
-                host="localhost",
-                user=self.db_user,
-                password=self.db_pass,
-                database="AlumniDB"
-            )
+            pool = alumni_db.get_pool(self.db_user, self.db_pass, size=POOL_SIZE)
+            # Make sure the pool can actually hand out a working connection
+            pool.release(pool.acquire())
+            self.pool = pool
+            self.privileges = pool.privileges()
+            self.db = alumni_service.PooledDatabase(pool, on_write=self.note_write, stats=self.query_stats)
             print("Successfully connected to database!")
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error connecting to database: {err}")
             self.root.destroy()
+            return
+        self.async_backend = self.start_async_backend()
 
-    def execute_query(self, query, params=None, fetch=True):
-        """Execute SQL queries safely with global permission handling."""
+    def start_async_backend(self):
+        """Open the asyncio backend used for concurrent lookups, or return None to use the thread pool"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or ())
+            return async_backend.AsyncBackend(self.db_user, self.db_pass, pool_size=MAX_CONCURRENT_QUERIES)
+        except (RuntimeError, *async_backend.DRIVER_ERRORS) as err:
+            log.warning("Concurrent lookups disabled, using the thread pool: %s", err)
+            return None
 
-            # For SELECT queries
-            if fetch:
-                results = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
-                return results, columns
+    def run_query(self, query, params=None, fetch=True):
+        """Execute a query and return (results, columns), or True for writes.
 
-            # For INSERT/UPDATE/DELETE queries
-            else:
-                self.connection.commit()
-                return True
+        Raises mysql.connector.Error. Safe to call from worker threads since it
+        never touches Tk. A read that hits a dropped connection is retried once
+        on a fresh one; writes are not, since the commit may have happened.
+        """
+        if alumni_db.current_caller() is None:
+            # Called on the Tk thread rather than through the executor
+            with alumni_db.query_caller(self.current_screen):
+                return self.run_query(query, params, fetch)
+        if fetch:
+            return self.db.fetch(query, params)
+        self.db.execute(query, params)
+        return True
+
+    def run_batch(self, batch):
+        """Commit a WriteBatch in one transaction and invalidate what it touched.
+
+        Raises mysql.connector.Error (after rolling back). Never touches Tk.
+        """
+        return self.db.batch(batch)
 
-        except mysql.connector.Error as err:
-            err_msg = str(err).lower()
-
-            # ✅ Handle permission errors globally
-            if "command denied" in err_msg or "execute command denied" in err_msg:
-                messagebox.showerror(
-                    "Permission Denied",
-                    "❌ You do not have the required privileges to perform this action."
-                )
-                # Explicitly return a safe failure code
-                return "permission_denied"
-
-            # ✅ Other MySQL errors
-            messagebox.showerror("Database Error", f"Error executing query:\n{err}")
-            return None
+    def submit_batch(self, key, batch, success_message, then=None):
+        """Commit a WriteBatch in the background, then report and call then()"""
+        def done(affected, error):
+            if error is not None:
+                self.report_error(error)
+                return
+            messagebox.showinfo("Success", success_message.format(count=affected))
+            if then:
+                then()
 
-        finally:
-            if 'cursor' in locals() and cursor:
-                cursor.close()
+        return self.executor.submit(key, lambda: self.run_batch(batch), done)
+
+    def call_procedure(self, name, args):
+        """Call a stored procedure and return its first result set as (results, columns)."""
+        return self.db.call(name, args)
+
+    def handle_db_error(self, err):
+        """Report a MySQL error to the user"""
+        messagebox.showerror("Database Error", f"Error executing query:\n{err}")
+
+    def submit_query(self, key, query, params=None, on_result=None, work=None, screen=False):
+        """Run a SELECT in the background and pass (results, columns) to on_result.
+
+        key identifies the request (normally the handler name); a new request
+        under the same key supersedes one that is still pending. work overrides
+        the default run_query call, e.g. for stored procedures. screen=True if
+        on_result fills widgets of the current screen (see BackgroundQueryExecutor).
+        """
+        if work is None:
+            work = lambda: self.run_query(query, params)
+
+        def done(res, error):
+            if error is not None:
+                self.report_error(error)
+                return
+            results, columns = res
+            # Remember what is on screen so Export can re-run it
+            self.current_view = (key, query, params) if query else None
+            (on_result or self.show_results)(results, columns)
+
+        return self.executor.submit(key, work, done, screen=screen)
+
+    def fetch_concurrently(self, key, statements, callback, screen=False):
+        """Run independent SELECTs at the same time and pass [(results, columns), ...] to callback.
+
+        statements are repository Statements. With the async backend they are
+        all in flight at once, so the wait is the slowest query rather than the
+        sum; without it they run one after another on a single worker.
+        """
+        if self.async_backend is None:
+            return self.executor.submit(key, lambda: [self.run_query(*st) for st in statements],
+                                        self._concurrent_done(callback), screen=screen)
+        return self.executor.track(key, self.async_backend.gather(statements), self._concurrent_done(callback),
+                                   screen=screen)
+
+    def prefill_pickers(self, key, *pickers):
+        """Load the opening choices of a form's pickers in one concurrent round trip"""
+        def fill(results):
+            for picker, (rows, _) in zip(pickers, results):
+                picker.set_choices(rows)
+
+        return self.fetch_concurrently(key, [picker.first_choices() for picker in pickers], fill, screen=True)
+
+    def _concurrent_done(self, callback):
+        def done(results, error):
+            if error is not None:
+                self.report_error(error)
+                return
+            callback(results)
+        return done
+
+    def submit_report(self, key, statement, on_result=None, ttl=None):
+        """Like submit_query, but served from the result cache when nothing it reads has changed.
+
+        For aggregations and joins that are re-run often; ttl overrides the
+        cache's default expiry for this query.
+        """
+        query, params = statement
+
+        def show(results, columns):
+            self.update_cache_label()
+            (on_result or self.show_results)(results, columns)
+
+        work = lambda: self.result_cache.get(query, params, lambda: self.run_query(query, params), ttl)
+        return self.submit_query(key, query, params, on_result=show, work=work)
+
+    def report_error(self, error):
+        """Show an error raised by background work"""
+        if isinstance(error, (mysql.connector.Error, *async_backend.DRIVER_ERRORS)):
+            return self.handle_db_error(error)
+        messagebox.showerror("Error", f"Unexpected error while querying:\n{error}")
+        return None
+
+    def update_busy_indicator(self, in_flight):
+        """Show how many background queries are still running"""
+        if not hasattr(self, "busy_label"):
+            return
+        if in_flight:
+            self.busy_label.config(text=f"⏳ Running {in_flight} quer{'y' if in_flight == 1 else 'ies'}...")
+            self.root.config(cursor="watch")
+        else:
+            self.busy_label.config(text="")
+            self.root.config(cursor="")
+
+    def shutdown(self):
+        """Stop background work and leave the main loop"""
+        if self.save_pending_checkins is not None:
+            # The executor is about to stop, so check-ins still waiting are saved here
+            self.save_pending_checkins()
+        self.executor.shutdown()
+        if self.async_backend is not None:
+            self.async_backend.close()
+        alumni_db.close_all_pools()
+        self.root.quit()
 
     
-    def get_departments(self):
-        """Get all departments for dropdowns"""
-        query = "SELECT dept_id, name FROM Department"
-        res = self.execute_query(query)
-        if not res:
-            return []
-        results, _ = res
-        return results if results else []
-    
-    def get_alumni_list(self):
-        q = "SELECT alumni_id, name FROM Alumni ORDER BY alumni_id"
-        out = self.execute_query(q)
-        if not out:
-            return []
-        results, _ = out
-        return results
-    
-    def get_student_list(self):
-        q = "SELECT student_id, name FROM Student ORDER BY student_id"
-        out = self.execute_query(q)
-        if not out:
-            return []
-        results, _ = out
-        return results
+    def note_write(self, query):
+        """Invalidate cached data for the tables a committed write touched"""
+        tables = alumni_db.tables_written(query)
+        self.lookup_cache.invalidate(tables)
+        self.picker_cache.invalidate(tables)
+        self.result_cache.invalidate(tables)
+        self.profile_cache.invalidate(tables)
+
+    def cached_lookup(self, name, statement, tables, then):
+        """Pass the rows of a small reference query (a repository Statement) to then(rows).
+
+        A fresh entry in the lookup cache is passed at once. On a miss the
+        query runs on the executor, so Tk is not blocked, and then() is
+        called when it returns, unless the user has left the screen by then.
+        """
+        rows = self.lookup_cache.peek(name)
+        if rows is not None:
+            self.update_cache_label()
+            then(rows)
+            return
+
+        def done(rows, error):
+            if error is not None:
+                self.report_error(error)
+                return
+            self.update_cache_label()
+            then(rows)
+
+        work = lambda: self.lookup_cache.get(name, tables, lambda: self.run_query(*statement)[0])
+        self.executor.submit((self.current_screen, name), work, done, screen=True)
+
+    def update_cache_label(self):
+        if hasattr(self, "cache_label"):
+            lookups = self.lookup_cache.stats()
+            reports = self.result_cache.stats()
+            statements = self.pool.statement_stats.stats()
+            self.cache_label.config(
+                text=f"Lookup cache: {lookups['hits']} hits / {lookups['misses']} misses\n"
+                     f"Report cache: {reports['hits']} hits / {reports['misses']} misses\n"
+                     f"  {reports['entries']} results, {reports['bytes'] / 1024:,.0f} KB, "
+                     f"{reports['evictions']} evicted\n"
+                     f"Prepared statements: {statements['prepared']} parsed, {statements['reused']} reused "
+                     f"({statements['reuse_rate']:.0%} of parses saved)",
+                justify=tk.LEFT)
+
+    def get_departments(self, then):
+        """Pass all departments to then(rows), for dropdowns"""
+        self.cached_lookup("departments", self.sql.departments.choices(), ("Department",), then)
     
-    def get_events_list(self):
-        q = "SELECT event_id, name FROM Event ORDER BY event_id"
-        out = self.execute_query(q)
-        if not out:
-            return []
-        results, _ = out
-        return results
+    def get_events_list(self, then):
+        self.cached_lookup("events", self.sql.events.choices(), ("Event",), then)
     
     def validate_int(self, value, field_name):
         """Validate integer input"""
         try:
-            return int(value)
+            return alumni_db.parse_int(value)
         except ValueError:
             messagebox.showerror("Input Error", f"{field_name} must be a valid number!")
             return None
@@ -182,8 +824,7 @@ class AlumniDBGUI:
     def validate_date(self, datestr, field_name):
         """Validate YYYY-MM-DD date"""
         try:
-            dt = datetime.strptime(datestr, "%Y-%m-%d").date()
-            return dt
+            return alumni_db.parse_date(datestr)
         except ValueError:
             messagebox.showerror("Input Error", f"{field_name} must be in YYYY-MM-DD format!")
             return None
@@ -207,35 +848,6 @@ class AlumniDBGUI:
         # Right side for content
         self.setup_content_area(main_frame)
         
-    def apply_role_restrictions(self):
-        """Restrict actions based on user role."""
-        if self.current_role.lower() == "admin":
-            return  # Admin has full access
-
-        elif self.current_role.lower() == "student":
-            # View-only: disable all insert/update/delete buttons
-            for btn in self.root.winfo_children():
-                try:
-                    if isinstance(btn, tk.Button) and "View" not in btn.cget("text"):
-                        btn.config(state="disabled")
-                except:
-                    pass
-
-            messagebox.showinfo("Access Mode", "Student Mode: View-only access enabled.")
-
-        elif self.current_role.lower() == "alumni":
-            # Alumni: only Mentorship management full access
-            allowed_sections = ["🤝 Mentorship Management", "📚 Education Management", "🎓 Alumni Management"]
-
-            for child in self.root.winfo_children():
-                if isinstance(child, tk.Button):
-                    text = child.cget("text")
-                    # Disable if button text not in allowed list
-                    if not any(keyword in text for keyword in allowed_sections):
-                        child.config(state="disabled")
-
-            messagebox.showinfo("Access Mode", "Alumni Mode: Mentorship full access; other sections read-only.")
-
     def setup_sidebar(self, parent):
         sidebar = ttk.Frame(parent, padding="10", relief='raised', borderwidth=2)
         sidebar.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
@@ -248,11 +860,12 @@ class AlumniDBGUI:
             ("🤝 Mentorship Management", self.show_mentorship_management),
             ("👥 Committee Management", self.show_committee_management),
             ("🎪 Event Management", self.show_event_management),
-            ("📋 Participation Management", self.show_participation_management)
+            ("📋 Participation Management", self.show_participation_management),
+            ("🐞 Query Stats", self.show_query_stats),
         ]
         
         for i, (text, command) in enumerate(nav_buttons):
-            btn = tk.Button(sidebar, text=text, command=command, 
+            btn = tk.Button(sidebar, text=text, command=self.screen_command(command), 
                            font=('Arial', 11), bg='#34495e', fg='white',
                            relief='flat', width=20, height=2)
             btn.grid(row=i, column=0, pady=5, sticky=(tk.W, tk.E))
@@ -260,12 +873,16 @@ class AlumniDBGUI:
             btn.bind("<Leave>", lambda e, b=btn: b.configure(bg='#34495e'))
         
         # Exit button
-        exit_btn = tk.Button(sidebar, text="🚪 Exit", command=self.root.quit,
+        exit_btn = tk.Button(sidebar, text="🚪 Exit", command=self.shutdown,
                             font=('Arial', 11, 'bold'), bg='#e74c3c', fg='white',
                             relief='flat', width=20, height=2)
         exit_btn.grid(row=len(nav_buttons), column=0, pady=20, sticky=(tk.W, tk.E))
         exit_btn.bind("<Enter>", lambda e: exit_btn.configure(bg='#c0392b'))
         exit_btn.bind("<Leave>", lambda e: exit_btn.configure(bg='#e74c3c'))
+
+        self.cache_label = tk.Label(sidebar, text="", fg='gray', font=('Arial', 8))
+        self.cache_label.grid(row=len(nav_buttons) + 1, column=0, sticky=tk.W)
+        self.update_cache_label()
     
     def setup_content_area(self, parent):
         self.content_frame = ttk.Frame(parent, padding="10", relief='sunken', borderwidth=2)
@@ -277,47 +894,385 @@ class AlumniDBGUI:
         self.content_title = tk.Label(self.content_frame, text="Welcome to Alumni Database System", 
                                      font=('Arial', 16, 'bold'), fg='#2c3e50')
         self.content_title.grid(row=0, column=0, pady=(0, 10), sticky=tk.W)
+
+        # In-flight indicator for background queries
+        self.busy_label = tk.Label(self.content_frame, text="", font=('Arial', 10), fg='#e67e22')
+        self.busy_label.grid(row=0, column=0, pady=(0, 10), sticky=tk.E)
         
-        # Text area for results
-        self.result_text = scrolledtext.ScrolledText(self.content_frame, width=80, height=25, font=('Consolas', 10))
-        self.result_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Grid for results
+        self.result_grid = ResultGrid(self.content_frame, self.executor)
+        self.result_grid.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Page navigation for the "View All" screens
+        self.setup_pager_bar()
         
         # Input frame (will be populated based on selection)
         self.input_frame = ttk.Frame(self.content_frame)
-        self.input_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.input_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
         self.input_frame.columnconfigure(1, weight=1)
     
+    def setup_pager_bar(self):
+        self.pager = None
+        self.current_view = None  # (key, query, params) behind the rows on screen
+        self.paged_views = tk.BooleanVar(value=True)
+        self.page_size_var = tk.IntVar(value=DEFAULT_PAGE_SIZE)
+
+        bar = ttk.Frame(self.content_frame)
+        bar.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        self.prev_page_btn = tk.Button(bar, text="◀ Prev", state="disabled", command=lambda: self.load_page("prev"))
+        self.prev_page_btn.pack(side=tk.LEFT)
+        self.page_label = tk.Label(bar, text="", width=12)
+        self.page_label.pack(side=tk.LEFT, padx=5)
+        self.next_page_btn = tk.Button(bar, text="Next ▶", state="disabled", command=lambda: self.load_page("next"))
+        self.next_page_btn.pack(side=tk.LEFT)
+        tk.Button(bar, text="⬇ Export...", command=self.export_view).pack(side=tk.LEFT, padx=(15, 0))
+
+        tk.Checkbutton(bar, text="Paged views", variable=self.paged_views).pack(side=tk.RIGHT)
+        tk.Spinbox(bar, from_=10, to=1000, increment=10, width=6,
+                   textvariable=self.page_size_var).pack(side=tk.RIGHT, padx=5)
+        tk.Label(bar, text="Page size:").pack(side=tk.RIGHT)
+
+    def page_query(self, key, listing):
+        """Show a "View All" query one keyset page at a time, or streamed if paging is off.
+
+        listing is a repository's (select, key_column): the query without ORDER BY
+        and the unique column it is ordered by, which must come first in each row.
+        """
+        select, key_column = listing
+        if not self.paged_views.get():
+            self.stream_query(key, f"{select} ORDER BY {key_column}")
+            return
+        self.start_paging(key, alumni_db.KeysetPager(select, key_column, self.current_page_size()))
+
+    def start_paging(self, key, pager):
+        """Show the first page of a pager (KeysetPager or AlumniSearch) and enable Prev/Next"""
+        self.pager = pager
+        self.pager_key = key
+        self.load_page("first")
+
+    def load_page(self, direction):
+        pager = self.pager
+        if pager is None:
+            return
+        pager.page_size = self.current_page_size()
+        query, params = pager.query(direction)
+
+        def display(results, columns):
+            if pager is not self.pager:
+                return
+            rows = pager.accept(results, direction)
+            self.current_view = (self.pager_key, *pager.full_query())
+            if rows:
+                self.result_grid.load(columns, rows)
+            else:
+                self.result_grid.show_message("No results found.")
+            self.update_pager_bar()
+
+        self.submit_query(self.pager_key, query, params, on_result=display)
+
+    def current_page_size(self):
+        try:
+            return max(1, int(self.page_size_var.get()))
+        except (tk.TclError, ValueError):
+            return DEFAULT_PAGE_SIZE
+
+    def update_pager_bar(self):
+        pager = self.pager
+        self.prev_page_btn.config(state="normal" if pager and pager.has_prev else "disabled")
+        self.next_page_btn.config(state="normal" if pager and pager.has_next else "disabled")
+        self.page_label.config(text=f"Page {pager.page_number}" if pager else "")
+
+    def clear_pager(self):
+        """Leave paging mode when a non-paged result is shown"""
+        if self.pager is not None:
+            self.pager = None
+            self.update_pager_bar()
+
+    def allowed(self, handler):
+        """True if the account holds every privilege the handler was marked with (see requires)"""
+        return all(self.privileges.can(privilege, obj) for privilege, obj in getattr(handler, "requires", ()))
+
+    def screen_command(self, handler):
+        """Button command that runs handler as the current screen; queries sent from Tk count under its name"""
+        def command():
+            self.current_screen = handler.__name__
+            return handler()
+        return command
+
+    def show_actions(self, buttons):
+        """Lay out a screen's (text, handler) buttons, leaving out those the role cannot use"""
+        buttons = [(text, command) for text, command in buttons if self.allowed(command)]
+        for i, (text, command) in enumerate(buttons):
+            btn = tk.Button(self.input_frame, text=text, command=self.screen_command(command),
+                            bg='#3498db', fg='white', font=('Arial', 10))
+            btn.grid(row=i // 4, column=i % 4, padx=10, pady=8, sticky="nsew")
+        for col in range(4):
+            self.input_frame.grid_columnconfigure(col, weight=1, uniform="equal")
+
     def clear_input_frame(self):
         """Clear the input frame"""
         for widget in self.input_frame.winfo_children():
             widget.destroy()
+        self.executor.new_screen()
     
     def show_results(self, results, columns=None):
-        """Display results in the text area"""
-        self.result_text.delete(1.0, tk.END)
-        
+        """Display results in the result grid"""
+        self.clear_pager()
         if not results:
-            self.result_text.insert(tk.END, "No results found.")
+            self.result_grid.show_message("No results found.")
             return
-        
-        # Create a table using PrettyTable
-        table = PrettyTable()
-        if columns:
-            table.field_names = columns
-        else:
-            table.field_names = [f"Column {i+1}" for i in range(len(results[0]))]
-        
-        for row in results:
-            table.add_row(row)
-        
-        self.result_text.insert(tk.END, str(table))
-    
+
+        if not columns:
+            columns = [f"Column {i+1}" for i in range(len(results[0]))]
+        self.result_grid.load(columns, results)
+
+    def show_message(self, text):
+        """Display a one-line message in place of results"""
+        self.clear_pager()
+        self.current_view = None
+        self.result_grid.show_message(text)
+
+    def stream_query(self, key, query, params=None, transform=None):
+        """Run a SELECT in the background and page its rows into the grid as the user scrolls.
+
+        transform is applied to each page as it arrives, see alumni_db.RowStream.
+        """
+        def work():
+            stream = alumni_db.RowStream(self.pool, query, params, transform)
+            try:
+                return stream, stream.fetch(ResultGrid.PAGE_SIZE)
+            except BaseException:
+                stream.close()
+                raise
+
+        def done(res, error):
+            if error is not None:
+                self.report_error(error)
+                return
+            stream, rows = res
+            self.clear_pager()
+            self.current_view = (key, query, params)
+            if not rows:
+                stream.close()
+                self.show_message("No results found.")
+                return
+            # A GroupBlanker's output is only right in query order, so grouped views do not sort
+            self.result_grid.load(stream.columns, rows, stream, sortable=transform is None)
+
+        # A superseded stream still holds a connection, so close it
+        return self.executor.submit(key, work, done, on_discard=lambda res: res[0].close())
+
+    def export_view(self):
+        """Stream every row of the current view (not just the loaded page) to a file"""
+        if self.current_view is None:
+            messagebox.showinfo("Export", "Open a view first, then export it.")
+            return
+        key, query, params = self.current_view
+        path = filedialog.asksaveasfilename(
+            title="Export results", initialfile=f"{key}.csv", defaultextension=".csv",
+            filetypes=[(name, f"*{ext}") for ext, name in result_export.FORMATS.items()])
+        if not path:
+            return
+        try:
+            job = result_export.ResultExport(self.pool, query, params, path)
+        except result_export.ExportError as err:
+            messagebox.showerror("Export Error", str(err))
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Exporting...")
+        dialog.transient(self.root)
+        tk.Label(dialog, text=f"Exporting {key} to {path}").pack(padx=15, pady=(15, 5), anchor=tk.W)
+        bar = ttk.Progressbar(dialog, mode="indeterminate", length=360)
+        bar.pack(padx=15, pady=5)
+        bar.start(15)
+        status = tk.Label(dialog, text="Running query...")
+        status.pack(padx=15, anchor=tk.W)
+        cancel_event = threading.Event()
+        tk.Button(dialog, text="Cancel", command=cancel_event.set).pack(pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", cancel_event.set)
+
+        def show_progress(stats):
+            if dialog.winfo_exists():
+                rate = stats["rows"] / stats["elapsed"] if stats["elapsed"] else 0
+                status.config(text=f"{stats['rows']:,} rows written — {rate:,.0f} rows/s")
+
+        def done(stats, error):
+            if dialog.winfo_exists():
+                dialog.destroy()
+            if error is not None:
+                if isinstance(error, OSError):
+                    messagebox.showerror("Export Error", str(error))
+                else:
+                    self.report_error(error)
+            elif stats["cancelled"]:
+                messagebox.showinfo("Export", "Export cancelled; no file was written.")
+            else:
+                messagebox.showinfo("Export", f"Exported {stats['rows']:,} rows to\n{stats['path']}")
+
+        self.executor.submit(
+            ("export", path),
+            lambda: job.run(progress=lambda stats: self.executor.post(show_progress, stats),
+                            cancelled=cancel_event.is_set),
+            done)
+
+    def show_query_stats(self):
+        """Debug window: latency percentiles per query shape from the query stats ring buffer"""
+        window = tk.Toplevel(self.root)
+        window.title("Query Stats")
+        window.geometry("1000x420")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(1, weight=1)
+
+        bar = ttk.Frame(window, padding=5)
+        bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        summary_label = tk.Label(bar, text="", font=('Arial', 9))
+        summary_label.pack(side=tk.LEFT)
+        threshold = tk.IntVar(value=self.query_stats.slow_ms or 0)
+        tk.Button(bar, text="Clear", command=lambda: (self.query_stats.clear(), refresh())).pack(side=tk.RIGHT)
+        tk.Spinbox(bar, from_=0, to=60000, increment=50, width=7, textvariable=threshold).pack(side=tk.RIGHT, padx=5)
+        tk.Label(bar, text="Log EXPLAIN for queries slower than (ms, 0 = off):").pack(side=tk.RIGHT)
+
+        columns = ("Calls", "p50 ms", "p95 ms", "p99 ms", "Max ms", "Fetch p50 ms", "Avg rows", "Callers", "Query")
+        tree = ttk.Treeview(window, columns=columns, show="headings")
+        for name in columns:
+            tree.heading(name, text=name)
+            tree.column(name, width=70 if name not in ("Callers", "Query") else 200,
+                        stretch=name == "Query", anchor=tk.W)
+        tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar = ttk.Scrollbar(window, orient=tk.VERTICAL, command=tree.yview)
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        tree.configure(yscrollcommand=scrollbar.set)
+
+        def refresh():
+            if not tree.winfo_exists():
+                return
+            try:
+                self.query_stats.slow_ms = max(0, int(threshold.get())) or None
+            except (tk.TclError, ValueError):
+                pass
+            summary = self.query_stats.summary()
+            tree.delete(*tree.get_children())
+            for shape in summary:
+                tree.insert("", tk.END, values=(
+                    shape["calls"], f"{shape['p50']:.1f}", f"{shape['p95']:.1f}", f"{shape['p99']:.1f}",
+                    f"{shape['max']:.1f}", f"{shape['fetch_p50']:.1f}", f"{shape['avg_rows']:.0f}",
+                    ", ".join(shape["callers"]), shape["shape"]))
+            statements = self.pool.statement_stats.stats()
+            summary_label.config(text=f"{sum(s['calls'] for s in summary)} queries in {len(summary)} shapes, "
+                                      f"{self.query_stats.slow_count} slow; prepared statements "
+                                      f"{statements['prepared']} parsed / {statements['reused']} reused, "
+                                      f"{statements['evicted']} evicted")
+
+        def tick():
+            if window.winfo_exists():
+                refresh()
+                window.after(QUERY_STATS_REFRESH_MS, tick)
+
+        tick()
+
     def safe_execute(self, query, params, success_message):
-        """Universal wrapper for write operations with permission safety."""
-        result = self.execute_query(query, params, fetch=False)
-        if not result or result == "permission_denied":
-            return  # stop if no permission or failed query
+        """Run a write and confirm it; returns False after reporting a database error.
+
+        Whether the role may write at all is settled before its form opens (see requires).
+        """
+        try:
+            self.run_query(query, params, fetch=False)
+        except mysql.connector.Error as err:
+            self.handle_db_error(err)
+            return False
         messagebox.showinfo("Success", success_message)
+        return True
+
+
+    @requires(("INSERT", "Alumni"))
+    def import_alumni(self):
+        self.bulk_import_gui("Alumni", self.view_alumni)
+
+    @requires(("INSERT", "Student"))
+    def import_students(self):
+        self.bulk_import_gui("Student", self.view_students)
+
+    @requires(("INSERT", "Education"))
+    def import_education(self):
+        self.bulk_import_gui("Education", self.view_education)
+
+    def bulk_import_gui(self, table, refresh):
+        """Import a CSV or Excel file into table in the background, with progress"""
+        self.clear_input_frame()
+        columns = ", ".join(f"{name}{'*' if required else ''}"
+                            for name, _, required, _ in bulk_import.IMPORT_TABLES[table])
+
+        tk.Label(self.input_frame, text=f"Import {table} from file:").grid(row=0, column=0, sticky=tk.W)
+        path_var = tk.StringVar()
+        tk.Entry(self.input_frame, textvariable=path_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
+
+        def browse():
+            path = filedialog.askopenfilename(
+                title=f"Import {table}",
+                filetypes=[("CSV files", "*.csv"), ("Excel workbooks", "*.xlsx"), ("All files", "*.*")])
+            if path:
+                path_var.set(path)
+
+        tk.Button(self.input_frame, text="Browse...", command=browse).grid(row=0, column=2, padx=5)
+        tk.Label(self.input_frame, text=f"Header row with columns: {columns}  (* required)",
+                 fg='gray', font=('Arial', 8)).grid(row=1, column=0, columnspan=3, sticky=tk.W)
+
+        bar = ttk.Progressbar(self.input_frame, maximum=1.0)
+        bar.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
+        status = tk.Label(self.input_frame, text="", font=('Arial', 9))
+        status.grid(row=3, column=0, columnspan=3, sticky=tk.W)
+
+        cancel_event = threading.Event()
+
+        def show_progress(stats):
+            if not bar.winfo_exists():
+                return
+            rate = (stats["inserted"] + stats["failed"]) / stats["elapsed"] if stats["elapsed"] else 0
+            bar["value"] = stats["fraction"]
+            status.config(text=f"{stats['read']:,} rows read — {stats['inserted']:,} inserted, "
+                               f"{stats['failed']:,} rejected — {rate:,.0f} rows/s")
+
+        def done(stats, error):
+            # Chunks committed before a failure or cancel are in the table either way
+            self.note_write(bulk_import.insert_sql(table))
+            if bar.winfo_exists():
+                start_btn.config(state="normal")
+                cancel_btn.config(state="disabled")
+            if error is not None:
+                if isinstance(error, (bulk_import.ImportFileError, OSError)):
+                    messagebox.showerror("Import Error", str(error))
+                else:
+                    self.report_error(error)
+                return
+            show_progress(stats)
+            summary = (f"{'Import cancelled' if stats['cancelled'] else 'Import finished'}: "
+                       f"{stats['inserted']:,} rows inserted, {stats['failed']:,} rejected.")
+            if stats["error_report"]:
+                summary += f"\n\nRejected rows and reasons were written to:\n{stats['error_report']}"
+            messagebox.showinfo("Bulk Import", summary)
+            refresh()
+
+        def start():
+            path = path_var.get().strip()
+            if not path:
+                messagebox.showerror("Input Error", "Please choose a file to import!")
+                return
+            job = bulk_import.BulkImport(self.pool, table, path)
+            cancel_event.clear()
+            start_btn.config(state="disabled")
+            cancel_btn.config(state="normal")
+            self.executor.submit(
+                f"import:{table}",
+                lambda: job.run(progress=lambda stats: self.executor.post(show_progress, stats),
+                                cancelled=cancel_event.is_set),
+                done)
+
+        start_btn = tk.Button(self.input_frame, text="Start Import", command=start, bg='#27ae60', fg='white')
+        start_btn.grid(row=4, column=0, pady=10, sticky=tk.W)
+        cancel_btn = tk.Button(self.input_frame, text="Cancel", command=cancel_event.set,
+                               state="disabled", bg='#e74c3c', fg='white')
+        cancel_btn.grid(row=4, column=1, pady=10, sticky=tk.W)
 
 
     # -----------------------
@@ -331,26 +1286,24 @@ class AlumniDBGUI:
             ("Add Alumni", self.add_alumni_gui),
             ("View All Alumni", self.view_alumni),
             ("Search Alumni", self.search_alumni_gui),
+            ("Alumni Profile", self.alumni_profile_gui),
             ("Update Company", self.update_company_gui),
             ("Delete Alumni", self.delete_alumni_gui),
             ("Count by Company", self.count_alumni_company),
             ("Filter by Department", self.filter_alumni_dept_gui),
             ("Update Contact Details", self.update_contact_details_gui),
-
+            ("Bulk Import (CSV/Excel)", self.import_alumni),
         ]
-        
-        for i, (text, command) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=text, command=command,
-                          bg='#3498db', fg='white', font=('Arial', 10))
-            btn.grid(row=i//4, column=i%4, padx=10, pady=8, sticky="nsew")
-        for col in range(4):
-            self.input_frame.grid_columnconfigure(col, weight=1, uniform="equal")
+        self.show_actions(buttons)
     
+    @requires(("INSERT", "Alumni"))
     def add_alumni_gui(self):
         self.clear_input_frame()
         
         # Get available departments
-        departments = self.get_departments()
+        self.get_departments(self.add_alumni_form)
+
+    def add_alumni_form(self, departments):
         if not departments:
             messagebox.showerror("Error", "No departments found! Please add departments first.")
             return
@@ -414,10 +1367,8 @@ class AlumniDBGUI:
             phone_val = phone.get() if phone.get() else None
             company_val = company.get() if company.get() else 'Not Provided'
             
-            query = """INSERT INTO Alumni (alumni_id, name, email, phone_number, 
-                     graduation_year, company, dept_id) VALUES (%s, %s, %s, %s, %s, %s, %s)"""
-            params = (alumni_id_val, name.get(), email.get(), phone_val, 
-                     grad_year_val, company_val, dept_id_val)
+            query, params = self.sql.alumni.add(alumni_id_val, name.get(), email.get(), phone_val,
+                                                grad_year_val, company_val, dept_id_val)
             
             self.safe_execute(query, params, "Alumni added successfully!")
             self.view_alumni()
@@ -430,32 +1381,99 @@ class AlumniDBGUI:
         note_label.grid(row=9, column=0, columnspan=2, sticky=tk.W)
     
     def view_alumni(self):
-        query = """SELECT A.alumni_id, A.name, A.email, A.phone_number, 
-                          A.graduation_year, A.company, D.name as department
-                   FROM Alumni A LEFT JOIN Department D ON A.dept_id=D.dept_id
-                   ORDER BY A.alumni_id"""
-        results, columns = self.execute_query(query)
-        self.show_results(results, columns)
+        self.page_query("view_alumni", self.sql.alumni.listing())
     
     def search_alumni_gui(self):
         self.clear_input_frame()
         
-        tk.Label(self.input_frame, text="Search Name:").grid(row=0, column=0, sticky=tk.W)
+        tk.Label(self.input_frame, text="Search:").grid(row=0, column=0, sticky=tk.W)
         search_term = tk.Entry(self.input_frame)
         search_term.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        tk.Label(self.input_frame, text="Matches name, email, company, college and course (word prefixes)",
+                 fg='gray', font=('Arial', 8)).grid(row=1, column=0, columnspan=2, sticky=tk.W)
+        pending = [None]
         
-        def search():
-            if not search_term.get():
-                messagebox.showwarning("Input Error", "Please enter a search term!")
+        def search(event=None):
+            text = search_term.get().strip()
+            if not text:
+                if event is None:
+                    messagebox.showwarning("Input Error", "Please enter a search term!")
                 return
-                
-            query = "SELECT * FROM Alumni WHERE name LIKE %s ORDER BY name"
-            results, columns = self.execute_query(query, (f"%{search_term.get()}%",))
-            self.show_results(results, columns)
-        
+            self.start_paging("search_alumni", alumni_db.AlumniSearch(text, self.current_page_size()))
+
+        def search_soon(event):
+            # Search as the user types, once they pause
+            if event.keysym == "Return":
+                return
+            if pending[0] is not None:
+                search_term.after_cancel(pending[0])
+            pending[0] = search_term.after(EntityPicker.DEBOUNCE_MS, lambda: search(event))
+
+        search_term.bind("<Return>", lambda e: search())
+        search_term.bind("<KeyRelease>", search_soon)
         search_btn = tk.Button(self.input_frame, text="Search", command=search, bg='#3498db', fg='white')
-        search_btn.grid(row=1, column=0, columnspan=2, pady=5)
+        search_btn.grid(row=2, column=0, columnspan=2, pady=5)
     
+    @requires(("EXECUTE", "alumni_profile"))
+    def alumni_profile_gui(self):
+        """Everything about one alumnus, fetched with one call to the alumni_profile procedure"""
+        self.clear_input_frame()
+
+        tk.Label(self.input_frame, text="Select Alumni:* (type name or ID)").grid(row=0, column=0, sticky=tk.W)
+        alumni_var = tk.StringVar()
+        EntityPicker(self.input_frame, self, "alumni", alumni_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
+
+        def show():
+            try:
+                alumni_id_val = int(alumni_var.get().split(' - ')[0])
+            except ValueError:
+                messagebox.showerror("Input Error", "Please select an alumni!")
+                return
+            call = self.sql.alumni.profile(alumni_id_val)
+            # Cached per alumnus until a write touches one of the tables the profile reads
+            work = lambda: self.profile_cache.get(alumni_id_val, self.sql.alumni.PROFILE_TABLES,
+                                                  lambda: self.db.call_all(*call))
+            self.executor.submit("alumni_profile", work, self._concurrent_done(self.show_alumni_profile))
+
+        tk.Button(self.input_frame, text="Show Profile", command=show, bg='#9b59b6', fg='white',
+                  font=('Arial', 10, 'bold')).grid(row=1, column=0, columnspan=2, pady=10)
+
+    def show_alumni_profile(self, result_sets):
+        """Open a window with the result sets of AlumniRepository.profile"""
+        sections = dict(zip(self.sql.alumni.PROFILE_SECTIONS, result_sets))
+        record, columns = sections["Alumni"]
+        if not record:
+            self.show_message("No alumni found with that ID.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title(f"Alumni Profile — {record[0][1]}")
+        window.geometry("760x520")
+        details = ttk.Frame(window, padding=10)
+        details.pack(fill=tk.X)
+        attended = sections["Attendance"][0][0][0] if sections["Attendance"][0] else 0
+        fields = list(zip(columns, record[0])) + [("events_attended", attended)]
+        for i, (name, value) in enumerate(fields):
+            tk.Label(details, text=f"{name.replace('_', ' ').title()}:", font=('Arial', 9, 'bold')).grid(
+                row=i // 2, column=(i % 2) * 2, sticky=tk.W, padx=(0, 5))
+            tk.Label(details, text="NULL" if value is None else value).grid(
+                row=i // 2, column=(i % 2) * 2 + 1, sticky=tk.W, padx=(0, 20))
+
+        tabs = ttk.Notebook(window)
+        tabs.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        for title in ("Education", "Mentorships", "Events"):
+            rows, columns = sections[title]
+            frame = ttk.Frame(tabs)
+            tabs.add(frame, text=f"{title} ({len(rows)})")
+            tree = ttk.Treeview(frame, columns=columns, show="headings")
+            for name in columns:
+                tree.heading(name, text=name)
+                tree.column(name, width=110, anchor=tk.W)
+            for row in rows:
+                tree.insert("", tk.END, values=["NULL" if v is None else v for v in row])
+            tree.pack(fill=tk.BOTH, expand=True)
+
+    @requires(("UPDATE", "Alumni"))
     def update_company_gui(self):
         self.clear_input_frame()
         
@@ -476,13 +1494,14 @@ class AlumniDBGUI:
             if alumni_id_val is None:
                 return
                 
-            query = "UPDATE Alumni SET company=%s WHERE alumni_id=%s"
-            self.safe_execute(query, (company.get(), alumni_id_val),"Company updated successfully!")
+            query, params = self.sql.alumni.update_company(alumni_id_val, company.get())
+            self.safe_execute(query, params, "Company updated successfully!")
             self.view_alumni()
         
         update_btn = tk.Button(self.input_frame, text="Update Company", command=update, bg='#f39c12', fg='white')
         update_btn.grid(row=2, column=0, columnspan=2, pady=5)
     
+    @requires(("DELETE", "Alumni"))
     def delete_alumni_gui(self):
         self.clear_input_frame()
         
@@ -500,22 +1519,21 @@ class AlumniDBGUI:
                 return
                 
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this alumni?\nThis will also delete related education and mentorship records!"):
-                query = "DELETE FROM Alumni WHERE alumni_id=%s"
-                self.safe_execute(query, (alumni_id_val,), "Alumni deleted successfully!")
+                query, params = self.sql.alumni.delete(alumni_id_val)
+                self.safe_execute(query, params, "Alumni deleted successfully!")
                 self.view_alumni()
         
         delete_btn = tk.Button(self.input_frame, text="Delete Alumni", command=delete, bg='#e74c3c', fg='white')
         delete_btn.grid(row=1, column=0, columnspan=2, pady=5)
     
     def count_alumni_company(self):
-        query = "SELECT company, COUNT(*) as count FROM Alumni GROUP BY company ORDER BY count DESC"
-        results, columns = self.execute_query(query)
-        self.show_results(results, columns)
+        self.submit_report("count_alumni_company", self.sql.alumni.count_by_company())
     
     def filter_alumni_dept_gui(self):
         self.clear_input_frame()
-        
-        departments = self.get_departments()
+        self.get_departments(self.filter_alumni_dept_form)
+
+    def filter_alumni_dept_form(self, departments):
         if not departments:
             messagebox.showerror("Error", "No departments found!")
             return
@@ -531,15 +1549,12 @@ class AlumniDBGUI:
                 messagebox.showwarning("Input Error", "Please select a department!")
                 return
                 
-            query = """SELECT A.alumni_id, A.name, A.company, A.graduation_year 
-                       FROM Alumni A JOIN Department D ON A.dept_id=D.dept_id
-                       WHERE D.name=%s ORDER BY A.name"""
-            results, columns = self.execute_query(query, (dept_var.get(),))
-            self.show_results(results, columns)
+            self.submit_query("filter_alumni_dept", *self.sql.alumni.by_department(dept_var.get()))
         
         filter_btn = tk.Button(self.input_frame, text="Filter Alumni", command=filter_dept, bg='#9b59b6', fg='white')
         filter_btn.grid(row=1, column=0, columnspan=2, pady=5)
     
+    @requires(("EXECUTE", "update_alumni_contact"))
     def update_contact_details_gui(self):
         self.clear_input_frame()
         self.content_title.config(text="Update Alumni Contact Details")
@@ -572,8 +1587,7 @@ class AlumniDBGUI:
                 messagebox.showerror("Input Error", "Enter at least one field (email or phone) to update.")
                 return
 
-            query = "CALL update_alumni_contact(%s, %s, %s)"
-            params = (alumni_id_val, new_email if new_email else '', new_phone if new_phone else '')
+            query, params = self.sql.alumni.update_contact(alumni_id_val, new_email, new_phone)
 
             self.safe_execute(query, params, "Contact details updated successfully!")
             self.view_alumni()
@@ -593,19 +1607,19 @@ class AlumniDBGUI:
             ("Add Student", self.add_student_gui),
             ("View All Students", self.view_students),
             ("Update Student", self.update_student_gui),
-            ("Delete Student", self.delete_student_gui)
+            ("Delete Student", self.delete_student_gui),
+            ("Bulk Import (CSV/Excel)", self.import_students),
         ]
-        
-        for i, (text, command) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=text, command=command,
-                          bg='#3498db', fg='white', font=('Arial', 10))
-            btn.grid(row=i//4, column=i%4, padx=10, pady=8, sticky=tk.W+tk.E)
+        self.show_actions(buttons)
     
+    @requires(("INSERT", "Student"))
     def add_student_gui(self):
         self.clear_input_frame()
         
         # Get available departments
-        departments = self.get_departments()
+        self.get_departments(self.add_student_form)
+
+    def add_student_form(self, departments):
         if not departments:
             messagebox.showerror("Error", "No departments found! Please add departments first.")
             return
@@ -652,10 +1666,8 @@ class AlumniDBGUI:
             
             # Set optional field
             phone_val = entries['phone'].get() if entries['phone'].get() else None            
-            query = """INSERT INTO Student (student_id, name, email, phone, batch_year, dept_id) 
-                       VALUES (%s, %s, %s, %s, %s, %s)"""
-            params = (student_id_val, entries['name'].get(), entries['email'].get(), 
-                     phone_val, batch_year_val, dept_id_val)
+            query, params = self.sql.students.add(student_id_val, entries['name'].get(), entries['email'].get(),
+                                                  phone_val, batch_year_val, dept_id_val)
             
             self.safe_execute(query, params,"Student added successfully!")
             self.view_students()
@@ -664,13 +1676,9 @@ class AlumniDBGUI:
         submit_btn.grid(row=len(fields)+1, column=0, columnspan=2, pady=10)
     
     def view_students(self):
-        query = """SELECT S.student_id, S.name, S.email, S.phone, 
-                          S.batch_year, D.name as department
-                   FROM Student S LEFT JOIN Department D ON S.dept_id=D.dept_id
-                   ORDER BY S.student_id"""
-        results, columns = self.execute_query(query)
-        self.show_results(results, columns)
+        self.page_query("view_students", self.sql.students.listing())
     
+    @requires(("UPDATE", "Student"))
     def update_student_gui(self):
         self.clear_input_frame()
         tk.Label(self.input_frame, text="Student ID:*").grid(row=0, column=0, sticky=tk.W)
@@ -708,17 +1716,16 @@ class AlumniDBGUI:
 
             # Determine which field to update
             if new_email:
-                query = "UPDATE Student SET email=%s WHERE student_id=%s"
-                params = (new_email, student_id_val)
+                query, params = self.sql.students.update_email(student_id_val, new_email)
             else:
-                query = "UPDATE Student SET phone=%s WHERE student_id=%s"
-                params = (new_phone, student_id_val)
+                query, params = self.sql.students.update_phone(student_id_val, new_phone)
 
             self.safe_execute(query, params, "Student information updated successfully!")
             self.view_students()
 
         tk.Button(self.input_frame, text="Update Student", command=update, bg='#f39c12', fg='white').grid(row=3, column=0, columnspan=2, pady=10)
     
+    @requires(("DELETE", "Student"))
     def delete_student_gui(self):
         self.clear_input_frame()
         
@@ -736,8 +1743,8 @@ class AlumniDBGUI:
                 return
                 
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this student?"):
-                query = "DELETE FROM Student WHERE student_id=%s"
-                self.safe_execute(query, (student_id_val,), "Student deleted successfully!")
+                query, params = self.sql.students.delete(student_id_val)
+                self.safe_execute(query, params, "Student deleted successfully!")
                 self.view_students()
         
         delete_btn = tk.Button(self.input_frame, text="Delete Student", command=delete,
@@ -757,11 +1764,9 @@ class AlumniDBGUI:
             ("Update Department", self.update_department_gui),
             ("Delete Department", self.delete_department_gui)
         ]
-        
-        for i, (text, command) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=text, command=command, bg='#3498db', fg='white', font=('Arial', 10))
-            btn.grid(row=i//4, column=i%4, padx=10, pady=8, sticky=tk.W+tk.E)
+        self.show_actions(buttons)
     
+    @requires(("INSERT", "Department"))
     def add_department_gui(self):
         self.clear_input_frame()
         
@@ -786,18 +1791,17 @@ class AlumniDBGUI:
             if dept_id_val is None:
                 return
                 
-            query = "INSERT INTO Department VALUES (%s, %s, %s)"
-            self.safe_execute(query, (dept_id_val, name.get(), hod.get()), "Department added successfully!")
+            query, params = self.sql.departments.add(dept_id_val, name.get(), hod.get())
+            self.safe_execute(query, params, "Department added successfully!")
             self.view_departments()
         
         submit_btn = tk.Button(self.input_frame, text="Add Department", command=submit, bg='#27ae60', fg='white')
         submit_btn.grid(row=3, column=0, columnspan=2, pady=10)
     
     def view_departments(self):
-        query = "SELECT * FROM Department ORDER BY dept_id"
-        results, columns = self.execute_query(query)
-        self.show_results(results, columns)
+        self.submit_query("view_departments", *self.sql.departments.list_all())
     
+    @requires(("UPDATE", "Department"))
     def update_department_gui(self):
         self.clear_input_frame()
         
@@ -818,13 +1822,14 @@ class AlumniDBGUI:
             if dept_id_val is None:
                 return
                 
-            query = "UPDATE Department SET hod=%s WHERE dept_id=%s"
-            self.safe_execute(query, (hod.get(), dept_id_val), "Department updated successfully!")
+            query, params = self.sql.departments.update_hod(dept_id_val, hod.get())
+            self.safe_execute(query, params, "Department updated successfully!")
             self.view_departments()
         
         update_btn = tk.Button(self.input_frame, text="Update Department", command=update, bg='#f39c12', fg='white')
         update_btn.grid(row=2, column=0, columnspan=2, pady=5)
     
+    @requires(("DELETE", "Department"))
     def delete_department_gui(self):
         self.clear_input_frame()
         
@@ -842,8 +1847,8 @@ class AlumniDBGUI:
                 return
                 
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this department?\nThis will affect related alumni and students!"):
-                query = "DELETE FROM Department WHERE dept_id=%s"
-                self.safe_execute(query, (dept_id_val,), "Department deleted successfully!")
+                query, params = self.sql.departments.delete(dept_id_val)
+                self.safe_execute(query, params, "Department deleted successfully!")
                 self.view_departments()
         
         delete_btn = tk.Button(self.input_frame, text="Delete Department", command=delete, bg='#e74c3c', fg='white')
@@ -860,28 +1865,22 @@ class AlumniDBGUI:
             ("Add Education", self.add_education_gui),
             ("View Education", self.view_education), 
             ("Delete Education", self.delete_education_gui),
-            ("View Alumni Education", self.view_alumni_education)
+            ("View Alumni Education", self.view_alumni_education),
+            ("Bulk Import (CSV/Excel)", self.import_education),
         ]
-        for i, (text, cmd) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=text, command=cmd, bg='#3498db', fg='white')
-            btn.grid(row=i // 4, column=i % 4, padx=10, pady=8, sticky="nsew")
+        self.show_actions(buttons)
         
+    @requires(("INSERT", "Education"))
     def add_education_gui(self):
         self.clear_input_frame()
-        alumni = self.get_alumni_list()
-        if not alumni:
-            messagebox.showerror("Error", "No alumni found! Please add alumni first.")
-            return
 
         tk.Label(self.input_frame, text="Education ID:* (Unique per Alumni)").grid(row=0, column=0, sticky=tk.W)
         edu_id = tk.Entry(self.input_frame)
         edu_id.grid(row=0, column=1, sticky=(tk.W, tk.E))
 
-        tk.Label(self.input_frame, text="Select Alumni:*").grid(row=1, column=0, sticky=tk.W)
+        tk.Label(self.input_frame, text="Select Alumni:* (type name or ID)").grid(row=1, column=0, sticky=tk.W)
         alumni_var = tk.StringVar()
-        alumni_combo = ttk.Combobox(self.input_frame, textvariable=alumni_var, state="readonly")
-        alumni_combo['values'] = [f"{a[0]} - {a[1]}" for a in alumni]
-        alumni_combo.grid(row=1, column=1, sticky=(tk.W, tk.E))
+        EntityPicker(self.input_frame, self, "alumni", alumni_var).grid(row=1, column=1, sticky=(tk.W, tk.E))
 
         fields = [
             ("College Name:*", "college_name"),
@@ -912,9 +1911,7 @@ class AlumniDBGUI:
                 messagebox.showerror("Input Error", "Select valid Alumni!")
                 return
 
-            query = """INSERT INTO Education (edu_id, alumni_id, college_name, degree, course, start_year, end_year)
-                       VALUES (%s, %s, %s, %s, %s, %s, %s)"""
-            params = (
+            query, params = self.sql.education.add(
                 edu_val,
                 alumni_id_val,
                 entries['college_name'].get(),
@@ -931,85 +1928,24 @@ class AlumniDBGUI:
 
     def view_education(self):
         """Simple education view (hides repeated alumni names)"""
-        q = """
-        SELECT 
-            A.name AS Alumni_Name, 
-            E.edu_id, 
-            E.college_name, 
-            E.degree, 
-            E.course,
-            E.start_year, 
-            E.end_year
-        FROM Education E
-        JOIN Alumni A ON E.alumni_id = A.alumni_id
-        ORDER BY A.name, E.edu_id;
-        """
-        
-        res = self.execute_query(q)
-        if res:
-            results, columns = res
-            # Hide repeated alumni names during display
-            processed = []
-            last_name = None
-            for row in results:
-                name = row[0]
-                if name == last_name:
-                    name = ''  # make duplicate names blank 
-                else:
-                    last_name = name
-                processed.append((name, *row[1:]))
-            results = processed
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No education records found.")
+        # Rows are grouped page by page as they stream in; the id and name show once per alumnus
+        self.stream_query("view_education", *self.sql.education.list_all(), transform=alumni_db.GroupBlanker(1, 2))
 
     def view_alumni_education(self):
         """View alumni with department, company, and education details (grouped neatly)"""
-        query = """
-        SELECT
-            A.name AS Alumni_Name,
-            A.company AS Company,
-            E.end_year AS Graduation_Year,  
-            E.college_name AS College_Name,
-            E.degree AS Degree,
-            E.course AS Course
-        FROM Alumni A
-        INNER JOIN Education E ON A.alumni_id = E.alumni_id
-        LEFT JOIN Department D ON A.dept_id = D.dept_id
-        ORDER BY A.name, E.edu_id;
-        """
-        res = self.execute_query(query)
-        if res:
-            results, columns = res
-            # Hide duplicate alumni name and company for viewing
-            processed = []
-            last_name = None
-            for row in results:
-                name, company = row[0], row[1]
-                if name == last_name:
-                    name, company = '', ''  # make repeated entries as blank
-                else:
-                    last_name = row[0]
-                processed.append((name, company, *row[2:]))
-            results = processed
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No records found.")
+        # Streamed like view_education, so the result is never held in memory whole;
+        # the alumni id, name and company show once per alumnus
+        self.stream_query("view_alumni_education", *self.sql.education.list_with_alumni(),
+                          transform=alumni_db.GroupBlanker(1, 3))
 
+    @requires(("DELETE", "Education"))
     def delete_education_gui(self):
         """Delete a specific education record by both Alumni and Education ID"""
         self.clear_input_frame()
 
-        tk.Label(self.input_frame, text="Select Alumni:*").grid(row=0, column=0, sticky=tk.W)
-        alumni = self.get_alumni_list()
-        if not alumni:
-            messagebox.showerror("Error", "No alumni found! Please add alumni first.")
-            return
-
+        tk.Label(self.input_frame, text="Select Alumni:* (type name or ID)").grid(row=0, column=0, sticky=tk.W)
         alumni_var = tk.StringVar()
-        alumni_combo = ttk.Combobox(self.input_frame, textvariable=alumni_var, state="readonly")
-        alumni_combo['values'] = [f"{a[0]} - {a[1]}" for a in alumni]
-        alumni_combo.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        EntityPicker(self.input_frame, self, "alumni", alumni_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
 
         tk.Label(self.input_frame, text="Education ID:*").grid(row=1, column=0, sticky=tk.W)
         edu_id_entry = tk.Entry(self.input_frame)
@@ -1031,8 +1967,8 @@ class AlumniDBGUI:
                 return
 
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this education record?"):
-                query = "DELETE FROM Education WHERE edu_id=%s AND alumni_id=%s"
-                self.safe_execute(query, (edu_id_val, alumni_id_val), "Education record deleted successfully!")
+                query, params = self.sql.education.delete(edu_id_val, alumni_id_val)
+                self.safe_execute(query, params, "Education record deleted successfully!")
                 self.view_education()
 
         # Delete button
@@ -1048,37 +1984,31 @@ class AlumniDBGUI:
         buttons = [
             ("Start Mentorship", self.add_mentorship_gui),
             ("View Mentorships", self.view_mentorships),
+            ("View by Alumni", self.view_mentorships_by_alumni),
             ("View Duration (in Days)", self.show_mentorship_duration),
+            ("Longest Mentorships", self.longest_mentorships_gui),
+            ("Average Duration", self.average_mentorship_duration_gui),
             ("End Mentorship (set end date)", self.end_mentorship_gui),
             ("Delete Mentorship", self.delete_mentorship_gui),
             ("List Students by Alumni", self.list_mentorships_by_alumni_gui) 
 
         ]
-        for i, (t, cmd) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=t, command=cmd, bg='#3498db', fg='white')
-            btn.grid(row=i // 4, column=i % 4, padx=10, pady=8, sticky="nsew")
-        for col in range(4):
-            self.input_frame.grid_columnconfigure(col, weight=1, uniform="equal")
+        self.show_actions(buttons)
     
+    @requires(("INSERT", "Mentorship"))
     def add_mentorship_gui(self):
         self.clear_input_frame()
-        alumni_list = self.get_alumni_list()
-        student_list = self.get_student_list()
-        if not alumni_list or not student_list:
-            messagebox.showerror("Error", "Need both alumni and students to create mentorships.")
-            return
         tk.Label(self.input_frame, text="Mentorship ID:*").grid(row=0, column=0, sticky=tk.W)
         mid = tk.Entry(self.input_frame); mid.grid(row=0, column=1, sticky=(tk.W, tk.E))
-        tk.Label(self.input_frame, text="Alumni:*").grid(row=1, column=0, sticky=tk.W)
+        tk.Label(self.input_frame, text="Alumni:* (type name or ID)").grid(row=1, column=0, sticky=tk.W)
         alumni_var = tk.StringVar()
-        alumni_combo = ttk.Combobox(self.input_frame, textvariable=alumni_var, state="readonly")
-        alumni_combo['values'] = [f"{a[0]} - {a[1]}" for a in alumni_list]
-        alumni_combo.grid(row=1, column=1, sticky=(tk.W, tk.E))
-        tk.Label(self.input_frame, text="Student:*").grid(row=2, column=0, sticky=tk.W)
+        alumni_picker = EntityPicker(self.input_frame, self, "alumni", alumni_var)
+        alumni_picker.grid(row=1, column=1, sticky=(tk.W, tk.E))
+        tk.Label(self.input_frame, text="Student:* (type name or ID)").grid(row=2, column=0, sticky=tk.W)
         student_var = tk.StringVar()
-        student_combo = ttk.Combobox(self.input_frame, textvariable=student_var, state="readonly")
-        student_combo['values'] = [f"{s[0]} - {s[1]}" for s in student_list]
-        student_combo.grid(row=2, column=1, sticky=(tk.W, tk.E))
+        student_picker = EntityPicker(self.input_frame, self, "student", student_var)
+        student_picker.grid(row=2, column=1, sticky=(tk.W, tk.E))
+        self.prefill_pickers("add_mentorship_gui", alumni_picker, student_picker)
         tk.Label(self.input_frame, text="Start Date (YYYY-MM-DD):*").grid(row=3, column=0, sticky=tk.W)
         start = tk.Entry(self.input_frame); start.grid(row=3, column=1, sticky=(tk.W, tk.E))
         tk.Label(self.input_frame, text="End Date (optional YYYY-MM-DD):").grid(row=4, column=0, sticky=tk.W)
@@ -1105,26 +2035,16 @@ class AlumniDBGUI:
                 if ed is None:
                     return
                 end_date = ed.isoformat()
-            q = """INSERT INTO Mentorship (mid, alumni_id, student_id, start_date, end_date)
-                   VALUES (%s, %s, %s, %s, %s)"""
-            params = (mid_val, alumni_id_val, student_id_val, start_date.isoformat(), end_date)
+            q, params = self.sql.mentorships.add(mid_val, alumni_id_val, student_id_val,
+                                                 start_date.isoformat(), end_date)
             self.safe_execute(q, params, "Mentorship started!")
             self.view_mentorships()
         tk.Button(self.input_frame, text="Start Mentorship", command=submit, bg='#27ae60', fg='white').grid(row=5, column=0, columnspan=2, pady=6)
     
     def view_mentorships(self):
-        q = """SELECT M.mid, A.name as alumni_name, S.name as student_name, M.start_date, M.end_date
-               FROM Mentorship M
-               JOIN Alumni A ON M.alumni_id=A.alumni_id
-               JOIN Student S ON M.student_id=S.student_id
-               ORDER BY M.mid"""
-        res = self.execute_query(q)
-        if res:
-            results, columns = res
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No mentorships found.")
+        self.page_query("view_mentorships", self.sql.mentorships.listing())
     
+    @requires(("UPDATE", "Mentorship"))
     def end_mentorship_gui(self):
         self.clear_input_frame()
         tk.Label(self.input_frame, text="Mentorship ID:*").grid(row=0, column=0, sticky=tk.W)
@@ -1148,14 +2068,9 @@ class AlumniDBGUI:
             if ed is None:
                 return
 
-            q = "UPDATE Mentorship SET end_date=%s WHERE mid=%s"
-            result = self.execute_query(q, (ed.isoformat(), mid_val), fetch=False)
-
-            if not result or result == "permission_denied":
-                return
-
-            messagebox.showinfo("Success", "Mentorship end date updated successfully!")
-            self.view_mentorships()
+            q, params = self.sql.mentorships.end(mid_val, ed.isoformat())
+            if self.safe_execute(q, params, "Mentorship end date updated successfully!"):
+                self.view_mentorships()
 
         tk.Button(
             self.input_frame,
@@ -1166,6 +2081,7 @@ class AlumniDBGUI:
         ).grid(row=2, column=0, columnspan=2, pady=6)
 
     
+    @requires(("DELETE", "Mentorship"))
     def delete_mentorship_gui(self):
         self.clear_input_frame()
         tk.Label(self.input_frame, text="Mentorship ID:*").grid(row=0, column=0, sticky=tk.W)
@@ -1178,45 +2094,71 @@ class AlumniDBGUI:
             if mid_val is None:
                 return
             if messagebox.askyesno("Confirm Delete", "Delete this mentorship?"):
-                self.safe_execute("DELETE FROM Mentorship WHERE mid=%s", (mid_val,), "Mentorship deleted.")
+                self.safe_execute(*self.sql.mentorships.delete(mid_val), "Mentorship deleted.")
                 self.view_mentorships()
         tk.Button(self.input_frame, text="Delete Mentorship", command=delete, bg='#e74c3c', fg='white').grid(row=1, column=0, columnspan=2, pady=6)
     
+    def view_mentorships_by_alumni(self):
+        """Every mentorship grouped under its alumnus, streamed in as the user scrolls"""
+        self.stream_query("view_mentorships_by_alumni", *self.sql.mentorships.list_by_alumni(),
+                          transform=alumni_db.GroupBlanker(1, 2))
+
     def show_mentorship_duration(self):
-        """Display mentorship durations in days using the SQL function"""
-        q = """SELECT M.mid,
-                    A.name AS Alumni,
-                    S.name AS Student,
-                    M.start_date,
-                    M.end_date,
-                    mentorship_duration(M.start_date, M.end_date) AS DurationDays
-            FROM Mentorship M
-            JOIN Alumni A ON M.alumni_id = A.alumni_id
-            JOIN Student S ON M.student_id = S.student_id
-            ORDER BY M.mid"""
-        res = self.execute_query(q)
-        if res == "permission_denied":
-            return 
-        if res:
-            results, columns = res
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No mentorship duration records found.")
+        """Display mentorship durations in days from the generated duration_days column"""
+        self.submit_report("show_mentorship_duration", self.sql.mentorships.durations())
+
+    def longest_mentorships_gui(self):
+        """Longest completed or ongoing mentorships, optionally at least N days long"""
+        self.clear_input_frame()
+
+        tk.Label(self.input_frame, text="Mentorships:").grid(row=0, column=0, sticky=tk.W)
+        kind_var = tk.StringVar(value="Completed")
+        ttk.Combobox(self.input_frame, textvariable=kind_var, values=["Completed", "Ongoing"],
+                     state="readonly").grid(row=0, column=1, sticky=(tk.W, tk.E))
+        tk.Label(self.input_frame, text="At least (days):").grid(row=1, column=0, sticky=tk.W)
+        min_days = tk.Entry(self.input_frame); min_days.grid(row=1, column=1, sticky=(tk.W, tk.E))
+        min_days.insert(0, "0")
 
+        def show():
+            try:
+                days = alumni_db.parse_int(min_days.get() or "0")
+            except ValueError:
+                messagebox.showerror("Input Error", "Days must be a number.")
+                return
+            statement = self.sql.mentorships.longest(self.current_page_size(), kind_var.get() == "Ongoing", days)
+            self.submit_report("longest_mentorships", statement)
+
+        tk.Button(self.input_frame, text="Show Longest", command=show, bg='#9b59b6', fg='white',
+                  font=('Arial', 10, 'bold')).grid(row=2, column=0, columnspan=2, pady=10)
+
+    def average_mentorship_duration_gui(self):
+        """Average mentorship duration per alumnus or per department"""
+        self.clear_input_frame()
+
+        tk.Label(self.input_frame, text="Group by:").grid(row=0, column=0, sticky=tk.W)
+        group_var = tk.StringVar(value="Alumni")
+        ttk.Combobox(self.input_frame, textvariable=group_var, values=["Alumni", "Department"],
+                     state="readonly").grid(row=0, column=1, sticky=(tk.W, tk.E))
+
+        def show():
+            if group_var.get() == "Department":
+                self.submit_report("average_duration_by_department", self.sql.mentorships.average_by_department())
+            else:
+                self.submit_report("average_duration_by_alumni",
+                                   self.sql.mentorships.average_by_alumni(self.current_page_size()))
+
+        tk.Button(self.input_frame, text="Show Averages", command=show, bg='#9b59b6', fg='white',
+                  font=('Arial', 10, 'bold')).grid(row=1, column=0, columnspan=2, pady=10)
+
+    @requires(("EXECUTE", "list_mentorships_by_alumni"))
     def list_mentorships_by_alumni_gui(self):
         """Call stored procedure list_mentorships_by_alumni(alumniId) via dropdown"""
         self.clear_input_frame()
-        alumni_list = self.get_alumni_list()
-        if not alumni_list:
-            messagebox.showerror("Error", "No alumni found in the database.")
-            return
 
-        # Dropdown is used to choose alumni
-        tk.Label(self.input_frame, text="Select Alumni:*").grid(row=0, column=0, sticky=tk.W)
+        # Type-ahead picker is used to choose alumni
+        tk.Label(self.input_frame, text="Select Alumni:* (type name or ID)").grid(row=0, column=0, sticky=tk.W)
         alumni_var = tk.StringVar()
-        alumni_combo = ttk.Combobox(self.input_frame, textvariable=alumni_var, state="readonly")
-        alumni_combo['values'] = [f"{a[0]} - {a[1]}" for a in alumni_list]
-        alumni_combo.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        EntityPicker(self.input_frame, self, "alumni", alumni_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
 
         def show_mentorships():
             if not alumni_var.get():
@@ -1229,26 +2171,16 @@ class AlumniDBGUI:
                 messagebox.showerror("Input Error", "Invalid alumni selection.")
                 return
 
-            # Use stored procedure --------------------------------------------------------------------------------------------------------------------------------
-            try:
-                cursor = self.connection.cursor()
-                cursor.callproc("list_mentorships_by_alumni", (alumni_id_val,))
-                results = []
-                columns = []
-                for result in cursor.stored_results():
-                    results = result.fetchall()
-                    columns = [desc[0] for desc in result.description]
-                    break 
-                cursor.close()
-
+            def display(results, columns):
                 if not results:
-                    self.result_text.delete(1.0, tk.END)
-                    self.result_text.insert(tk.END, "No mentorships found for this alumni.")
+                    self.show_message("No mentorships found for this alumni.")
                 else:
                     self.show_results(results, columns)
 
-            except mysql.connector.Error as err:
-                messagebox.showerror("Database Error", f"Error executing query: {err}")
+            # Use stored procedure --------------------------------------------------------------------------------------------------------------------------------
+            call = self.sql.mentorships.by_alumni(alumni_id_val)
+            self.submit_query("list_mentorships_by_alumni", None, on_result=display,
+                              work=lambda: self.call_procedure(*call))
 
         tk.Button(self.input_frame, text="Show Mentorships", command=show_mentorships, bg='#9b59b6', fg='white', font=('Arial', 10, 'bold')).grid(row=1,
                                                                                                                              column=0, columnspan=2, pady=10)
@@ -1265,15 +2197,14 @@ class AlumniDBGUI:
             ("Update Committee", self.update_committee_gui),
             ("Delete Committee", self.delete_committee_gui)
         ]
-        for i, (t, cmd) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=t, command=cmd, bg='#3498db', fg='white')
-            btn.grid(row=i // 4, column=i % 4, padx=10, pady=8, sticky="nsew")
-        for col in range(2):
-            self.input_frame.grid_columnconfigure(col, weight=1, uniform="equal")
+        self.show_actions(buttons)
     
+    @requires(("INSERT", "Committee"))
     def add_committee_gui(self):
         self.clear_input_frame()
-        events = self.get_events_list()
+        self.get_events_list(self.add_committee_form)
+
+    def add_committee_form(self, events):
         if not events:
             messagebox.showerror("Error", "No events found! Please add events first.")
             return
@@ -1311,9 +2242,8 @@ class AlumniDBGUI:
                 messagebox.showerror("Input Error", "Select a valid event!")
                 return
 
-            query = """INSERT INTO Committee (cid, event_id, name, phone, head)
-                    VALUES (%s, %s, %s, %s, %s)"""
-            params = (cid_val, event_id_val, name.get(), phone.get() if phone.get() else None, head.get())
+            query, params = self.sql.committees.add(cid_val, event_id_val, name.get(),
+                                                    phone.get() if phone.get() else None, head.get())
 
             self.safe_execute(query, params, "Committee added successfully!")
             self.view_committees()
@@ -1321,17 +2251,9 @@ class AlumniDBGUI:
         tk.Button(self.input_frame, text="Add Committee", command=submit, bg='#27ae60', fg='white').grid(row=5, column=0, columnspan=2, pady=6)
 
     def view_committees(self):
-        q = """SELECT C.cid, C.name, C.phone, C.head, E.name AS event_name
-            FROM Committee C
-            JOIN Event E ON C.event_id = E.event_id
-            ORDER BY E.event_id, C.cid"""
-        res = self.execute_query(q)
-        if res:
-            results, columns = res
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No committees found.")
+        self.stream_query("view_committees", *self.sql.committees.list_all())
 
+    @requires(("UPDATE", "Committee"))
     def update_committee_gui(self):
         self.clear_input_frame()
         self.content_title.config(text="👥 Update Committee Details")
@@ -1357,26 +2279,19 @@ class AlumniDBGUI:
             if cid_val is None:
                 return
             
-            # Collect only non-empty fields to update
-            fields, params = [], []
-            if head.get():
-                fields.append("head=%s")
-                params.append(head.get())
-            if phone.get():
-                fields.append("phone=%s")
-                params.append(phone.get())
-            if not fields:
+            # Only non-empty fields are updated
+            if not (head.get() or phone.get()):
                 messagebox.showwarning("No Update", "Please enter at least one field to update!")
                 return
-            query = f"UPDATE Committee SET {', '.join(fields)} WHERE cid=%s"
-            params.append(cid_val)
+            query, params = self.sql.committees.update(cid_val, head=head.get() or None, phone=phone.get() or None)
             
-            self.safe_execute(query, tuple(params), "Committee details updated successfully!")
+            self.safe_execute(query, params, "Committee details updated successfully!")
             self.view_committees()
         
         update_btn = tk.Button(self.input_frame, text="Update Committee", command=update, bg='#f39c12', fg='white', font=('Arial', 10, 'bold'))
         update_btn.grid(row=3, column=0, columnspan=2, pady=10)
 
+    @requires(("DELETE", "Committee"))
     def delete_committee_gui(self):
         self.clear_input_frame()
         tk.Label(self.input_frame, text="Committee ID:*").grid(row=0, column=0, sticky=tk.W)
@@ -1389,7 +2304,7 @@ class AlumniDBGUI:
             if cid_val is None:
                 return
             if messagebox.askyesno("Confirm Delete", "Delete this committee?"):
-                self.safe_execute("DELETE FROM Committee WHERE cid=%s", (cid_val,), "Committee deleted!")
+                self.safe_execute(*self.sql.committees.delete(cid_val), "Committee deleted!")
                 self.view_committees()
         tk.Button(self.input_frame, text="Delete Committee", command=delete, bg='#e74c3c', fg='white').grid(row=1, column=0, columnspan=2, pady=6)
     
@@ -1405,12 +2320,9 @@ class AlumniDBGUI:
             ("Update Event", self.update_event_gui),
             ("Delete Event", self.delete_event_gui)
         ]
-        for i, (t, cmd) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=t, command=cmd, bg='#3498db', fg='white')
-            btn.grid(row=i // 4, column=i % 4, padx=10, pady=8, sticky="nsew")
-        for col in range(2):
-            self.input_frame.grid_columnconfigure(col, weight=1, uniform="equal")
+        self.show_actions(buttons)
     
+    @requires(("INSERT", "Event"))
     def add_event_gui(self):
         self.clear_input_frame()
         tk.Label(self.input_frame, text="Event ID:*").grid(row=0, column=0, sticky=tk.W)
@@ -1433,19 +2345,15 @@ class AlumniDBGUI:
             d = self.validate_date(date_ent.get(), "Event Date")
             if d is None:
                 return
-            self.safe_execute("INSERT INTO Event (event_id, name, description, location, date) VALUES (%s,%s,%s,%s,%s)",
-                                  (eid_val, name.get(), desc.get() if desc.get() else None, loc.get(), d.isoformat()), "Event added!")
+            self.safe_execute(*self.sql.events.add(eid_val, name.get(), desc.get() if desc.get() else None,
+                                                   loc.get(), d.isoformat()), "Event added!")
             self.view_events()
         tk.Button(self.input_frame, text="Add Event", command=submit, bg='#27ae60', fg='white').grid(row=5, column=0, columnspan=2, pady=6)
     
     def view_events(self):
-        res = self.execute_query("SELECT event_id, name, description, location, date FROM Event ORDER BY event_id")
-        if res:
-            results, columns = res
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No events found.")
+        self.page_query("view_events", self.sql.events.listing())
     
+    @requires(("UPDATE", "Event"))
     def update_event_gui(self):
         self.clear_input_frame()
         self.content_title.config(text="🎪 Update Event Details")
@@ -1474,32 +2382,22 @@ class AlumniDBGUI:
             event_id_val = self.validate_int(event_id.get(), "Event ID")
             if event_id_val is None:
                 return
-            # Collect only non-empty fields for update
-            fields, params = [], []
-            if description.get():
-                fields.append("description=%s")
-                params.append(description.get())
-            if location.get():
-                fields.append("location=%s")
-                params.append(location.get())
-            if date.get():
-                fields.append("date=%s")
-                params.append(date.get())
-            
-            if not fields:
+            # Only non-empty fields are updated
+            if not (description.get() or location.get() or date.get()):
                 messagebox.showwarning("No Update", "Please enter at least one field to update!")
                 return
             
-            query = f"UPDATE Event SET {', '.join(fields)} WHERE event_id=%s"
-            params.append(event_id_val)
+            query, params = self.sql.events.update(event_id_val, description=description.get() or None,
+                                                   location=location.get() or None, date=date.get() or None)
             
-            self.safe_execute(query, tuple(params), "Event details updated successfully!")
+            self.safe_execute(query, params, "Event details updated successfully!")
             self.view_events()  # Refresh list
         
         update_btn = tk.Button(self.input_frame, text="Update Event", command=update,
                             bg='#f39c12', fg='white', font=('Arial', 10, 'bold'))
         update_btn.grid(row=4, column=0, columnspan=2, pady=10)
 
+    @requires(("DELETE", "Event"))
     def delete_event_gui(self):
         self.clear_input_frame()
         tk.Label(self.input_frame, text="Event ID:*").grid(row=0, column=0, sticky=tk.W)
@@ -1512,7 +2410,7 @@ class AlumniDBGUI:
             if eid_val is None:
                 return
             if messagebox.askyesno("Confirm Delete", "Delete this event?"):
-                self.safe_execute("DELETE FROM Event WHERE event_id=%s", (eid_val,), "Event deleted!")
+                self.safe_execute(*self.sql.events.delete(eid_val), "Event deleted!")
                 self.view_events()
         tk.Button(self.input_frame, text="Delete Event", command=delete, bg='#e74c3c', fg='white').grid(row=1, column=0, columnspan=2, pady=6)
     
@@ -1530,41 +2428,32 @@ class AlumniDBGUI:
             ("View Alumni Participation", self.view_participation_alumni),
             ("Count Event Participants", self.count_event_participants),
             ("Total Events Attended by Alumni", self.show_total_events_attended_gui),
+            ("Attendance Leaderboard", self.show_attendance_leaderboard),
             ("View Alumni by Event", self.view_alumni_by_event_gui),
             ("Delete Participant", self.delete_participant),
-            ("Update RSVP Status", self.update_participation_status_gui)
+            ("Update RSVP Status", self.update_participation_status_gui),
+            ("Event Check-in", self.event_checkin_gui),
         ]
+        self.show_actions(buttons)
 
-        for i, (t, cmd) in enumerate(buttons):
-            btn = tk.Button(self.input_frame, text=t, command=cmd,
-                            bg='#3498db', fg='white', font=('Arial', 10))
-            btn.grid(row=i // 4, column=i % 4, padx=10, pady=8, sticky="nsew")
-        for col in range(4):
-            self.input_frame.grid_columnconfigure(col, weight=1, uniform="equal")
-
+    @requires(("INSERT", "EventParticipationStudent"))
     def add_participation_student_gui(self):
         self.clear_input_frame()
-        events = self.get_events_list()
-        students = self.get_student_list()
-        if not events or not students:
-            messagebox.showerror("Error", "Need events and students to register participation.")
-            return
         tk.Label(self.input_frame, text="Participation ID:*").grid(row=0, column=0, sticky=tk.W)
         pid = tk.Entry(self.input_frame); pid.grid(row=0, column=1, sticky=(tk.W, tk.E))
-        tk.Label(self.input_frame, text="Event:*").grid(row=1, column=0, sticky=tk.W)
+        tk.Label(self.input_frame, text="Event:* (type name or ID)").grid(row=1, column=0, sticky=tk.W)
         event_var = tk.StringVar()
-        event_combo = ttk.Combobox(self.input_frame, textvariable=event_var, state="readonly")
-        event_combo['values'] = [f"{e[0]} - {e[1]}" for e in events]
-        event_combo.grid(row=1, column=1, sticky=(tk.W, tk.E))
-        tk.Label(self.input_frame, text="Student:*").grid(row=2, column=0, sticky=tk.W)
+        event_picker = EntityPicker(self.input_frame, self, "event", event_var)
+        event_picker.grid(row=1, column=1, sticky=(tk.W, tk.E))
+        tk.Label(self.input_frame, text="Student:* (type name or ID)").grid(row=2, column=0, sticky=tk.W)
         student_var = tk.StringVar()
-        st_combo = ttk.Combobox(self.input_frame, textvariable=student_var, state="readonly")
-        st_combo['values'] = [f"{s[0]} - {s[1]}" for s in students]
-        st_combo.grid(row=2, column=1, sticky=(tk.W, tk.E))
+        student_picker = EntityPicker(self.input_frame, self, "student", student_var)
+        student_picker.grid(row=2, column=1, sticky=(tk.W, tk.E))
+        self.prefill_pickers("add_participation_student_gui", event_picker, student_picker)
         tk.Label(self.input_frame, text="Response Status:").grid(row=3, column=0, sticky=tk.W)
         resp_var = tk.StringVar(value="Registered")
         resp_combo = ttk.Combobox(self.input_frame, textvariable=resp_var, state="readonly")
-        resp_combo['values'] = ['Registered', 'Attended', 'Cancelled']
+        resp_combo['values'] = alumni_service.RSVP_STATUSES
         resp_combo.grid(row=3, column=1, sticky=(tk.W, tk.E))
         def submit():
             if not all([pid.get(), event_var.get(), student_var.get()]):
@@ -1579,34 +2468,29 @@ class AlumniDBGUI:
             except Exception:
                 messagebox.showerror("Input Error", "Select valid event and student!")
                 return
-            q = "INSERT INTO EventParticipationStudent (pid, event_id, student_id, resp_status) VALUES (%s,%s,%s,%s)"
-            self.safe_execute(q, (pid_val, event_id_val, student_id_val, resp_var.get()), "Student participation registered!")
+            q, params = self.sql.participation.register("Student", pid_val, event_id_val, student_id_val, resp_var.get())
+            self.safe_execute(q, params, "Student participation registered!")
             self.view_participation_students()
         tk.Button(self.input_frame, text="Register Student", command=submit, bg='#27ae60', fg='white').grid(row=4, column=0, columnspan=2, pady=6)
     
+    @requires(("INSERT", "EventParticipationAlumni"))
     def add_participation_alumni_gui(self):
         self.clear_input_frame()
-        events = self.get_events_list()
-        alumni = self.get_alumni_list()
-        if not events or not alumni:
-            messagebox.showerror("Error", "Need events and alumni to register participation.")
-            return
         tk.Label(self.input_frame, text="Participation ID:*").grid(row=0, column=0, sticky=tk.W)
         pid = tk.Entry(self.input_frame); pid.grid(row=0, column=1, sticky=(tk.W, tk.E))
-        tk.Label(self.input_frame, text="Event:*").grid(row=1, column=0, sticky=tk.W)
+        tk.Label(self.input_frame, text="Event:* (type name or ID)").grid(row=1, column=0, sticky=tk.W)
         event_var = tk.StringVar()
-        event_combo = ttk.Combobox(self.input_frame, textvariable=event_var, state="readonly")
-        event_combo['values'] = [f"{e[0]} - {e[1]}" for e in events]
-        event_combo.grid(row=1, column=1, sticky=(tk.W, tk.E))
-        tk.Label(self.input_frame, text="Alumni:*").grid(row=2, column=0, sticky=tk.W)
+        event_picker = EntityPicker(self.input_frame, self, "event", event_var)
+        event_picker.grid(row=1, column=1, sticky=(tk.W, tk.E))
+        tk.Label(self.input_frame, text="Alumni:* (type name or ID)").grid(row=2, column=0, sticky=tk.W)
         alumni_var = tk.StringVar()
-        al_combo = ttk.Combobox(self.input_frame, textvariable=alumni_var, state="readonly")
-        al_combo['values'] = [f"{a[0]} - {a[1]}" for a in alumni]
-        al_combo.grid(row=2, column=1, sticky=(tk.W, tk.E))
+        alumni_picker = EntityPicker(self.input_frame, self, "alumni", alumni_var)
+        alumni_picker.grid(row=2, column=1, sticky=(tk.W, tk.E))
+        self.prefill_pickers("add_participation_alumni_gui", event_picker, alumni_picker)
         tk.Label(self.input_frame, text="Response Status:").grid(row=3, column=0, sticky=tk.W)
         resp_var = tk.StringVar(value="Registered")
         resp_combo = ttk.Combobox(self.input_frame, textvariable=resp_var, state="readonly")
-        resp_combo['values'] = ['Registered', 'Attended', 'Cancelled']
+        resp_combo['values'] = alumni_service.RSVP_STATUSES
         resp_combo.grid(row=3, column=1, sticky=(tk.W, tk.E))
         def submit():
             if not all([pid.get(), event_var.get(), alumni_var.get()]):
@@ -1621,55 +2505,24 @@ class AlumniDBGUI:
             except Exception:
                 messagebox.showerror("Input Error", "Select valid event and alumni!")
                 return
-            q = "INSERT INTO EventParticipationAlumni (pid, event_id, alumni_id, resp_status) VALUES (%s,%s,%s,%s)"
-            self.safe_execute(q, (pid_val, event_id_val, alumni_id_val, resp_var.get()), "Alumni participation registered!")
+            q, params = self.sql.participation.register("Alumni", pid_val, event_id_val, alumni_id_val, resp_var.get())
+            self.safe_execute(q, params, "Alumni participation registered!")
             self.view_participation_alumni()
         tk.Button(self.input_frame, text="Register Alumni", command=submit, bg='#27ae60', fg='white').grid(row=4, column=0, columnspan=2, pady=6)
     
     def view_participation_students(self):
-        q = """SELECT P.pid, E.name as event_name, S.name as student_name, P.resp_status
-               FROM EventParticipationStudent P
-               JOIN Event E ON P.event_id=E.event_id
-               JOIN Student S ON P.student_id=S.student_id
-               ORDER BY P.pid"""
-        res = self.execute_query(q)
-        if res:
-            results, columns = res
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No student participation records found.")
+        self.page_query("view_participation_students", self.sql.participation.listing("Student"))
     
     def view_participation_alumni(self):
-        q = """SELECT P.pid, E.name as event_name, A.name as alumni_name, P.resp_status
-               FROM EventParticipationAlumni P
-               JOIN Event E ON P.event_id=E.event_id
-               JOIN Alumni A ON P.alumni_id=A.alumni_id
-               ORDER BY P.pid"""
-        res = self.execute_query(q)
-        if res:
-            results, columns = res
-            self.show_results(results, columns)
-        else:
-            self.result_text.insert(tk.END, "No alumni participation records found.")
+        self.page_query("view_participation_alumni", self.sql.participation.listing("Alumni"))
     
+    @requires(("SELECT", "EventAttendanceCounter"))
     def count_event_participants(self):
-        """Show total number of attendees (students + alumni) per event"""
-        query = """
-        SELECT e.event_id,
-            e.name AS Event_Name,
-            (SELECT COUNT(*) FROM EventParticipationStudent eps
-                WHERE eps.event_id = e.event_id AND eps.resp_status = 'Attended')
-            +
-            (SELECT COUNT(*) FROM EventParticipationAlumni epa
-                WHERE epa.event_id = e.event_id AND epa.resp_status = 'Attended')
-            AS Total_Attendees
-        FROM Event e
-        ORDER BY e.event_id;
-        """
-        results, columns = self.execute_query(query)
-        self.show_results(results, columns)
+        """Show attendance totals per event from the trigger-maintained counters"""
+        self.submit_report("count_event_participants", self.sql.events.participant_counts())
 
 
+    @requires(("DELETE", "EventParticipationStudent"), ("DELETE", "EventParticipationAlumni"))
     def delete_participant(self):
         """Delete a participant record (student/alumni) by PID"""
         self.clear_input_frame()
@@ -1693,35 +2546,209 @@ class AlumniDBGUI:
             if pid_val is None:
                 return
             
-            table = "EventParticipationStudent" if type_var.get() == "Student" else "EventParticipationAlumni"
-            query = f"DELETE FROM {table} WHERE pid=%s"
+            query, params = self.sql.participation.delete(type_var.get(), pid_val)
             
             if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete this {type_var.get()} participant?"):
-                if self.safe_execute(query, (pid_val,), f"{type_var.get()} participant deleted successfully!"):
+                if self.safe_execute(query, params, f"{type_var.get()} participant deleted successfully!"):
                     if type_var.get() == "Student":
                         self.view_participation_students()
                     else:
                         self.view_participation_alumni()
         
+        def delete_selected():
+            selection = self.selected_participation()
+            if selection is None:
+                return
+            kind, pids, refresh = selection
+            if not messagebox.askyesno("Confirm Delete", f"Delete {len(pids)} selected {kind} participant(s)?"):
+                return
+            batch = self.sql.participation.delete_many(kind, pids)
+            self.submit_batch("delete_participants", batch, f"{{count}} {kind} participant(s) deleted.", refresh)
+
         delete_btn = tk.Button(self.input_frame, text="Delete Participant", command=delete_record,
                             bg='#e74c3c', fg='white', font=('Arial', 10, 'bold'))
         delete_btn.grid(row=2, column=0, columnspan=2, pady=10)
+        tk.Button(self.input_frame, text="Delete Selected Rows", command=delete_selected,
+                  bg='#c0392b', fg='white', font=('Arial', 10)).grid(row=3, column=0, columnspan=2)
+        tk.Label(self.input_frame, text="Bulk: select rows in View Student/Alumni Participation (Ctrl+A for all loaded)",
+                 fg='gray', font=('Arial', 8)).grid(row=4, column=0, columnspan=2, sticky=tk.W)
+
+    @requires(("UPDATE", "EventParticipationStudent"), ("UPDATE", "EventParticipationAlumni"))
+    def event_checkin_gui(self):
+        """Check attendees in by scanning or typing their ID; changes are saved in batches"""
+        self.clear_input_frame()
+        self.content_title.config(text="✅ Event Check-in")
+        state = {"session": None}
+
+        tk.Label(self.input_frame, text="Event:* (type name or ID)").grid(row=0, column=0, sticky=tk.W)
+        event_var = tk.StringVar()
+        EntityPicker(self.input_frame, self, "event", event_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
+
+        tk.Label(self.input_frame, text="Scan / ID (S123 or A123 if ambiguous):").grid(row=1, column=0, sticky=tk.W)
+        scan_entry = tk.Entry(self.input_frame, font=('Arial', 12))
+        scan_entry.grid(row=1, column=1, sticky=(tk.W, tk.E))
+
+        feedback = tk.Label(self.input_frame, text="", font=('Arial', 10, 'bold'))
+        feedback.grid(row=2, column=0, columnspan=2, sticky=tk.W)
+        counts = tk.Label(self.input_frame, text="", fg='gray', font=('Arial', 9))
+        counts.grid(row=3, column=0, columnspan=2, sticky=tk.W)
+
+        def update_counts():
+            session = state["session"]
+            if session is None or not counts.winfo_exists():
+                return
+            counts.config(text=f"Checked in {session.attended} of {len(session.rows)} — "
+                               f"{session.pending_count} waiting to be saved")
+
+        def lost(taken, error):
+            messagebox.showerror("Check-in Not Saved",
+                                 f"{sum(len(pids) for pids in taken.values())} check-in(s) could not be saved:\n{error}")
+
+        def flush():
+            session = state["session"]
+            if session is None:
+                return
+            batch, taken = self.sql.participation.save_checkins(session)
+            if batch is None:
+                return
+
+            def done(_, error):
+                if error is not None:
+                    # Keep the check-ins and try again with the next flush
+                    session.restore(taken)
+                    if feedback.winfo_exists():
+                        feedback.config(text=f"Could not save check-ins, will retry: {error}", fg='#e74c3c')
+                    else:
+                        lost(taken, error)  # the screen is gone, so there is no next flush
+                update_counts()
+
+            if self.executor.submit(("checkin_flush", id(batch)), lambda: self.run_batch(batch), done) is None:
+                lost(taken, "the application is shutting down")
+
+        def save_now():
+            # Used by shutdown, while the pool is still open
+            session = state["session"]
+            batch, taken = self.sql.participation.save_checkins(session) if session else (None, None)
+            if batch is None:
+                return
+            try:
+                self.run_batch(batch)
+            except mysql.connector.Error as err:
+                lost(taken, err)
+
+        def leave(event=None):
+            self.save_pending_checkins = None
+            flush()
+
+        def tick(session):
+            if state["session"] is not session or not scan_entry.winfo_exists():
+                return
+            flush()
+            self.root.after(CHECKIN_FLUSH_MS, tick, session)
+
+        def check_in_rows(rows):
+            session = state["session"]
+            new = [row for row in rows if session.check_in(row)]
+            grid = self.result_grid
+            grid.selected = {id(row) for row in rows}
+            # The grid may show another query's rows by now
+            position = next((i for i, row in enumerate(grid.rows) if row is rows[0]), None) if rows else None
+            if position is not None:
+                grid.scroll_to(position)
+            else:
+                grid.render()
+            if session.pending_count >= CHECKIN_FLUSH_ROWS:
+                flush()
+            update_counts()
+            return new
+
+        def scan(event=None):
+            session = state["session"]
+            code = scan_entry.get()
+            scan_entry.delete(0, tk.END)
+            if session is None:
+                feedback.config(text="Load an event's participants first.", fg='#e74c3c')
+                return
+            rows = session.find(code)
+            if not rows:
+                feedback.config(text=f"✗ {code.strip()}: not registered for this event", fg='#e74c3c')
+            elif len(rows) > 1 and len({row[0] for row in rows}) > 1:
+                feedback.config(text=f"? {code.strip()} is both a student and an alumni ID — prefix it with S or A",
+                                fg='#e67e22')
+            elif check_in_rows(rows):
+                feedback.config(text=f"✓ {rows[0][3]} checked in", fg='#27ae60')
+            else:
+                feedback.config(text=f"• {rows[0][3]} was already checked in", fg='#7f8c8d')
+
+        def check_in_selected():
+            if state["session"] is None:
+                return
+            rows = self.result_grid.selected_rows()
+            new = check_in_rows(rows)
+            feedback.config(text=f"✓ {len(new)} selected participant(s) checked in", fg='#27ae60')
+
+        def load():
+            try:
+                event_id = int(event_var.get().split(' - ')[0])
+            except ValueError:
+                messagebox.showerror("Input Error", "Select a valid event!")
+                return
+            flush()  # save what was scanned for the previous event first
+
+            query, params = self.sql.participation.checkin_list(event_id)
+
+            def display(results, columns):
+                if not feedback.winfo_exists():
+                    return
+                session = alumni_db.CheckInSession(event_id, results)
+                state["session"] = session
+                self.show_results(session.rows, columns)
+                self.current_view = ("event_checkin", query, params)
+                feedback.config(text="Ready — scan or type an ID and press Enter", fg='#2c3e50')
+                update_counts()
+                scan_entry.focus_set()
+                self.root.after(CHECKIN_FLUSH_MS, tick, session)
+
+            self.submit_query("event_checkin", query, params, on_result=display, screen=True)
+
+        scan_entry.bind("<Return>", scan)
+        # Leaving the screen saves whatever is still waiting; so does Exit
+        scan_entry.bind("<Destroy>", leave)
+        self.save_pending_checkins = save_now
+
+        buttons = ttk.Frame(self.input_frame)
+        buttons.grid(row=4, column=0, columnspan=2, pady=8, sticky=tk.W)
+        tk.Button(buttons, text="Load Participants", command=load, bg='#3498db', fg='white').pack(side=tk.LEFT)
+        tk.Button(buttons, text="Check In Selected Rows", command=check_in_selected,
+                  bg='#27ae60', fg='white').pack(side=tk.LEFT, padx=8)
+        tk.Button(buttons, text="Save Now", command=flush, bg='#f39c12', fg='white').pack(side=tk.LEFT)
+
+    def selected_participation(self):
+        """Return (kind, pids, refresh) for the rows selected in a participation view"""
+        views = {
+            "view_participation_students": ("Student", self.view_participation_students),
+            "view_participation_alumni": ("Alumni", self.view_participation_alumni),
+        }
+        key = self.current_view[0] if self.current_view else None
+        if key not in views:
+            messagebox.showerror("Selection Error",
+                                 "Open View Student Participation or View Alumni Participation and select rows first!")
+            return None
+        rows = self.result_grid.selected_rows()
+        if not rows:
+            messagebox.showerror("Selection Error", "Select one or more participation rows first!")
+            return None
+        kind, refresh = views[key]
+        return kind, [row[0] for row in rows], refresh
 
     def show_total_events_attended_gui(self):
-        """Show total number of events attended by a selected alumni using SQL function"""
+        """Show total number of events attended by a selected alumni"""
         self.clear_input_frame()
         self.content_title.config(text="🎯 Total Events Attended by Alumni")
 
-        alumni_list = self.get_alumni_list()
-        if not alumni_list:
-            messagebox.showerror("Error", "No alumni records found.")
-            return
-
-        tk.Label(self.input_frame, text="Select Alumni:*").grid(row=0, column=0, sticky=tk.W)
+        tk.Label(self.input_frame, text="Select Alumni:* (type name or ID)").grid(row=0, column=0, sticky=tk.W)
         alumni_var = tk.StringVar()
-        alumni_combo = ttk.Combobox(self.input_frame, textvariable=alumni_var, state="readonly")
-        alumni_combo['values'] = [f"{a[0]} - {a[1]}" for a in alumni_list]
-        alumni_combo.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        EntityPicker(self.input_frame, self, "alumni", alumni_var).grid(row=0, column=1, sticky=(tk.W, tk.E))
 
         def show_result():
             if not alumni_var.get():
@@ -1733,71 +2760,50 @@ class AlumniDBGUI:
                 messagebox.showerror("Input Error", "Invalid alumni selected!")
                 return
 
-            query = """
-                SELECT A.name AS Alumni_Name,
-                    total_events_attended(A.alumni_id) AS Events_Attended
-                FROM Alumni A
-                WHERE A.alumni_id = %s
-            """
-            res = self.execute_query(query, (alumni_id_val,))
-            if res == "permission_denied":
-                return 
-            if res:
-                results, columns = res
-                self.show_results(results, columns)
-            else:
-                self.result_text.insert(tk.END, "No attendance data found for this alumni.")
+            self.submit_query("show_total_events_attended", *self.sql.alumni.attendance_summary([alumni_id_val]))
 
         tk.Button(self.input_frame, text="Show Events Attended", command=show_result,
                 bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).grid(row=1, column=0, columnspan=2, pady=10)
     
+    @requires(("SELECT", "AlumniAttendanceLeaderboard"))
+    def show_attendance_leaderboard(self):
+        """Alumni ranked by events attended, counted in one grouped pass"""
+        self.submit_query("show_attendance_leaderboard",
+                          *self.sql.alumni.attendance_leaderboard(self.current_page_size()))
+
     def view_alumni_by_event_gui(self):
         """Display alumni who participated in a selected event."""
         self.clear_input_frame()
 
         tk.Label(self.input_frame, text="Select Event:*").grid(row=0, column=0, sticky=tk.W)
 
-        # Fetch event names from the database
-        query = "SELECT name FROM Event ORDER BY name"
-        res = self.execute_query(query)
-        events = [r[0] for r in res[0]] if res and res[0] else []
-
         event_var = tk.StringVar()
         event_combo = ttk.Combobox(self.input_frame, textvariable=event_var, state="readonly", width=40)
-        event_combo['values'] = events
         event_combo.grid(row=0, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
 
+        # Event names fill in when the lookup returns
+        self.cached_lookup("event_names", self.sql.events.names(), ("Event",),
+                           lambda rows: event_combo.configure(values=[r[0] for r in rows]))
+
         def show_results():
             if not event_var.get():
                 messagebox.showwarning("Input Error", "Please select an event!")
                 return
-            query = """
-            SELECT A.alumni_id, A.name, A.email, A.company
-            FROM Alumni A
-            WHERE A.alumni_id IN (
-                SELECT EPA.alumni_id
-                FROM EventParticipationAlumni EPA
-                WHERE EPA.event_id = (
-                    SELECT E.event_id
-                    FROM Event E
-                    WHERE E.name = %s
-                )
-            )
-            ORDER BY A.name;
-            """
-            res = self.execute_query(query, (event_var.get(),))
-            if res == "permission_denied":
-                return 
-            if res and res[0]:
-                results, columns = res
-                self.show_results(results, columns)
-            else:
-                messagebox.showinfo("Info", f"No alumni found for event '{event_var.get()}'.")
+            event_name = event_var.get()
+
+            def display(results, columns):
+                if results:
+                    self.show_results(results, columns)
+                else:
+                    messagebox.showinfo("Info", f"No alumni found for event '{event_name}'.")
+
+            self.submit_report("view_alumni_by_event", self.sql.alumni.attending_event(event_name), on_result=display)
 
         show_btn = tk.Button(self.input_frame, text="Show Alumni", command=show_results,
                             bg='#9b59b6', fg='white', font=('Arial', 10))
         show_btn.grid(row=1, column=0, columnspan=2, pady=10)
 
+    @requires(("UPDATE", "EventParticipationStudent"), ("UPDATE", "EventParticipationAlumni"))
     def update_participation_status_gui(self):
         """Update RSVP status (Registered, Attended, Cancelled) for Student or Alumni"""
         self.clear_input_frame()
@@ -1818,7 +2824,7 @@ class AlumniDBGUI:
         tk.Label(self.input_frame, text="New RSVP Status:*").grid(row=2, column=0, sticky=tk.W)
         status_var = tk.StringVar()
         status_combo = ttk.Combobox(self.input_frame, textvariable=status_var, state="readonly")
-        status_combo['values'] = ['Registered', 'Attended', 'Cancelled']
+        status_combo['values'] = alumni_service.RSVP_STATUSES
         status_combo.grid(row=2, column=1, sticky=(tk.W, tk.E))
 
         def update_status():
@@ -1830,17 +2836,32 @@ class AlumniDBGUI:
             if pid_val is None:
                 return
 
-            table = "EventParticipationStudent" if type_var.get() == "Student" else "EventParticipationAlumni"
-            query = f"UPDATE {table} SET resp_status=%s WHERE pid=%s"
+            query, params = self.sql.participation.set_status(type_var.get(), pid_val, status_var.get())
 
-            if self.safe_execute(query, (status_var.get(), pid_val), f"{type_var.get()} RSVP status updated successfully!"):
+            if self.safe_execute(query, params, f"{type_var.get()} RSVP status updated successfully!"):
                 if type_var.get() == "Student":
                     self.view_participation_students()
                 else:
                     self.view_participation_alumni()
 
+        def update_selected():
+            if not status_var.get():
+                messagebox.showerror("Input Error", "Please choose the new RSVP status!")
+                return
+            selection = self.selected_participation()
+            if selection is None:
+                return
+            kind, pids, refresh = selection
+            batch = self.sql.participation.set_status_many(kind, pids, status_var.get())
+            self.submit_batch("update_participation_status", batch,
+                              f"{{count}} {kind} RSVP(s) set to {status_var.get()}.", refresh)
+
         tk.Button(self.input_frame, text="Update RSVP Status", command=update_status,
                 bg='#f39c12', fg='white', font=('Arial', 10, 'bold')).grid(row=3, column=0, columnspan=2, pady=10)
+        tk.Button(self.input_frame, text="Apply Status to Selected Rows", command=update_selected,
+                  bg='#d35400', fg='white', font=('Arial', 10)).grid(row=4, column=0, columnspan=2)
+        tk.Label(self.input_frame, text="Bulk: select rows in View Student/Alumni Participation (Ctrl+A for all loaded)",
+                 fg='gray', font=('Arial', 8)).grid(row=5, column=0, columnspan=2, sticky=tk.W)
 
 def main():
     root = tk.Tk()
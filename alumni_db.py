@@ -0,0 +1,1182 @@
+"""Database helpers for the Alumni Network application that do not depend on Tk."""
+import logging
+import math
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+import mysql.connector
+from mysql.connector import errors
+
+log = logging.getLogger(__name__)
+
+DB_HOST = "localhost"
+DB_NAME = "AlumniDB"
+
+# Connections per database user when the caller does not size the pool
+DEFAULT_POOL_SIZE = 5
+# Idle connections older than this are pinged before being handed out
+HEALTH_CHECK_AFTER = 30
+# How long acquire() waits for a free connection before giving up
+CHECKOUT_TIMEOUT = 10
+
+# Server-side prepared statements kept open on each pooled connection
+PREPARED_STATEMENTS_PER_CONNECTION = 64
+
+# Client error codes meaning the connection itself is gone
+CONNECTION_LOST_ERRNOS = (2006, 2013, 2055)
+
+# Shortest word InnoDB puts in a full-text index (innodb_ft_min_token_size)
+FULLTEXT_MIN_WORD = 3
+
+# Seconds a cached dropdown list stays valid if the app itself never writes to its table
+LOOKUP_TTL = 300
+
+# Report result cache: total size in bytes, and seconds a result stays valid
+# if the app itself never writes to the tables it read
+RESULT_CACHE_BYTES = 32 * 1024 * 1024
+RESULT_CACHE_TTL = 120
+
+# Query instrumentation: timings kept in the ring buffer, and the wall time (ms)
+# from which a query counts as slow and has its plan logged
+QUERY_STATS_SIZE = 2000
+SLOW_QUERY_MS = 500
+
+TABLES = ("Department", "Alumni", "Student", "Education", "Mentorship", "Committee", "Event",
+          "EventParticipationStudent", "EventParticipationAlumni", "EventAttendanceCounter")
+_TABLES_BY_LOWER = {t.lower(): t for t in TABLES}
+
+# Tables whose rows change when a row of the key table is deleted or re-keyed (FK actions).
+# None of the child tables is itself referenced, so one level is enough.
+CASCADES = {
+    "Department": {"Alumni", "Student"},
+    "Alumni": {"Education", "Mentorship", "EventParticipationAlumni"},
+    "Student": {"Mentorship", "EventParticipationStudent"},
+    "Event": {"Committee", "EventParticipationStudent", "EventParticipationAlumni",
+              "EventAttendanceCounter"},
+}
+
+# Tables kept in step by triggers (migrations/004) whenever the key table changes,
+# including rows removed by a cascade from Student/Alumni
+TRIGGER_WRITES = {
+    "EventParticipationStudent": {"EventAttendanceCounter"},
+    "EventParticipationAlumni": {"EventAttendanceCounter"},
+}
+
+# Stored procedures that write, and the tables they write to
+PROCEDURE_WRITES = {
+    "update_alumni_company": {"Alumni"},
+    "update_alumni_contact": {"Alumni"},
+}
+
+_WRITE_RE = re.compile(r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)`?",
+                       re.IGNORECASE)
+_CALL_RE = re.compile(r"^\s*CALL\s+`?(\w+)`?", re.IGNORECASE)
+_READ_RE = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+_GRANT_RE = re.compile(r"^GRANT\s+(.+?)\s+ON\s+(?:(?:TABLE|FUNCTION|PROCEDURE)\s+)?(\S+)\s+TO\s", re.IGNORECASE)
+_COLUMN_LIST_RE = re.compile(r"\([^)]*\)")
+_IN_LIST_RE = re.compile(r"IN \((?:%s, )*%s\)")
+
+
+def connect(user, password, host=DB_HOST, database=DB_NAME):
+    """Open a single new connection to the Alumni database"""
+    return mysql.connector.connect(host=host, user=user, password=password, database=database)
+
+
+def tables_written(query):
+    """Return the tables a write statement can change, including FK cascades"""
+    match = _WRITE_RE.match(query)
+    if match:
+        table = _TABLES_BY_LOWER.get(match.group(1).lower(), match.group(1))
+        written = {table}
+        if match.group(0).lstrip()[:6].upper() != "INSERT":
+            # Deletes and key updates reach the child tables through ON DELETE/UPDATE actions
+            written |= CASCADES.get(table, set())
+        for t in list(written):
+            written |= TRIGGER_WRITES.get(t, set())
+        return written
+
+    match = _CALL_RE.match(query)
+    if match:
+        return set(PROCEDURE_WRITES.get(match.group(1).lower(), ()))
+    return set()
+
+
+def is_connection_lost(err):
+    """True if err means the server connection dropped ("MySQL server has gone away")"""
+    return isinstance(err, (errors.OperationalError, errors.InterfaceError)) and \
+        getattr(err, "errno", None) in CONNECTION_LOST_ERRNOS
+
+
+def escape_like(text):
+    """Escape LIKE wildcards so text matches literally"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def parse_int(value):
+    """Parse a whole number typed into a form or read from an import file; raises ValueError"""
+    return int(value)
+
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD date; raises ValueError"""
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+# =============================================
+#  Connection Pool
+# =============================================
+class ConnectionPool:
+    """Bounded pool of connections for one database user.
+
+    Connections are opened lazily up to size. An idle connection is pinged
+    (reconnecting if needed) before reuse once it has been idle for
+    HEALTH_CHECK_AFTER seconds, and a connection that fails mid-query is
+    discarded instead of being returned to the pool. Each connection has
+    its own PreparedStatements, see statements().
+    """
+
+    def __init__(self, user, password, size=DEFAULT_POOL_SIZE, host=DB_HOST, database=DB_NAME,
+                 first_connection=None, statements_per_connection=PREPARED_STATEMENTS_PER_CONNECTION):
+        self.user = user
+        self.password = password
+        self.size = size
+        self.host = host
+        self.database = database
+        self.statements_per_connection = statements_per_connection
+        self.statement_stats = PreparedStatementStats()
+        self._idle = deque()  # (connection, last_used) pairs, most recent on the right
+        self._created = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._statements = {}  # id(connection) -> PreparedStatements
+        self._privileges = None
+        if first_connection is not None:
+            self.add(first_connection)
+
+    def add(self, conn):
+        """Adopt an already open connection, e.g. the one used to check login"""
+        with self._cond:
+            if self._closed or self._created >= self.size:
+                conn.close()
+                return
+            self._created += 1
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def resize(self, size):
+        """Let the pool grow to size connections; it never shrinks"""
+        with self._cond:
+            if size > self.size:
+                self.size = size
+                self._cond.notify_all()
+
+    def acquire(self, timeout=CHECKOUT_TIMEOUT):
+        """Check out a healthy connection, waiting up to timeout seconds for one"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise errors.PoolError("Connection pool is closed")
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._created < self.size:
+                    self._created += 1
+                    conn, last_used = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise errors.PoolError(f"No free database connection after {timeout}s "
+                                           f"(pool size {self.size})")
+                self._cond.wait(remaining)
+
+        try:
+            if conn is None:
+                conn = connect(self.user, self.password, self.host, self.database)
+            elif time.monotonic() - last_used > HEALTH_CHECK_AFTER:
+                session = conn.connection_id
+                conn.ping(reconnect=True, attempts=2, delay=0)
+                if conn.connection_id != session:
+                    # A new session has none of the old one's prepared statements
+                    self._statements.pop(id(conn), None)
+        except mysql.connector.Error:
+            self._forget(conn)
+            raise
+        return conn
+
+    def release(self, conn, discard=False):
+        """Return a connection to the pool, or close it if it is broken"""
+        if not discard:
+            try:
+                # End any open transaction so the next user does not see a stale snapshot
+                if conn.in_transaction:
+                    conn.rollback()
+            except mysql.connector.Error:
+                discard = True
+        if discard or self._closed:
+            self._forget(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def privileges(self):
+        """The account's Privileges, read with SHOW GRANTS on first use and then kept"""
+        if self._privileges is None:
+            with self.connection() as conn:
+                self._privileges = Privileges.load(conn, self.database)
+        return self._privileges
+
+    def statements(self, conn):
+        """The PreparedStatements of a checked-out connection"""
+        statements = self._statements.get(id(conn))
+        if statements is None or statements.conn is not conn:
+            statements = PreparedStatements(conn, self.statements_per_connection, self.statement_stats)
+            self._statements[id(conn)] = statements
+        return statements
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks out a connection and always gives it back"""
+        conn = self.acquire()
+        try:
+            yield conn
+        except mysql.connector.Error as err:
+            self.release(conn, discard=is_connection_lost(err))
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        else:
+            self.release(conn)
+
+    def close(self):
+        """Close all idle connections; checked-out ones are closed on release"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._forget(conn)
+
+    def _forget(self, conn):
+        if conn is not None:
+            # Closing the connection deallocates its prepared statements on the server
+            self._statements.pop(id(conn), None)
+            try:
+                conn.close()
+            except mysql.connector.Error:
+                pass
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+
+class PreparedStatementStats:
+    """Counters shared by the PreparedStatements of one pool.
+
+    prepared counts statements parsed by the server; reused counts
+    executions that skipped the parse because the statement was already
+    prepared on that connection.
+    """
+
+    def __init__(self):
+        self.prepared = 0
+        self.reused = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    def count(self, prepared=0, reused=0, evicted=0):
+        with self._lock:
+            self.prepared += prepared
+            self.reused += reused
+            self.evicted += evicted
+
+    def stats(self):
+        with self._lock:
+            executions = self.prepared + self.reused
+            return {"prepared": self.prepared, "reused": self.reused, "evicted": self.evicted,
+                    "reuse_rate": self.reused / executions if executions else 0.0}
+
+
+class PreparedStatements:
+    """LRU of server-side prepared statements on one connection.
+
+    mysql.connector's prepared cursor holds a single statement and prepares
+    again whenever it is handed a different SQL string object, so every
+    distinct statement gets a cursor of its own and is always executed with
+    the string it was first prepared from. Parameters and rows then travel
+    in the binary protocol. Past capacity the least recently used statement
+    is closed on the server. Like its connection, it is used by one thread
+    at a time.
+    """
+
+    def __init__(self, conn, capacity=PREPARED_STATEMENTS_PER_CONNECTION, stats=None):
+        self.conn = conn
+        self.capacity = max(1, capacity)
+        self.stats = stats or PreparedStatementStats()
+        self._cursors = OrderedDict()  # sql -> (sql as prepared, cursor), least recently used first
+
+    def execute(self, sql, params=()):
+        """Run sql as a prepared statement and return its cursor.
+
+        Read every row from the cursor before the next execute on this
+        connection; do not close it.
+        """
+        entry = self._cursors.get(sql)
+        if entry is None:
+            while len(self._cursors) >= self.capacity:
+                self.discard(next(iter(self._cursors)))
+                self.stats.count(evicted=1)
+            entry = self._cursors[sql] = (sql, self.conn.cursor(prepared=True))
+            self.stats.count(prepared=1)
+        else:
+            self._cursors.move_to_end(sql)
+            self.stats.count(reused=1)
+        try:
+            entry[1].execute(entry[0], tuple(params or ()))
+        except BaseException:
+            self.discard(sql)
+            raise
+        return entry[1]
+
+    def discard(self, sql):
+        """Close a statement, e.g. one whose cursor an error may have left with unread rows"""
+        entry = self._cursors.pop(sql, None)
+        if entry is not None:
+            try:
+                entry[1].close()
+            except mysql.connector.Error:
+                pass
+
+    def __len__(self):
+        return len(self._cursors)
+
+
+# =============================================
+#  Privileges
+# =============================================
+class Privileges:
+    """What a database account may do, parsed from its SHOW GRANTS.
+
+    Read once at login and kept, so the GUI can tell which actions a role
+    has without sending statements only to have them refused. A privilege
+    granted on *.*, on the database or on the table or routine itself covers
+    that object, and ALL covers every privilege. Column-level grants count
+    as grants on their table. Privileges that come through MySQL 8 roles are
+    not listed by SHOW GRANTS and are not seen.
+    """
+
+    def __init__(self, grants, database=DB_NAME):
+        self.database = database.lower()
+        self._everywhere = set()  # granted on *.* or on the whole database
+        self._objects = {}  # lowercased table or routine name -> privileges
+        for grant in grants:
+            self._add(grant)
+
+    @classmethod
+    def load(cls, conn, database=DB_NAME):
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SHOW GRANTS")
+            grants = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+        return cls(grants, database)
+
+    def can(self, privilege, obj):
+        """True if the account holds privilege (e.g. "INSERT", "EXECUTE") on a table or routine"""
+        held = self._everywhere | self._objects.get(obj.lower(), set())
+        return "ALL" in held or privilege.upper() in held
+
+    def _add(self, grant):
+        match = _GRANT_RE.match(grant)
+        if match is None:
+            return  # e.g. a role granted to the account
+        privileges = {"ALL" if p.strip().upper().startswith("ALL") else p.strip().upper()
+                      for p in _COLUMN_LIST_RE.sub("", match.group(1)).split(",")}
+        database, _, name = match.group(2).replace("`", "").partition(".")
+        if database != "*" and database.lower() != self.database:
+            return
+        if name == "*":
+            self._everywhere |= privileges
+        else:
+            self._objects.setdefault(name.lower(), set()).update(privileges)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(user, password, first_connection=None, size=DEFAULT_POOL_SIZE):
+    """Return the shared pool for a database user, creating it on first use.
+
+    Pools are keyed by user, i.e. by role. first_connection, if given, is
+    adopted into the pool instead of being closed. An existing pool smaller
+    than size is allowed to grow to it.
+    """
+    with _pools_lock:
+        pool = _pools.get(user)
+        if pool is not None and pool.password != password:
+            pool.close()
+            pool = None
+        if pool is None:
+            pool = ConnectionPool(user, password, size=size, first_connection=first_connection)
+            _pools[user] = pool
+        else:
+            pool.resize(size)
+            if first_connection is not None:
+                pool.add(first_connection)
+        return pool
+
+
+def close_all_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+# =============================================
+#  Streaming Results
+# =============================================
+class RowStream:
+    """Unbuffered cursor over a SELECT, read page by page with fetchmany.
+
+    Holds a pooled connection until the rows run out or close() is called.
+    Closing early throws the connection away, because the driver would
+    otherwise have to read every remaining row before reusing it. The server
+    drops a client that stops reading for longer than net_write_timeout, in
+    which case the next fetch raises a connection-lost error. transform, if
+    given, turns each page of rows into display rows (e.g. a GroupBlanker).
+    """
+
+    def __init__(self, pool, query, params=None, transform=None):
+        self._pool = pool
+        self._transform = transform
+        self._lock = threading.Lock()
+        self._conn = pool.acquire()
+        try:
+            self._cursor = self._conn.cursor()
+            self._cursor.execute(query, params or ())
+        except BaseException:
+            pool.release(self._conn, discard=True)
+            raise
+        self.columns = [desc[0] for desc in self._cursor.description]
+        self.types = [desc[1] for desc in self._cursor.description]  # mysql.connector FieldType codes
+        self.exhausted = False
+
+    def fetch(self, size):
+        """Return up to size more rows; an empty list once the result is used up"""
+        with self._lock:
+            if self.exhausted:
+                return []
+            try:
+                rows = self._cursor.fetchmany(size)
+            except mysql.connector.Error:
+                self._finish(discard=True)
+                raise
+            if len(rows) < size:
+                self._finish(discard=False)
+            return list(self._transform(rows)) if self._transform else rows
+
+    def fetch_all(self, page_size=1000):
+        """Read the rest of the result"""
+        rows = []
+        while True:
+            page = self.fetch(page_size)
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+
+    def close(self):
+        with self._lock:
+            if not self.exhausted:
+                self._finish(discard=True)
+
+    def _finish(self, discard):
+        self.exhausted = True
+        if not discard:
+            self._cursor.close()
+        self._pool.release(self._conn, discard=discard)
+
+
+class GroupBlanker:
+    """Shows the key of each group once in a result ordered by a leading key.
+
+    The first key_columns columns of a row identify its group; on every row
+    after the first of a group, the first blank_columns columns (by default
+    the key itself) are replaced with ''. Calling the blanker on rows returns
+    a generator, so it can sit directly on a cursor or a RowStream page, and
+    the last key is kept between calls: pages of one result are grouped as
+    a whole. Use a new blanker for each result.
+    """
+
+    def __init__(self, key_columns=1, blank_columns=None):
+        self.key_columns = key_columns
+        self.blank_columns = key_columns if blank_columns is None else blank_columns
+        self._last_key = None
+
+    def __call__(self, rows):
+        key_columns = self.key_columns
+        blank_columns = self.blank_columns
+        blanks = ("",) * blank_columns
+        for row in rows:
+            key = row[:key_columns]
+            if key == self._last_key:
+                yield blanks + tuple(row[blank_columns:])
+            else:
+                self._last_key = key
+                yield row
+
+
+# =============================================
+#  Keyset Pagination
+# =============================================
+class KeysetPager:
+    """Pages through a SELECT by seeking on a unique, indexed key.
+
+    select is the query without ORDER BY; key is the column it is ordered by
+    (e.g. "A.alumni_id") and key_index that column's position in each row.
+    Every page is an index range read (WHERE key > last_seen ... LIMIT n),
+    so the cost of a page does not grow with how far into the table it is.
+    One extra row is requested to tell whether another page follows.
+    """
+
+    def __init__(self, select, key, page_size, key_index=0):
+        self.select = select
+        self.key = key
+        self.key_index = key_index
+        self.page_size = page_size
+        self.rows = []
+        self.first_key = None
+        self.last_key = None
+        self.page_number = 0
+        self.has_prev = False
+        self.has_next = False
+
+    def query(self, direction):
+        """Return (sql, params) for the "first", "next" or "prev" page"""
+        limit = self.page_size + 1
+        if direction == "next" and self.last_key is not None:
+            return (f"{self.select} WHERE {self.key} > %s ORDER BY {self.key} LIMIT %s",
+                    (self.last_key, limit))
+        if direction == "prev" and self.first_key is not None:
+            return (f"{self.select} WHERE {self.key} < %s ORDER BY {self.key} DESC LIMIT %s",
+                    (self.first_key, limit))
+        return f"{self.select} ORDER BY {self.key} LIMIT %s", (limit,)
+
+    def full_query(self):
+        """Return (sql, params) for every row in page order, e.g. for export"""
+        return f"{self.select} ORDER BY {self.key}", ()
+
+    def accept(self, rows, direction):
+        """Record the rows returned for a page query and return the page to show"""
+        more = len(rows) > self.page_size
+        rows = list(rows[:self.page_size])
+        if direction == "prev":
+            rows.reverse()  # fetched in descending key order
+
+        if not rows and direction != "first":
+            # Nothing beyond the current page any more; stay where we are
+            if direction == "next":
+                self.has_next = False
+            else:
+                self.has_prev = False
+            return self.rows
+
+        if direction == "next":
+            self.page_number += 1
+            self.has_prev, self.has_next = True, more
+        elif direction == "prev":
+            self.page_number = max(1, self.page_number - 1)
+            self.has_prev, self.has_next = more, True
+        else:
+            self.page_number = 1
+            self.has_prev, self.has_next = False, more
+
+        self.rows = rows
+        if rows:
+            self.first_key = rows[0][self.key_index]
+            self.last_key = rows[-1][self.key_index]
+        return rows
+
+
+# =============================================
+#  Alumni Search
+# =============================================
+# Ranked search over Alumni(name, email, company) and Education(college_name, course).
+# Each alumnus scores the sum of the relevance of their own row and their education rows.
+ALUMNI_SEARCH_SQL = """
+    SELECT A.alumni_id, A.name, A.email, A.company, A.graduation_year,
+           ROUND(hits.score, 3) AS relevance
+    FROM (
+        SELECT alumni_id, SUM(score) AS score
+        FROM (
+            SELECT alumni_id, MATCH(name, email, company) AGAINST (%s IN BOOLEAN MODE) AS score
+            FROM Alumni
+            WHERE MATCH(name, email, company) AGAINST (%s IN BOOLEAN MODE)
+            UNION ALL
+            SELECT alumni_id, MATCH(college_name, course) AGAINST (%s IN BOOLEAN MODE)
+            FROM Education
+            WHERE MATCH(college_name, course) AGAINST (%s IN BOOLEAN MODE)
+        ) matches
+        GROUP BY alumni_id
+    ) hits
+    JOIN Alumni A ON A.alumni_id = hits.alumni_id
+    ORDER BY hits.score DESC, A.alumni_id
+    LIMIT %s OFFSET %s"""
+
+# Used when every word is too short for the full-text index: name prefix via idx_alumni_name
+ALUMNI_NAME_PREFIX_SQL = """
+    SELECT alumni_id, name, email, company, graduation_year, NULL AS relevance
+    FROM Alumni
+    WHERE name LIKE %s
+    ORDER BY name, alumni_id
+    LIMIT %s OFFSET %s"""
+
+
+# MySQL has no "LIMIT ALL"; the manual's idiom for an OFFSET without a limit
+NO_LIMIT = 18446744073709551615
+
+
+def fulltext_terms(text):
+    """Turn free text into a BOOLEAN MODE query matching any of its words as a prefix.
+
+    Operators typed by the user are dropped, as are words too short to be indexed.
+    """
+    words = [w for w in re.findall(r"\w+", text) if len(w) >= FULLTEXT_MIN_WORD]
+    return " ".join(f"{w}*" for w in words)
+
+
+def alumni_search_query(text, limit, offset=0):
+    """Return (sql, params) for one slice of the ranked search for text"""
+    terms = fulltext_terms(text)
+    if terms:
+        return ALUMNI_SEARCH_SQL, (terms, terms, terms, terms, limit, offset)
+    # Every word is too short for the full-text index: fall back to a name prefix
+    return ALUMNI_NAME_PREFIX_SQL, (escape_like(text.strip()) + "%", limit, offset)
+
+
+class AlumniSearch:
+    """One search, read a ranked page at a time.
+
+    Has the same query()/accept() interface as KeysetPager so the GUI can page
+    it with the same controls. Ranked results have no unique sort key to seek
+    on, so pages are LIMIT/OFFSET over the matches.
+    """
+
+    def __init__(self, text, page_size):
+        self.text = text
+        self.page_size = page_size
+        self.rows = []
+        self.page_number = 0
+        self.has_prev = False
+        self.has_next = False
+        self._target = 1
+
+    def query(self, direction):
+        if direction == "next":
+            self._target = self.page_number + 1
+        elif direction == "prev":
+            self._target = max(1, self.page_number - 1)
+        else:
+            self._target = 1
+        return alumni_search_query(self.text, self.page_size + 1, (self._target - 1) * self.page_size)
+
+    def full_query(self):
+        """Return (sql, params) for every match in rank order, e.g. for export"""
+        return alumni_search_query(self.text, NO_LIMIT)
+
+    def accept(self, rows, direction):
+        self.has_next = len(rows) > self.page_size
+        self.rows = list(rows[:self.page_size])
+        self.page_number = self._target
+        self.has_prev = self.page_number > 1
+        return self.rows
+
+
+# =============================================
+#  Attendance Summary
+# =============================================
+# Events attended by a set of alumni, counted in one grouped query over
+# idx_epa_alumni_status. {ids} is filled with one placeholder per alumni_id.
+ATTENDANCE_SUMMARY_SQL = """
+    SELECT A.alumni_id, A.name AS Alumni_Name, COUNT(P.pid) AS Events_Attended
+    FROM Alumni A
+    LEFT JOIN EventParticipationAlumni P
+           ON P.alumni_id = A.alumni_id AND P.resp_status = 'Attended'
+    WHERE A.alumni_id IN ({ids})
+    GROUP BY A.alumni_id, A.name
+    ORDER BY A.alumni_id"""
+
+ATTENDANCE_LEADERBOARD_SQL = """
+    SELECT alumni_id, name AS Alumni_Name, events_attended AS Events_Attended
+    FROM AlumniAttendanceLeaderboard
+    ORDER BY events_attended DESC, alumni_id
+    LIMIT %s"""
+
+# Alumni ids per grouped query, to keep the IN list and packet size bounded
+ATTENDANCE_BATCH = 1000
+
+
+def attendance_summary_query(alumni_ids):
+    """Return (sql, params) counting attended events for the given alumni"""
+    ids = list(alumni_ids)
+    return ATTENDANCE_SUMMARY_SQL.format(ids=", ".join(["%s"] * len(ids))), tuple(ids)
+
+
+def attendance_summary(run_query, alumni_ids):
+    """Count attended events for many alumni with one grouped query per batch.
+
+    run_query(sql, params) must return (rows, columns). Returns
+    {alumni_id: (name, events_attended)}; unknown ids are left out.
+    """
+    ids = list(dict.fromkeys(alumni_ids))
+    summary = {}
+    for start in range(0, len(ids), ATTENDANCE_BATCH):
+        rows, _ = run_query(*attendance_summary_query(ids[start:start + ATTENDANCE_BATCH]))
+        for alumni_id, name, attended in rows:
+            summary[alumni_id] = (name, attended)
+    return summary
+
+
+# =============================================
+#  Write Batches
+# =============================================
+# Ids per statement for writes built with WriteBatch.add_for_ids
+IN_LIST_BATCH = 1000
+
+
+class WriteBatch:
+    """Unit of work: queue several writes and run them in one transaction.
+
+    Nothing is sent until commit(), which executes the statements in order on
+    one pooled connection and commits once. If any statement fails the whole
+    batch is rolled back and the error is raised, so a batch is all or nothing.
+    """
+
+    def __init__(self):
+        self.statements = []  # (query, params, many)
+
+    def __len__(self):
+        return len(self.statements)
+
+    def add(self, query, params=None):
+        self.statements.append((query, params or (), False))
+        return self
+
+    def add_many(self, query, seq_params):
+        """Queue one statement run with executemany over seq_params"""
+        seq_params = list(seq_params)
+        if seq_params:
+            self.statements.append((query, seq_params, True))
+        return self
+
+    def add_for_ids(self, template, ids, params=()):
+        """Queue template once per IN_LIST_BATCH ids; {ids} becomes the placeholders.
+
+        params come before the ids, e.g.
+        add_for_ids("UPDATE T SET status=%s WHERE pid IN ({ids})", pids, ("Attended",))
+        """
+        ids = list(ids)
+        for start in range(0, len(ids), IN_LIST_BATCH):
+            chunk = ids[start:start + IN_LIST_BATCH]
+            self.add(template.format(ids=", ".join(["%s"] * len(chunk))), tuple(params) + tuple(chunk))
+        return self
+
+    def tables(self):
+        """Every table the queued statements write to"""
+        written = set()
+        for query, _, _ in self.statements:
+            written |= tables_written(query)
+        return written
+
+    def commit(self, pool):
+        """Run every statement in one transaction; return the total rows affected"""
+        affected = 0
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for query, params, many in self.statements:
+                    if many:
+                        cursor.executemany(query, params)
+                    else:
+                        cursor.execute(query, params)
+                    affected += max(cursor.rowcount, 0)
+                conn.commit()
+            except BaseException:
+                try:
+                    conn.rollback()
+                except mysql.connector.Error:
+                    pass  # the original error matters more; the pool discards a dead connection
+                raise
+            finally:
+                cursor.close()
+        return affected
+
+
+# =============================================
+#  Event Check-in
+# =============================================
+# Everyone registered for one event, read once through the event_id-leading indexes
+CHECKIN_SQL = """
+    SELECT 'Student' AS Type, P.pid, S.student_id AS ID, S.name AS Name, P.resp_status AS Status
+    FROM EventParticipationStudent P JOIN Student S ON S.student_id = P.student_id
+    WHERE P.event_id = %s
+    UNION ALL
+    SELECT 'Alumni', P.pid, A.alumni_id, A.name, P.resp_status
+    FROM EventParticipationAlumni P JOIN Alumni A ON A.alumni_id = P.alumni_id
+    WHERE P.event_id = %s
+    ORDER BY Name"""
+
+# Participant kind -> participation table
+PARTICIPATION_TABLES = {"Student": "EventParticipationStudent", "Alumni": "EventParticipationAlumni"}
+
+
+class CheckInSession:
+    """One event's participants held in memory while staff check them in.
+
+    Scans only change the rows in memory and remember the pid; take_batch()
+    turns everything scanned since the last call into one WriteBatch of
+    "UPDATE ... WHERE pid IN (...)" statements, so the database sees a few
+    batched writes instead of a write and a re-query per attendee.
+    """
+
+    STATUS = 4  # position of resp_status in a row
+
+    def __init__(self, event_id, rows):
+        self.event_id = event_id
+        self.rows = [list(row) for row in rows]  # lists, so a check-in can update the row in place
+        self._by_id = {}
+        for row in self.rows:
+            self._by_id.setdefault(row[2], []).append(row)
+        self.pending = {kind: set() for kind in PARTICIPATION_TABLES}
+
+    @property
+    def attended(self):
+        return sum(1 for row in self.rows if row[self.STATUS] == "Attended")
+
+    @property
+    def pending_count(self):
+        return sum(len(pids) for pids in self.pending.values())
+
+    def find(self, code):
+        """Rows matching a scanned or typed code: an id, optionally prefixed S (student) or A (alumni)"""
+        code = code.strip().upper()
+        kind = None
+        if code[:1] in ("S", "A"):
+            kind, code = ("Student" if code[0] == "S" else "Alumni"), code[1:]
+        if not code.isdigit():
+            return []
+        return [row for row in self._by_id.get(int(code), []) if kind in (None, row[0])]
+
+    def check_in(self, row):
+        """Mark a row Attended; False if it already was"""
+        if row[self.STATUS] == "Attended":
+            return False
+        row[self.STATUS] = "Attended"
+        self.pending[row[0]].add(row[1])
+        return True
+
+    def take_batch(self):
+        """Return (batch, taken) for the check-ins not yet written, or (None, None)"""
+        if not self.pending_count:
+            return None, None
+        taken, self.pending = self.pending, {kind: set() for kind in PARTICIPATION_TABLES}
+        batch = WriteBatch()
+        for kind, pids in taken.items():
+            batch.add_for_ids(f"UPDATE {PARTICIPATION_TABLES[kind]} SET resp_status = 'Attended' "
+                              f"WHERE pid IN ({{ids}})", sorted(pids))
+        return batch, taken
+
+    def restore(self, taken):
+        """Put check-ins back after their batch failed, to be retried with the next flush"""
+        for kind, pids in taken.items():
+            self.pending[kind] |= pids
+
+
+# =============================================
+#  Lookup Cache
+# =============================================
+class LookupCache:
+    """In-process cache for small reference lists such as dropdown contents.
+
+    Each entry records the tables it was read from. Entries expire after ttl
+    seconds (to pick up changes made by other clients) and are dropped at
+    once when the app writes to one of their tables. With max_entries set,
+    the least recently used entry is evicted when the cache is full.
+    """
+
+    def __init__(self, ttl=LOOKUP_TTL, max_entries=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # name -> (expires_at, value, tables), oldest first
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped on every invalidation
+
+    def get(self, name, tables, load):
+        """Return the cached value for name, calling load() on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                self._entries.move_to_end(name)
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+        with self._lock:
+            # Don't store a value that a write may have made stale while loading
+            if generation == self._generation:
+                self._entries[name] = (now + self.ttl, value, frozenset(tables))
+                self._entries.move_to_end(name)
+                if self.max_entries is not None and len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def peek(self, name):
+        """The cached value for name if it is still fresh (counted as a hit), else None; never loads"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self.hits += 1
+            self._entries.move_to_end(name)
+            return entry[1]
+
+    def invalidate(self, tables):
+        """Drop every entry read from any of the given tables"""
+        tables = set(tables)
+        if not tables:
+            return
+        with self._lock:
+            self._generation += 1
+            for name in [n for n, e in self._entries.items() if e[2] & tables]:
+                del self._entries[name]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# =============================================
+#  Report Result Cache
+# =============================================
+def tables_read(query):
+    """Return the known tables a SELECT reads (named after FROM or JOIN)"""
+    return {_TABLES_BY_LOWER[name.lower()] for name in _READ_RE.findall(query)
+            if name.lower() in _TABLES_BY_LOWER}
+
+
+def normalize_sql(query):
+    """Collapse whitespace and drop a trailing semicolon, so layout does not split cache keys"""
+    return _SPACE_RE.sub(" ", query).strip().rstrip(";").rstrip()
+
+
+def result_size(result):
+    """Rough size in bytes of a (rows, columns) result, for the cache's memory cap"""
+    rows, columns = result
+    size = sys.getsizeof(rows) + sum(sys.getsizeof(c) for c in columns)
+    for row in rows:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+    return size
+
+
+class ResultCache:
+    """LRU cache of (rows, columns) query results, capped by total size.
+
+    Entries are keyed on the normalized SQL and its parameters and record
+    the tables the query reads, so a write by the app drops them at once
+    (invalidate, fed from tables_written). Each entry also expires after a
+    TTL to pick up changes made by other clients. A result larger than a
+    quarter of the cap is returned but not stored.
+    """
+
+    def __init__(self, max_bytes=RESULT_CACHE_BYTES, ttl=RESULT_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> (expires_at, result, tables, size), oldest first
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped on every invalidation
+
+    def get(self, query, params, load, ttl=None):
+        """Return the cached result of query with params, calling load() on a miss"""
+        key = (normalize_sql(query), tuple(params or ()))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        result = load()
+        size = result_size(result)
+        with self._lock:
+            # Don't store a result that a write may have made stale while loading
+            if generation == self._generation and size <= self.max_bytes // 4:
+                self._remove(key)
+                expires = now + (self.ttl if ttl is None else ttl)
+                self._entries[key] = (expires, result, frozenset(tables_read(query)), size)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+                    self.evictions += 1
+        return result
+
+    def invalidate(self, tables):
+        """Drop every result read from any of the given tables"""
+        tables = set(tables)
+        if not tables:
+            return
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, e in self._entries.items() if e[2] & tables]:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries),
+                    "bytes": self.bytes, "evictions": self.evictions}
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[3]
+
+
+# =============================================
+#  Query Instrumentation
+# =============================================
+_caller = threading.local()
+
+
+@contextmanager
+def query_caller(name):
+    """Attribute the queries run on this thread inside the block to name (e.g. a screen)"""
+    previous = getattr(_caller, "name", None)
+    _caller.name = name
+    try:
+        yield
+    finally:
+        _caller.name = previous
+
+
+def current_caller():
+    return getattr(_caller, "name", None)
+
+
+def query_shape(query):
+    """The query with whitespace normalized and IN lists of any length folded together"""
+    return _IN_LIST_RE.sub("IN (...)", normalize_sql(query))
+
+
+QueryRecord = namedtuple("QueryRecord", "shape caller wall fetch rows at")
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted, non-empty list"""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class QueryStats:
+    """Ring buffer of recent query timings, summarized per query shape.
+
+    wall is the whole round trip and fetch the part spent reading rows, both
+    in seconds. Queries at or over slow_ms are also handed to on_slow(record,
+    plan) with their EXPLAIN rows (None for statements that cannot be
+    explained); the default logs them as a warning on this module's logger.
+    Safe to use from several threads.
+    """
+
+    def __init__(self, size=QUERY_STATS_SIZE, slow_ms=SLOW_QUERY_MS, on_slow=None):
+        self.slow_ms = slow_ms
+        self.on_slow = on_slow or self.log_slow
+        self.slow_count = 0
+        self._records = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def is_slow(self, wall):
+        return self.slow_ms is not None and wall * 1000 >= self.slow_ms
+
+    def record(self, query, wall, fetch, rows, caller=None):
+        record = QueryRecord(query_shape(query), caller or current_caller(), wall, fetch, rows, time.time())
+        with self._lock:
+            self._records.append(record)
+            if self.is_slow(wall):
+                self.slow_count += 1
+        return record
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self.slow_count = 0
+
+    def summary(self):
+        """One dict per query shape, slowest p95 first; times in milliseconds"""
+        shapes = {}
+        for record in self.records():
+            shapes.setdefault(record.shape, []).append(record)
+        summary = []
+        for shape, records in shapes.items():
+            walls = sorted(r.wall * 1000 for r in records)
+            summary.append({
+                "shape": shape,
+                "calls": len(records),
+                "callers": sorted({r.caller or "?" for r in records}),
+                "p50": percentile(walls, 0.50),
+                "p95": percentile(walls, 0.95),
+                "p99": percentile(walls, 0.99),
+                "max": walls[-1],
+                "fetch_p50": percentile(sorted(r.fetch * 1000 for r in records), 0.50),
+                "avg_rows": sum(r.rows for r in records) / len(records),
+            })
+        summary.sort(key=lambda s: s["p95"], reverse=True)
+        return summary
+
+    @staticmethod
+    def log_slow(record, plan):
+        steps = "".join(f"\n  EXPLAIN table={step.get('table')} type={step.get('type')} key={step.get('key')} "
+                        f"rows={step.get('rows')} extra={step.get('Extra')}" for step in plan or ())
+        log.warning("Slow query: %.0f ms (%.0f ms fetching), %s rows, from %s\n  %s%s",
+                    record.wall * 1000, record.fetch * 1000, record.rows, record.caller or "?", record.shape, steps)
+
+
+def explain(cursor, query, params=()):
+    """EXPLAIN a statement on cursor and return its plan as a list of dicts"""
+    cursor.execute("EXPLAIN " + query, params or ())
+    columns = [desc[0] for desc in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -260,8 +260,13 @@ BEGIN
     RETURN countAttended;
 END //
 DELIMITER ;
-SELECT name, total_events_attended(alumni_id) AS Events_Attended
-FROM Alumni;
+-- For many alumni at once, count in one grouped query rather than calling the
+-- function per row (see the AlumniAttendanceLeaderboard view in migrations/)
+SELECT A.name, COUNT(P.pid) AS Events_Attended
+FROM Alumni A
+LEFT JOIN EventParticipationAlumni P
+       ON P.alumni_id = A.alumni_id AND P.resp_status = 'Attended'
+GROUP BY A.alumni_id, A.name;
 
 -- =====================================================
 -- STORED PROCEDURES
@@ -362,25 +367,6 @@ SELECT e.event_id,
        AS Total_Attendees
 FROM Event e;
 
--- ===========================================================
--- to display the name only once per alumni when viewing
-SELECT
-    CASE 
-        WHEN @prev_name = A.name THEN ''
-        ELSE A.name
-    END AS Alumni_Name,
-    @prev_name := A.name AS ignore_me,
-    E.edu_id,
-    E.college_name,
-    E.degree,
-    E.course,
-    E.start_year,
-    E.end_year
-FROM Alumni A
-JOIN Education E ON A.alumni_id = E.alumni_id,
-(SELECT @prev_name := '') AS vars
-ORDER BY A.name, E.edu_id;
-
 -- =====================================================
 -- USER PRIVILEGES
 -- =====================================================
@@ -0,0 +1,686 @@
+"""UI-independent data access for the Alumni Network: one repository per area.
+
+Every query the application runs lives in a repository method. A method
+builds its SQL and hands it to a database object, which decides what
+happens next:
+
+* PooledDatabase runs it at once on an alumni_db connection pool and
+  returns the result (scripts, batch jobs, reports)
+* StatementDatabase returns it unexecuted as a Statement, for callers that
+  run statements themselves; the Tk GUI pages, streams, caches and exports
+  them on its background executor
+* AsyncDatabase returns a coroutine (aiomysql), for the HTTP API and for
+  running independent queries concurrently from the GUI
+
+so the same repository code serves blocking, deferred and async callers.
+Reads return (rows, columns); writes return the number of rows affected.
+"""
+import contextlib
+import time
+from collections import namedtuple
+
+import mysql.connector
+
+import alumni_db
+
+# Rows per page when a caller does not ask for a size
+DEFAULT_PAGE_SIZE = 100
+
+RSVP_STATUSES = ("Registered", "Attended", "Cancelled")
+
+# Days a mentorship has run: duration_days once ended, counted to today while ongoing
+DAYS_SO_FAR = "COALESCE(M.duration_days, DATEDIFF(CURDATE(), M.start_date))"
+
+Statement = namedtuple("Statement", "sql params")
+ProcedureCall = namedtuple("ProcedureCall", "name args")
+
+
+# =============================================
+#  Databases
+# =============================================
+class PooledDatabase:
+    """Runs repository statements synchronously on an alumni_db.ConnectionPool.
+
+    Statements run prepared, through the pool's per-connection
+    PreparedStatements, so a statement is parsed once per connection.
+    on_write(sql), if given, is called after every committed write, e.g. to
+    invalidate caches. With stats (an alumni_db.QueryStats) every statement
+    is timed, and slow reads are EXPLAINed on the same connection. Safe to
+    use from several threads at once.
+    """
+
+    def __init__(self, pool, on_write=None, stats=None):
+        self.pool = pool
+        self.on_write = on_write
+        self.stats = stats
+
+    def fetch(self, sql, params=()):
+        # A read that hits a dropped connection is retried once on a fresh one;
+        # writes are not, since the commit may have happened
+        try:
+            return self._fetch(sql, params)
+        except mysql.connector.Error as err:
+            if not alumni_db.is_connection_lost(err):
+                raise
+        return self._fetch(sql, params)
+
+    def execute(self, sql, params=()):
+        start = time.perf_counter()
+        with self.pool.connection() as conn:
+            affected = self.pool.statements(conn).execute(sql, params).rowcount
+            conn.commit()
+        if self.stats is not None:
+            self._record(sql, start, None, max(affected, 0))
+        if self.on_write:
+            self.on_write(sql)
+        return affected
+
+    def call(self, name, args):
+        """Call a stored procedure and return its first result set"""
+        results = self.call_all(name, args)
+        return results[0] if results else ([], [])
+
+    def call_all(self, name, args):
+        """Call a stored procedure and return every result set it produces, in order"""
+        start = time.perf_counter()
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.callproc(name, args)
+                fetched = time.perf_counter()
+                results = [(stored.fetchall(), [desc[0] for desc in stored.description])
+                           for stored in cursor.stored_results()]
+            finally:
+                cursor.close()
+        if self.stats is not None:
+            self._record(f"CALL {name}", start, fetched, sum(len(rows) for rows, _ in results))
+        return results
+
+    def batch(self, batch):
+        """Commit an alumni_db.WriteBatch in one transaction (timed as its first statement)"""
+        start = time.perf_counter()
+        affected = batch.commit(self.pool)
+        if self.stats is not None and batch.statements:
+            self._record(batch.statements[0][0], start, None, affected)
+        if self.on_write:
+            for sql, _, _ in batch.statements:
+                self.on_write(sql)
+        return affected
+
+    def _fetch(self, sql, params):
+        start = time.perf_counter()
+        with self.pool.connection() as conn:
+            statements = self.pool.statements(conn)
+            cursor = statements.execute(sql, params)
+            executed = time.perf_counter()
+            try:
+                rows = cursor.fetchall()
+            except BaseException:
+                statements.discard(sql)
+                raise
+            columns = [desc[0] for desc in cursor.description]
+            if self.stats is not None:
+                self._record(sql, start, executed, len(rows), lambda: self._explain(conn, sql, params))
+            return rows, columns
+
+    def _record(self, sql, start, fetch_start, rows, explain=None):
+        # fetch_start is when reading rows began (None for writes); explain()
+        # returns the plan and is only called for slow statements
+        end = time.perf_counter()
+        record = self.stats.record(sql, end - start, end - fetch_start if fetch_start else 0.0, rows)
+        if self.stats.is_slow(record.wall):
+            self.stats.on_slow(record, explain() if explain else None)
+
+    @staticmethod
+    def _explain(conn, sql, params):
+        # A plain cursor, so the plan is not prepared over the cached statement
+        cursor = conn.cursor()
+        try:
+            return alumni_db.explain(cursor, sql, params)
+        except mysql.connector.Error:
+            return None  # e.g. no privilege to EXPLAIN a view; the timing is still logged
+        finally:
+            cursor.close()
+
+
+class StatementDatabase:
+    """Returns what would be run instead of running it.
+
+    fetch/execute give a Statement (sql, params), call/call_all give a
+    ProcedureCall and batch gives the WriteBatch back.
+    """
+
+    def fetch(self, sql, params=()):
+        return Statement(sql, tuple(params))
+
+    execute = fetch
+
+    def call(self, name, args):
+        return ProcedureCall(name, tuple(args))
+
+    call_all = call
+
+    def batch(self, batch):
+        return batch
+
+
+class AsyncDatabase:
+    """Runs repository statements on an aiomysql pool; every method is a coroutine.
+
+    Used by the HTTP API (alumni_api) and the GUI's async backend (async_backend).
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    @contextlib.asynccontextmanager
+    async def _reading(self):
+        async with self.pool.acquire() as conn:
+            try:
+                yield conn
+            finally:
+                # End the read's transaction: aiomysql closes a connection released
+                # inside one, and a reused one would keep serving its old snapshot
+                if conn.get_transaction_status():
+                    await conn.rollback()
+
+    async def fetch(self, sql, params=()):
+        async with self._reading() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(sql, params or ())
+                rows = await cursor.fetchall()
+                return rows, [desc[0] for desc in cursor.description]
+
+    async def execute(self, sql, params=()):
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(sql, params or ())
+                await conn.commit()
+                return cursor.rowcount
+
+    async def call(self, name, args):
+        """Call a stored procedure and return its first result set"""
+        async with self._reading() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.callproc(name, args)
+                if cursor.description is None:
+                    return [], []
+                rows = await cursor.fetchall()
+                columns = [desc[0] for desc in cursor.description]
+                # Drain the remaining result sets so the connection can be reused
+                while await cursor.nextset():
+                    pass
+                return rows, columns
+
+    async def call_all(self, name, args):
+        """Call a stored procedure and return every result set it produces, in order"""
+        async with self._reading() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.callproc(name, args)
+                results = []
+                while True:
+                    # The procedure's own status result comes last and has no columns
+                    if cursor.description is not None:
+                        results.append((await cursor.fetchall(), [desc[0] for desc in cursor.description]))
+                    if not await cursor.nextset():
+                        return results
+
+    async def batch(self, batch):
+        """Commit an alumni_db.WriteBatch in one transaction"""
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                affected = 0
+                try:
+                    await conn.begin()  # one transaction whatever the pool's autocommit
+                    for sql, params, many in batch.statements:
+                        if many:
+                            await cursor.executemany(sql, params)
+                        else:
+                            await cursor.execute(sql, params)
+                        affected += max(cursor.rowcount, 0)
+                    await conn.commit()
+                except BaseException:
+                    await conn.rollback()
+                    raise
+                return affected
+
+
+# =============================================
+#  Repositories
+# =============================================
+class Repository:
+    """Base for the per-area repositories.
+
+    Subclasses with a keyset-paged listing set LIST_SELECT (the query without
+    ORDER BY) and LIST_KEY (the unique column it is ordered by, first in each
+    row). Subclasses with a type-ahead picker set TABLE, ID_COLUMN and NAME_COLUMN.
+    """
+
+    LIST_SELECT = None
+    LIST_KEY = None
+    TABLE = None
+    ID_COLUMN = None
+    NAME_COLUMN = "name"
+
+    def __init__(self, db):
+        self.db = db
+
+    def listing(self):
+        """(select, key) for alumni_db.KeysetPager"""
+        return self.LIST_SELECT, self.LIST_KEY
+
+    def list_page(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """Up to limit rows with a key greater than after, in key order"""
+        return self._keyset_page(self.LIST_SELECT, self.LIST_KEY, after, limit)
+
+    def list_all(self):
+        """Every row in key order, for streaming"""
+        return self.db.fetch(f"{self.LIST_SELECT} ORDER BY {self.LIST_KEY}")
+
+    def _keyset_page(self, select, key, after, limit):
+        if after is None:
+            return self.db.fetch(f"{select} ORDER BY {key} LIMIT %s", (limit,))
+        return self.db.fetch(f"{select} WHERE {key} > %s ORDER BY {key} LIMIT %s", (after, limit))
+
+    def pick(self, text, limit):
+        """(id, name) rows for a picker: an exact id if text is a number, else a name prefix"""
+        text = text.strip()
+        if text.isdigit():
+            return self.db.fetch(f"SELECT {self.ID_COLUMN}, {self.NAME_COLUMN} FROM {self.TABLE} "
+                                 f"WHERE {self.ID_COLUMN} = %s", (int(text),))
+        return self.db.fetch(f"SELECT {self.ID_COLUMN}, {self.NAME_COLUMN} FROM {self.TABLE} "
+                             f"WHERE {self.NAME_COLUMN} LIKE %s ORDER BY {self.NAME_COLUMN} LIMIT %s",
+                             (alumni_db.escape_like(text) + "%", limit))
+
+
+class DepartmentRepository(Repository):
+    TABLE = "Department"
+
+    def choices(self):
+        return self.db.fetch("SELECT dept_id, name FROM Department")
+
+    def list_all(self):
+        return self.db.fetch("SELECT * FROM Department ORDER BY dept_id")
+
+    def add(self, dept_id, name, hod):
+        return self.db.execute("INSERT INTO Department VALUES (%s, %s, %s)", (dept_id, name, hod))
+
+    def update_hod(self, dept_id, hod):
+        return self.db.execute("UPDATE Department SET hod=%s WHERE dept_id=%s", (hod, dept_id))
+
+    def delete(self, dept_id):
+        return self.db.execute("DELETE FROM Department WHERE dept_id=%s", (dept_id,))
+
+
+class AlumniRepository(Repository):
+    TABLE = "Alumni"
+    ID_COLUMN = "alumni_id"
+    LIST_SELECT = """SELECT A.alumni_id, A.name, A.email, A.phone_number,
+                          A.graduation_year, A.company, D.name as department
+                   FROM Alumni A LEFT JOIN Department D ON A.dept_id=D.dept_id"""
+    LIST_KEY = "A.alumni_id"
+
+    # The result sets of profile(), in order, and the tables they read
+    PROFILE_SECTIONS = ("Alumni", "Education", "Mentorships", "Events", "Attendance")
+    PROFILE_TABLES = ("Alumni", "Department", "Education", "Mentorship", "Student", "Event",
+                      "EventParticipationAlumni")
+
+    def profile(self, alumni_id):
+        """One alumnus's record, education, mentorships, events and attendance in one round trip"""
+        return self.db.call_all("alumni_profile", (alumni_id,))
+
+    def search(self, text, limit=DEFAULT_PAGE_SIZE, offset=0):
+        """Ranked full-text search over profile and education (see alumni_db.AlumniSearch)"""
+        return self.db.fetch(*alumni_db.alumni_search_query(text, limit, offset))
+
+    def add(self, alumni_id, name, email, phone_number, graduation_year, company, dept_id):
+        return self.db.execute(
+            """INSERT INTO Alumni (alumni_id, name, email, phone_number,
+                     graduation_year, company, dept_id) VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+            (alumni_id, name, email, phone_number, graduation_year, company, dept_id))
+
+    def update_company(self, alumni_id, company):
+        return self.db.execute("UPDATE Alumni SET company=%s WHERE alumni_id=%s", (company, alumni_id))
+
+    def update_contact(self, alumni_id, email="", phone=""):
+        """Empty strings leave a field unchanged (see the update_alumni_contact procedure)"""
+        return self.db.execute("CALL update_alumni_contact(%s, %s, %s)", (alumni_id, email, phone))
+
+    def delete(self, alumni_id):
+        return self.db.execute("DELETE FROM Alumni WHERE alumni_id=%s", (alumni_id,))
+
+    def count_by_company(self):
+        return self.db.fetch("SELECT company, COUNT(*) as count FROM Alumni GROUP BY company ORDER BY count DESC")
+
+    def by_department(self, dept_name):
+        return self.db.fetch("""SELECT A.alumni_id, A.name, A.company, A.graduation_year
+                       FROM Alumni A JOIN Department D ON A.dept_id=D.dept_id
+                       WHERE D.name=%s ORDER BY A.name""", (dept_name,))
+
+    def attendance_summary(self, alumni_ids):
+        """Events attended per alumnus, in one grouped query"""
+        return self.db.fetch(*alumni_db.attendance_summary_query(alumni_ids))
+
+    def attendance_leaderboard(self, limit):
+        return self.db.fetch(alumni_db.ATTENDANCE_LEADERBOARD_SQL, (limit,))
+
+    def attending_event(self, event_name):
+        return self.db.fetch("""
+            SELECT A.alumni_id, A.name, A.email, A.company
+            FROM Alumni A
+            WHERE A.alumni_id IN (
+                SELECT EPA.alumni_id
+                FROM EventParticipationAlumni EPA
+                WHERE EPA.event_id = (
+                    SELECT E.event_id
+                    FROM Event E
+                    WHERE E.name = %s
+                )
+            )
+            ORDER BY A.name""", (event_name,))
+
+
+class StudentRepository(Repository):
+    TABLE = "Student"
+    ID_COLUMN = "student_id"
+    LIST_SELECT = """SELECT S.student_id, S.name, S.email, S.phone,
+                          S.batch_year, D.name as department
+                   FROM Student S LEFT JOIN Department D ON S.dept_id=D.dept_id"""
+    LIST_KEY = "S.student_id"
+
+    def add(self, student_id, name, email, phone, batch_year, dept_id):
+        return self.db.execute("""INSERT INTO Student (student_id, name, email, phone, batch_year, dept_id)
+                       VALUES (%s, %s, %s, %s, %s, %s)""",
+                               (student_id, name, email, phone, batch_year, dept_id))
+
+    def update_email(self, student_id, email):
+        return self.db.execute("UPDATE Student SET email=%s WHERE student_id=%s", (email, student_id))
+
+    def update_phone(self, student_id, phone):
+        return self.db.execute("UPDATE Student SET phone=%s WHERE student_id=%s", (phone, student_id))
+
+    def delete(self, student_id):
+        return self.db.execute("DELETE FROM Student WHERE student_id=%s", (student_id,))
+
+
+class EducationRepository(Repository):
+    TABLE = "Education"
+
+    # Both listings start with the alumni id and are grouped by it, for alumni_db.GroupBlanker
+    def list_all(self):
+        return self.db.fetch("""
+            SELECT A.alumni_id, A.name AS Alumni_Name, E.edu_id, E.college_name, E.degree, E.course,
+                   E.start_year, E.end_year
+            FROM Education E
+            JOIN Alumni A ON E.alumni_id = A.alumni_id
+            ORDER BY A.name, A.alumni_id, E.edu_id""")
+
+    def list_with_alumni(self):
+        return self.db.fetch("""
+            SELECT
+                A.alumni_id,
+                A.name AS Alumni_Name,
+                A.company AS Company,
+                E.end_year AS Graduation_Year,
+                E.college_name AS College_Name,
+                E.degree AS Degree,
+                E.course AS Course
+            FROM Alumni A
+            INNER JOIN Education E ON A.alumni_id = E.alumni_id
+            LEFT JOIN Department D ON A.dept_id = D.dept_id
+            ORDER BY A.name, A.alumni_id, E.edu_id""")
+
+    def add(self, edu_id, alumni_id, college_name, degree, course, start_year, end_year):
+        return self.db.execute(
+            """INSERT INTO Education (edu_id, alumni_id, college_name, degree, course, start_year, end_year)
+                       VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+            (edu_id, alumni_id, college_name, degree, course, start_year, end_year))
+
+    def delete(self, edu_id, alumni_id):
+        return self.db.execute("DELETE FROM Education WHERE edu_id=%s AND alumni_id=%s", (edu_id, alumni_id))
+
+
+class MentorshipRepository(Repository):
+    TABLE = "Mentorship"
+    LIST_SELECT = """SELECT M.mid, A.name as alumni_name, S.name as student_name, M.start_date, M.end_date
+               FROM Mentorship M
+               JOIN Alumni A ON M.alumni_id=A.alumni_id
+               JOIN Student S ON M.student_id=S.student_id"""
+    LIST_KEY = "M.mid"
+
+    def add(self, mid, alumni_id, student_id, start_date, end_date=None):
+        return self.db.execute("""INSERT INTO Mentorship (mid, alumni_id, student_id, start_date, end_date)
+                   VALUES (%s, %s, %s, %s, %s)""", (mid, alumni_id, student_id, start_date, end_date))
+
+    def end(self, mid, end_date):
+        return self.db.execute("UPDATE Mentorship SET end_date=%s WHERE mid=%s", (end_date, mid))
+
+    def delete(self, mid):
+        return self.db.execute("DELETE FROM Mentorship WHERE mid=%s", (mid,))
+
+    def durations(self):
+        return self.db.fetch(f"""SELECT M.mid,
+                    A.name AS Alumni,
+                    S.name AS Student,
+                    M.start_date,
+                    M.end_date,
+                    M.duration_days AS DurationDays,
+                    {DAYS_SO_FAR} AS DaysSoFar
+            FROM Mentorship M
+            JOIN Alumni A ON M.alumni_id = A.alumni_id
+            JOIN Student S ON M.student_id = S.student_id
+            ORDER BY M.mid""")
+
+    def list_by_alumni(self):
+        """Every mentorship under its alumnus, alumni id first (for alumni_db.GroupBlanker)"""
+        return self.db.fetch(f"""SELECT A.alumni_id,
+                    A.name AS Alumni,
+                    M.mid,
+                    S.name AS Student,
+                    M.start_date,
+                    M.end_date,
+                    {DAYS_SO_FAR} AS DaysSoFar
+            FROM Mentorship M
+            JOIN Alumni A ON M.alumni_id = A.alumni_id
+            JOIN Student S ON M.student_id = S.student_id
+            ORDER BY A.name, A.alumni_id, M.mid""")
+
+    def longest(self, limit, ongoing=False, min_days=0):
+        """The longest mentorships of at least min_days, completed or (ongoing=True) still open.
+
+        Completed ones are ranked on the duration_days index; open ones on
+        (end_date, start_date), since the earliest start has run longest.
+        """
+        if ongoing:
+            where = "M.end_date IS NULL AND M.start_date <= CURDATE() - INTERVAL %s DAY"
+            order = "M.start_date, M.mid"
+        else:
+            where = "M.duration_days >= %s"
+            order = "M.duration_days DESC, M.mid"
+        return self.db.fetch(f"""SELECT M.mid,
+                    A.name AS Alumni,
+                    S.name AS Student,
+                    M.start_date,
+                    M.end_date,
+                    {DAYS_SO_FAR} AS DurationDays
+            FROM Mentorship M
+            JOIN Alumni A ON M.alumni_id = A.alumni_id
+            JOIN Student S ON M.student_id = S.student_id
+            WHERE {where}
+            ORDER BY {order}
+            LIMIT %s""", (min_days, limit))
+
+    def average_by_alumni(self, limit):
+        """Mentorship count and average duration per alumnus, longest average first"""
+        return self.db.fetch(f"""SELECT A.alumni_id, A.name AS Alumni, T.mentorships AS Mentorships,
+                    T.completed AS Completed, T.avg_days AS AvgDays, T.avg_days_so_far AS AvgDaysSoFar
+            FROM (SELECT M.alumni_id,
+                         COUNT(*) AS mentorships,
+                         COUNT(M.duration_days) AS completed,
+                         ROUND(AVG(M.duration_days), 1) AS avg_days,
+                         ROUND(AVG({DAYS_SO_FAR}), 1) AS avg_days_so_far
+                  FROM Mentorship M
+                  GROUP BY M.alumni_id) T
+            JOIN Alumni A ON A.alumni_id = T.alumni_id
+            ORDER BY T.avg_days IS NULL, T.avg_days DESC, A.alumni_id
+            LIMIT %s""", (limit,))
+
+    def average_by_department(self):
+        """Mentorship count and average duration per department of the mentoring alumni"""
+        return self.db.fetch(f"""SELECT D.dept_id, D.name AS Department, COUNT(*) AS Mentorships,
+                    COUNT(M.duration_days) AS Completed,
+                    ROUND(AVG(M.duration_days), 1) AS AvgDays,
+                    ROUND(AVG({DAYS_SO_FAR}), 1) AS AvgDaysSoFar
+            FROM Mentorship M
+            JOIN Alumni A ON A.alumni_id = M.alumni_id
+            JOIN Department D ON D.dept_id = A.dept_id
+            GROUP BY D.dept_id, D.name
+            ORDER BY AvgDays IS NULL, AvgDays DESC, D.dept_id""")
+
+    def by_alumni(self, alumni_id):
+        return self.db.call("list_mentorships_by_alumni", (alumni_id,))
+
+
+class CommitteeRepository(Repository):
+    TABLE = "Committee"
+
+    def list_all(self):
+        return self.db.fetch("""SELECT C.cid, C.name, C.phone, C.head, E.name AS event_name
+            FROM Committee C
+            JOIN Event E ON C.event_id = E.event_id
+            ORDER BY E.event_id, C.cid""")
+
+    def add(self, cid, event_id, name, phone, head):
+        return self.db.execute("""INSERT INTO Committee (cid, event_id, name, phone, head)
+                    VALUES (%s, %s, %s, %s, %s)""", (cid, event_id, name, phone, head))
+
+    def update(self, cid, head=None, phone=None):
+        """Change the given fields only"""
+        return self.db.execute(*_update_statement("Committee", {"head": head, "phone": phone}, "cid", cid))
+
+    def delete(self, cid):
+        return self.db.execute("DELETE FROM Committee WHERE cid=%s", (cid,))
+
+
+class EventRepository(Repository):
+    TABLE = "Event"
+    ID_COLUMN = "event_id"
+    LIST_SELECT = "SELECT event_id, name, description, location, date FROM Event"
+    LIST_KEY = "event_id"
+
+    def choices(self):
+        return self.db.fetch("SELECT event_id, name FROM Event ORDER BY event_id")
+
+    def names(self):
+        return self.db.fetch("SELECT name FROM Event ORDER BY name")
+
+    def add(self, event_id, name, description, location, date):
+        return self.db.execute(
+            "INSERT INTO Event (event_id, name, description, location, date) VALUES (%s,%s,%s,%s,%s)",
+            (event_id, name, description, location, date))
+
+    def update(self, event_id, description=None, location=None, date=None):
+        """Change the given fields only"""
+        fields = {"description": description, "location": location, "date": date}
+        return self.db.execute(*_update_statement("Event", fields, "event_id", event_id))
+
+    def delete(self, event_id):
+        return self.db.execute("DELETE FROM Event WHERE event_id=%s", (event_id,))
+
+    def participant_counts(self):
+        """Attendance totals per event from the trigger-maintained counters"""
+        return self.db.fetch("""
+            SELECT e.event_id,
+                e.name AS Event_Name,
+                COALESCE(c.student_attended + c.alumni_attended, 0) AS Total_Attendees,
+                COALESCE(c.student_attended, 0) AS Students_Attended,
+                COALESCE(c.alumni_attended, 0) AS Alumni_Attended,
+                COALESCE(c.student_registered + c.alumni_registered, 0) AS Registered,
+                COALESCE(c.student_cancelled + c.alumni_cancelled, 0) AS Cancelled
+            FROM Event e
+            LEFT JOIN EventAttendanceCounter c ON c.event_id = e.event_id
+            ORDER BY e.event_id""")
+
+
+class ParticipationRepository(Repository):
+    """Student and alumni event participation; kind is "Student" or "Alumni"."""
+
+    STUDENT_SELECT = """SELECT P.pid, E.name as event_name, S.name as student_name, P.resp_status
+               FROM EventParticipationStudent P
+               JOIN Event E ON P.event_id=E.event_id
+               JOIN Student S ON P.student_id=S.student_id"""
+    ALUMNI_SELECT = """SELECT P.pid, E.name as event_name, A.name as alumni_name, P.resp_status
+               FROM EventParticipationAlumni P
+               JOIN Event E ON P.event_id=E.event_id
+               JOIN Alumni A ON P.alumni_id=A.alumni_id"""
+    LIST_KEY = "P.pid"
+
+    def listing(self, kind="Student"):
+        return (self.STUDENT_SELECT if kind == "Student" else self.ALUMNI_SELECT), self.LIST_KEY
+
+    def list_page(self, kind="Student", after=None, limit=DEFAULT_PAGE_SIZE):
+        return self._keyset_page(*self.listing(kind), after, limit)
+
+    def register(self, kind, pid, event_id, person_id, status="Registered"):
+        person = "student_id" if kind == "Student" else "alumni_id"
+        return self.db.execute(f"INSERT INTO {_participation_table(kind)} (pid, event_id, {person}, resp_status) "
+                               f"VALUES (%s,%s,%s,%s)", (pid, event_id, person_id, status))
+
+    def set_status(self, kind, pid, status):
+        return self.db.execute(f"UPDATE {_participation_table(kind)} SET resp_status=%s WHERE pid=%s",
+                               (status, pid))
+
+    def delete(self, kind, pid):
+        return self.db.execute(f"DELETE FROM {_participation_table(kind)} WHERE pid=%s", (pid,))
+
+    def set_status_many(self, kind, pids, status):
+        """Set the status of many participations in one transaction"""
+        return self.db.batch(alumni_db.WriteBatch().add_for_ids(
+            f"UPDATE {_participation_table(kind)} SET resp_status=%s WHERE pid IN ({{ids}})", pids, (status,)))
+
+    def delete_many(self, kind, pids):
+        """Delete many participations in one transaction"""
+        return self.db.batch(alumni_db.WriteBatch().add_for_ids(
+            f"DELETE FROM {_participation_table(kind)} WHERE pid IN ({{ids}})", pids))
+
+    def checkin_list(self, event_id):
+        """Everyone registered for an event, for alumni_db.CheckInSession"""
+        return self.db.fetch(alumni_db.CHECKIN_SQL, (event_id, event_id))
+
+    def save_checkins(self, session):
+        """Write a CheckInSession's pending check-ins; returns (result, taken) or (None, None)"""
+        batch, taken = session.take_batch()
+        if batch is None:
+            return None, None
+        return self.db.batch(batch), taken
+
+
+def _participation_table(kind):
+    try:
+        return alumni_db.PARTICIPATION_TABLES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown participant kind {kind!r}") from None
+
+
+def _update_statement(table, fields, key_column, key):
+    # UPDATE for the fields that were given (not None); the column names are fixed by the caller
+    changes = {column: value for column, value in fields.items() if value is not None}
+    if not changes:
+        raise ValueError("Nothing to update")
+    assignments = ", ".join(f"{column}=%s" for column in changes)
+    return f"UPDATE {table} SET {assignments} WHERE {key_column}=%s", (*changes.values(), key)
+
+
+class Repositories:
+    """Every repository over one database object"""
+
+    def __init__(self, db):
+        self.db = db
+        self.departments = DepartmentRepository(db)
+        self.alumni = AlumniRepository(db)
+        self.students = StudentRepository(db)
+        self.education = EducationRepository(db)
+        self.mentorships = MentorshipRepository(db)
+        self.committees = CommitteeRepository(db)
+        self.events = EventRepository(db)
+        self.participation = ParticipationRepository(db)
@@ -0,0 +1,75 @@
+"""asyncio data access for the Tk GUI, so independent queries run concurrently.
+
+Tk owns the main thread, so the asyncio loop runs on a thread of its own
+with an aiomysql pool. Callers hand it repository Statements and get back a
+concurrent.futures.Future, which BackgroundQueryExecutor.track delivers on
+the Tk thread like any other job. gather() sends every statement at once,
+so a form that needs several lookups waits for the slowest one rather than
+for all of them in turn. It only reads, and each read is its own
+transaction, so it sees writes the GUI's blocking pool has committed.
+"""
+import asyncio
+import threading
+
+import alumni_db
+import alumni_service
+
+try:
+    import aiomysql
+except ImportError:  # the GUI falls back to its thread pool without it
+    aiomysql = None
+
+# Seconds to wait for the pool to open or close
+STARTUP_TIMEOUT = 10
+
+# Errors the async driver raises, for callers that report database errors
+DRIVER_ERRORS = (aiomysql.Error,) if aiomysql is not None else ()
+
+
+class AsyncBackend:
+    """An asyncio loop on a daemon thread with an aiomysql pool for one user.
+
+    Raises RuntimeError if aiomysql is not installed and the driver's own
+    errors if the pool cannot connect.
+    """
+
+    def __init__(self, user, password, pool_size, host=alumni_db.DB_HOST, database=alumni_db.DB_NAME):
+        if aiomysql is None:
+            raise RuntimeError("The async backend needs aiomysql (pip install aiomysql)")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="db-async", daemon=True)
+        self._thread.start()
+        try:
+            self._pool = self.submit(aiomysql.create_pool(
+                host=host, user=user, password=password, db=database,
+                minsize=1, maxsize=pool_size, autocommit=True)).result(STARTUP_TIMEOUT)
+        except BaseException:
+            self._stop()
+            raise
+        self.db = alumni_service.AsyncDatabase(self._pool)
+
+    def submit(self, coroutine):
+        """Schedule a coroutine on the loop; returns a concurrent.futures.Future.
+
+        Cancelling the future cancels the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def gather(self, statements):
+        """Run independent SELECTs concurrently; the future's result is a list of (rows, columns)"""
+        async def run():
+            return await asyncio.gather(*(self.db.fetch(sql, params) for sql, params in statements))
+        return self.submit(run())
+
+    def close(self):
+        async def close_pool():
+            self._pool.close()
+            await self._pool.wait_closed()
+        try:
+            self.submit(close_pool()).result(STARTUP_TIMEOUT)
+        finally:
+            self._stop()
+
+    def _stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(STARTUP_TIMEOUT)
@@ -0,0 +1,184 @@
+"""Time every query the GUI issues and compare runs to catch regressions.
+
+    python datagen.py --alumni 1000000
+    python benchmark.py --output before.json
+    python benchmark.py --compare before.json
+
+Each query in check_query_plans.QUERIES, plus the stored procedures the
+GUI calls, runs --warmup times untimed and then --iterations
+times, through the same alumni_service.PooledDatabase the GUI uses, so
+reads run as prepared statements on a pooled connection. The report gives p50/p95/p99 latency, queries per second and rows
+returned. --output saves the run as JSON together with the server version
+and table sizes; --compare reads a saved run and exits with status 1 if any
+query's p95 got more than --threshold times slower (and by more than
+MIN_REGRESSION_MS, so sub-millisecond noise is ignored).
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+
+import mysql.connector
+
+import alumni_db
+import alumni_service
+import check_query_plans
+
+# Slowdowns smaller than this are treated as noise whatever the ratio
+MIN_REGRESSION_MS = 1.0
+DEFAULT_THRESHOLD = 1.25
+
+# Tables whose row counts are recorded with each run
+TABLES = ["Department", "Alumni", "Student", "Education", "Mentorship", "Event", "Committee",
+          "EventParticipationStudent", "EventParticipationAlumni"]
+
+# (name, procedure, args) for the stored procedures the GUI calls
+PROCEDURES = [
+    ("list_mentorships_by_alumni (procedure)", "list_mentorships_by_alumni", (101,)),
+    ("alumni_profile (procedure)", "alumni_profile", (101,)),
+]
+
+
+def timed(run, warmup, iterations):
+    """Call run() warmup + iterations times; returns (sorted latencies in ms, rows of the last call)"""
+    for _ in range(warmup):
+        run()
+    latencies = []
+    rows = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        rows = run()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return latencies, rows
+
+
+def query_runner(db, sql, params):
+    def run():
+        rows, _ = db.fetch(sql, params)
+        return len(rows)
+    return run
+
+
+def procedure_runner(db, name, args):
+    def run():
+        return sum(len(rows) for rows, _ in db.call_all(name, args))
+    return run
+
+
+def summarize(latencies, rows):
+    total = sum(latencies)
+    return {
+        "p50_ms": round(alumni_db.percentile(latencies, 0.50), 3),
+        "p95_ms": round(alumni_db.percentile(latencies, 0.95), 3),
+        "p99_ms": round(alumni_db.percentile(latencies, 0.99), 3),
+        "mean_ms": round(total / len(latencies), 3),
+        "qps": round(len(latencies) / (total / 1000), 1) if total else None,
+        "rows": rows,
+    }
+
+
+def run_benchmark(db, warmup, iterations, only=None, report=print):
+    """Benchmark every query whose name contains `only` (all by default) on a PooledDatabase.
+
+    Returns {name: summary}. Every call checks a connection out of the pool
+    and ends its transaction on release, as it does for the GUI.
+    """
+    benchmarks = [(name, query_runner, sql, params) for name, sql, params, _ in check_query_plans.QUERIES]
+    benchmarks += [(name, procedure_runner, proc, args) for name, proc, args in PROCEDURES]
+    results = {}
+    report(f"{'query':48} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'qps':>9} {'rows':>7}")
+    for name, runner, statement, params in benchmarks:
+        if only and only not in name:
+            continue
+        result = summarize(*timed(runner(db, statement, params), warmup, iterations))
+        results[name] = result
+        report(f"{name:48} {result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['p99_ms']:9.2f} "
+               f"{result['qps'] or 0:9.1f} {result['rows']:7}")
+    return results
+
+
+def environment(db):
+    """Server version and table sizes, so runs on different data are not compared by mistake"""
+    version = db.fetch("SELECT VERSION()")[0][0][0]
+    counts = {table: db.fetch(f"SELECT COUNT(*) FROM {table}")[0][0][0] for table in TABLES}
+    return {"server": version, "tables": counts}
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Return (name, old p95, new p95) for each query at least `threshold` times slower than baseline"""
+    regressions = []
+    for name, result in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        old, new = before["p95_ms"], result["p95_ms"]
+        if new - old > MIN_REGRESSION_MS and new > old * threshold:
+            regressions.append((name, old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the GUI's queries and compare against a saved run")
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--password", default="admin@123")
+    parser.add_argument("--host", default=alumni_db.DB_HOST)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--only", help="run only the queries whose name contains this text")
+    parser.add_argument("--output", help="save this run as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="a run saved with --output to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="p95 slowdown ratio that counts as a regression")
+    args = parser.parse_args(argv)
+    if args.iterations < 1:
+        parser.error("--iterations must be at least 1")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    try:
+        conn = alumni_db.connect(args.user, args.password, host=args.host)
+    except mysql.connector.Error as err:
+        print(f"Could not connect: {err}", file=sys.stderr)
+        return 2
+    # One connection, so every iteration reuses its prepared statements like a warm GUI worker
+    pool = alumni_db.ConnectionPool(args.user, args.password, size=1, host=args.host, first_connection=conn)
+    try:
+        db = alumni_service.PooledDatabase(pool)
+        meta = environment(db)
+        print(f"{meta['server']}, " + ", ".join(f"{t} {n:,}" for t, n in meta["tables"].items()) + "\n")
+        results = run_benchmark(db, args.warmup, args.iterations, args.only)
+        stats = pool.statement_stats.stats()
+        print(f"\nPrepared statements: {stats['prepared']} prepared, {stats['reused']} reused")
+    except mysql.connector.Error as err:
+        print(f"Benchmark failed: {err}", file=sys.stderr)
+        return 2
+    finally:
+        pool.close()
+
+    if args.output:
+        run = {"timestamp": datetime.now().isoformat(timespec="seconds"), "iterations": args.iterations,
+               **meta, "results": results}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"\nSaved to {args.output}")
+
+    if baseline is not None:
+        if baseline.get("tables") != meta["tables"]:
+            print("\nWarning: the baseline was taken on different table sizes.")
+        regressions = compare(baseline["results"], results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for name, old, new in regressions:
+                print(f"  {name}: p95 {old:.2f} ms -> {new:.2f} ms ({new / old if old else float('inf'):.1f}x)")
+            return 1
+        print(f"\nNo p95 regressions against {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
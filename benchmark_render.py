@@ -0,0 +1,84 @@
+"""Micro-benchmark: table_format against PrettyTable for rendering result rows as text.
+
+    python benchmark_render.py --sizes 1000 100000 1000000
+
+Rows are synthetic Alumni rows from datagen, so nothing needs a database.
+Each formatter renders the same rows --repeat times and the best time is
+reported. "prettytable" is the old show_results path, one add_row per row
+followed by get_string(); it is skipped when prettytable is not installed.
+"""
+import argparse
+import sys
+import time
+
+import datagen
+import table_format
+
+try:
+    import prettytable
+except ImportError:  # the comparison is skipped without it
+    prettytable = None
+
+COLUMNS = ["alumni_id", "name", "email", "phone_number", "graduation_year", "company", "dept_id"]
+CHUNK_SIZE = 5000
+
+
+def render_prettytable(rows):
+    table = prettytable.PrettyTable(COLUMNS)
+    for row in rows:
+        table.add_row(["NULL" if v is None else v for v in row])
+    return table.get_string()
+
+
+def render_text_table(rows):
+    return table_format.format_table(COLUMNS, rows)
+
+
+def render_text_table_chunked(rows):
+    # As the .txt export writes it: widths from the first chunk, then chunk by chunk
+    table = table_format.TextTable(COLUMNS, rows[:CHUNK_SIZE])
+    parts = [table.header()]
+    for start in range(0, len(rows), CHUNK_SIZE):
+        parts.append(table.rows(rows[start:start + CHUNK_SIZE]))
+    return "".join(parts)
+
+
+RENDERERS = [
+    ("prettytable", render_prettytable),
+    ("table_format", render_text_table),
+    ("table_format (chunked)", render_text_table_chunked),
+]
+
+
+def best_time(render, rows, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare text table renderers on synthetic rows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=datagen.DEFAULT_SEED)
+    args = parser.parse_args(argv)
+
+    renderers = [(name, render) for name, render in RENDERERS if name != "prettytable" or prettytable]
+    if prettytable is None:
+        print("prettytable is not installed; skipping it (pip install prettytable)\n")
+
+    print(f"{'rows':>10}  {'renderer':24} {'seconds':>9} {'rows/s':>12}")
+    for size in args.sizes:
+        rows = list(datagen.SyntheticData(size, seed=args.seed).alumni())
+        for name, render in renderers:
+            elapsed = best_time(render, rows, args.repeat)
+            print(f"{size:>10,}  {name:24} {elapsed:9.3f} {size / elapsed if elapsed else 0:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""Bulk import of Alumni, Student and Education records from CSV or Excel files.
+
+Rows are read from the file one at a time, checked with the same rules as the
+entry forms and inserted with executemany, one transaction per chunk, so
+neither the file nor the import is ever held in memory as a whole. Rows the
+database rejects are written to an error report next to the source file.
+"""
+import csv
+import io
+import os
+import time
+
+import mysql.connector
+
+import alumni_db
+
+try:
+    import openpyxl
+except ImportError:  # only needed for .xlsx files
+    openpyxl = None
+
+# Rows inserted per executemany call and per transaction
+DEFAULT_CHUNK_SIZE = 1000
+
+# Columns accepted per table: (column, parser, required, default when empty).
+# The file's header row names the columns, in any order and case.
+IMPORT_TABLES = {
+    "Alumni": [
+        ("alumni_id", alumni_db.parse_int, True, None),
+        ("name", str, True, None),
+        ("email", str, True, None),
+        ("phone_number", str, False, None),
+        ("graduation_year", alumni_db.parse_int, True, None),
+        ("company", str, False, "Not Provided"),
+        ("dept_id", alumni_db.parse_int, True, None),
+    ],
+    "Student": [
+        ("student_id", alumni_db.parse_int, True, None),
+        ("name", str, True, None),
+        ("email", str, True, None),
+        ("phone", str, False, None),
+        ("batch_year", alumni_db.parse_int, True, None),
+        ("dept_id", alumni_db.parse_int, True, None),
+    ],
+    "Education": [
+        ("edu_id", alumni_db.parse_int, True, None),
+        ("alumni_id", alumni_db.parse_int, True, None),
+        ("college_name", str, True, None),
+        ("degree", str, True, None),
+        ("course", str, True, None),
+        ("start_year", alumni_db.parse_int, True, None),
+        ("end_year", alumni_db.parse_int, True, None),
+    ],
+}
+
+
+class ImportFileError(Exception):
+    """The file cannot be imported at all, e.g. a required column is missing"""
+
+
+def insert_sql(table):
+    columns = [field[0] for field in IMPORT_TABLES[table]]
+    return (f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})")
+
+
+# =============================================
+#  Sources
+# =============================================
+class CsvSource:
+    """Rows of a CSV file, read lazily. The first row is the header."""
+
+    def __init__(self, path):
+        self._raw = open(path, "rb")
+        self._size = os.fstat(self._raw.fileno()).st_size
+        self._reader = csv.reader(io.TextIOWrapper(self._raw, encoding="utf-8-sig", newline=""))
+        self.header = next(self._reader, [])
+
+    def __iter__(self):
+        # Line numbers count the header as line 1, as a spreadsheet would show them
+        for number, row in enumerate(self._reader, start=2):
+            if any(cell.strip() for cell in row):
+                yield number, row
+
+    def fraction(self):
+        """How far through the file reading has got, from 0 to 1"""
+        return self._raw.tell() / self._size if self._size else 1.0
+
+    def close(self):
+        self._raw.close()
+
+
+class ExcelSource:
+    """Rows of the first worksheet of an .xlsx file, streamed in read-only mode"""
+
+    def __init__(self, path):
+        if openpyxl is None:
+            raise ImportFileError("Reading .xlsx files needs openpyxl (pip install openpyxl)")
+        self._book = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        sheet = self._book.worksheets[0]
+        self._total = sheet.max_row or 0
+        self._rows = sheet.iter_rows(values_only=True)
+        self._read = 1
+        self.header = [self._cell(value) for value in next(self._rows, ())]
+
+    def __iter__(self):
+        for number, values in enumerate(self._rows, start=2):
+            self._read = number
+            row = [self._cell(value) for value in values]
+            if any(cell.strip() for cell in row):
+                yield number, row
+
+    def fraction(self):
+        return min(1.0, self._read / self._total) if self._total else 1.0
+
+    def close(self):
+        self._book.close()
+
+    @staticmethod
+    def _cell(value):
+        # Cells come back typed; turn them into the text a CSV would hold so both
+        # formats go through the same validation
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+
+def open_source(path):
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        return ExcelSource(path)
+    return CsvSource(path)
+
+
+# =============================================
+#  Import
+# =============================================
+class BulkImport:
+    """Import one file into one table through a connection from pool.
+
+    run() reads the file chunk by chunk. Each chunk is inserted with a single
+    executemany and committed; if the database rejects it, the chunk is rolled
+    back and retried row by row so the good rows still go in and each bad row
+    is reported with its error. Rows that fail validation never reach the
+    database. A cancelled import keeps the chunks already committed.
+    """
+
+    def __init__(self, pool, table, path, chunk_size=DEFAULT_CHUNK_SIZE, error_path=None):
+        if table not in IMPORT_TABLES:
+            raise ValueError(f"Bulk import is not supported for {table}")
+        self.pool = pool
+        self.table = table
+        self.path = path
+        self.chunk_size = chunk_size
+        self.error_path = error_path or os.path.splitext(path)[0] + ".errors.csv"
+        self.fields = IMPORT_TABLES[table]
+        self.sql = insert_sql(table)
+        self.stats = {"read": 0, "inserted": 0, "failed": 0, "elapsed": 0.0,
+                      "fraction": 0.0, "cancelled": False, "error_report": None}
+        self._errors = None
+        self._error_file = None
+
+    def run(self, progress=None, cancelled=None):
+        """Import the whole file and return the final stats.
+
+        progress(stats) is called after every chunk; cancelled() is checked
+        between chunks and stops the import when it returns True.
+        """
+        start = time.monotonic()
+        source = open_source(self.path)
+        try:
+            positions = self._column_positions(source.header)
+            with self.pool.connection() as conn:
+                chunk = []
+                for number, row in source:
+                    self.stats["read"] += 1
+                    try:
+                        chunk.append((number, row, self._validate(row, positions)))
+                    except ValueError as err:
+                        self._report(number, row, str(err), source.header)
+                    if len(chunk) >= self.chunk_size:
+                        self._flush(conn, chunk, source, start, progress)
+                        chunk = []
+                        if cancelled and cancelled():
+                            self.stats["cancelled"] = True
+                            break
+                else:
+                    self._flush(conn, chunk, source, start, progress)
+        finally:
+            source.close()
+            if self._error_file is not None:
+                self._error_file.close()
+        return self.stats
+
+    def _column_positions(self, header):
+        names = [name.strip().lower() for name in header]
+        positions = []
+        for column, _, required, _ in self.fields:
+            if column in names:
+                positions.append(names.index(column))
+            elif required:
+                raise ImportFileError(f"Missing required column '{column}' "
+                                      f"(expected: {', '.join(f[0] for f in self.fields)})")
+            else:
+                positions.append(None)
+        return positions
+
+    def _validate(self, row, positions):
+        values = []
+        for (column, parse, required, default), pos in zip(self.fields, positions):
+            text = row[pos].strip() if pos is not None and pos < len(row) else ""
+            if not text:
+                if required:
+                    raise ValueError(f"{column} is required")
+                values.append(default)
+                continue
+            try:
+                values.append(parse(text))
+            except ValueError:
+                raise ValueError(f"{column} must be a valid number") from None
+        return tuple(values)
+
+    def _flush(self, conn, chunk, source, start, progress):
+        if chunk:
+            failed = self._insert_chunk(conn, chunk)
+            self.stats["inserted"] += len(chunk) - len(failed)
+            for number, row, message in failed:
+                self._report(number, row, message, source.header)
+        self.stats["elapsed"] = time.monotonic() - start
+        self.stats["fraction"] = source.fraction()
+        if progress:
+            progress(dict(self.stats))
+
+    def _insert_chunk(self, conn, chunk):
+        """Insert a chunk in one transaction; return the rows the database refused"""
+        cursor = conn.cursor()
+        try:
+            try:
+                cursor.executemany(self.sql, [values for _, _, values in chunk])
+                conn.commit()
+                return []
+            except mysql.connector.Error as err:
+                conn.rollback()
+                if alumni_db.is_connection_lost(err):
+                    raise
+
+            # A failed statement only undoes itself, so the rest of the chunk
+            # can still be committed together
+            failed = []
+            for number, row, values in chunk:
+                try:
+                    cursor.execute(self.sql, values)
+                except mysql.connector.Error as err:
+                    if alumni_db.is_connection_lost(err):
+                        raise
+                    failed.append((number, row, err.msg))
+            conn.commit()
+            return failed
+        finally:
+            cursor.close()
+
+    def _report(self, number, row, message, header):
+        self.stats["failed"] += 1
+        if self._error_file is None:
+            self._error_file = open(self.error_path, "w", newline="", encoding="utf-8")
+            self._errors = csv.writer(self._error_file)
+            self._errors.writerow(["line", "error"] + list(header))
+            self.stats["error_report"] = self.error_path
+        self._errors.writerow([number, message] + list(row))
@@ -0,0 +1,111 @@
+"""EXPLAIN every query the GUI issues and report the ones that scan a whole table.
+
+    python check_query_plans.py --user admin --password admin@123
+
+Exits with status 1 if any query does a full table scan (EXPLAIN type ALL)
+on a table it is not expected to read in full. Run it against a database
+with realistic row counts: on the five-row seed data MySQL may prefer a
+scan even where a usable index exists. The SQL comes from the same
+alumni_service repositories the GUI and the HTTP API use.
+"""
+import argparse
+import sys
+
+import mysql.connector
+
+import alumni_db
+import alumni_service
+
+# Repositories in statement mode: each call returns (sql, params) without running it
+SQL = alumni_service.Repositories(alumni_service.StatementDatabase())
+
+# (screen, SQL, sample params, tables/aliases the query is expected to read in full)
+QUERIES = [
+    ("view_alumni (first page)", *SQL.alumni.list_page(limit=101), ()),
+    ("view_alumni (next page)", *SQL.alumni.list_page(after=101, limit=101), ()),
+    ("search_alumni_gui (full-text)", *SQL.alumni.search("ravi iisc", 51), ()),
+    ("search_alumni_gui (short name prefix)", *SQL.alumni.search("Ra", 51), ()),
+    ("count_alumni_company", *SQL.alumni.count_by_company(), ()),
+    ("filter_alumni_dept_gui", *SQL.alumni.by_department("Computer Science"), ()),
+    ("view_students (next page)", *SQL.students.list_page(after=201, limit=101), ()),
+    ("view_departments", *SQL.departments.list_all(), ("Department",)),
+    ("view_education", *SQL.education.list_all(), ("E",)),  # lists every education record
+    ("view_alumni_education", *SQL.education.list_with_alumni(), ("E",)),
+    ("view_mentorships (next page)", *SQL.mentorships.list_page(after=401, limit=101), ()),
+    ("view_mentorships_by_alumni", *SQL.mentorships.list_by_alumni(), ()),
+    ("show_mentorship_duration", *SQL.mentorships.durations(), ()),
+    ("longest_mentorships (completed)", *SQL.mentorships.longest(100, min_days=365), ()),
+    ("longest_mentorships (ongoing)", *SQL.mentorships.longest(100, ongoing=True), ()),
+    ("average_duration_by_alumni", *SQL.mentorships.average_by_alumni(100), ()),
+    ("average_duration_by_department",
+     *SQL.mentorships.average_by_department(), ("M", "D")),  # averages over every mentorship by design
+    ("list_mentorships_by_alumni (procedure body)",
+     """SELECT m.mid, s.name AS student_name, m.start_date, m.end_date
+        FROM Mentorship m JOIN Student s ON m.student_id = s.student_id WHERE m.alumni_id = %s""",
+     (101,), ()),
+    ("view_committees", *SQL.committees.list_all(), ("C",)),
+    ("view_events (next page)", *SQL.events.list_page(after=601, limit=101), ()),
+    ("view_participation_students (next page)",
+     *SQL.participation.list_page("Student", after=701, limit=101), ()),
+    ("view_participation_alumni (next page)",
+     *SQL.participation.list_page("Alumni", after=801, limit=101), ()),
+    ("count_event_participants",
+     *SQL.events.participant_counts(), ("e",)),  # one row per event by design; counters are read by primary key
+    ("show_total_events_attended_gui", *SQL.alumni.attendance_summary([101]), ()),
+    ("show_attendance_leaderboard", *SQL.alumni.attendance_leaderboard(100), ("A",)),  # ranks every alumnus
+    ("event_checkin_gui", *SQL.participation.checkin_list(601), ()),
+    ("view_alumni_by_event_gui", *SQL.alumni.attending_event("Math Workshop"), ()),
+    ("picker: alumni by name prefix", *SQL.alumni.pick("Ra", 20), ()),
+    ("picker: student by name prefix", *SQL.students.pick("Am", 20), ()),
+    ("picker: event by name prefix", *SQL.events.pick("Ma", 20), ()),
+    ("lookup: event names", *SQL.events.names(), ()),
+]
+
+
+def check(conn):
+    """EXPLAIN each query and return a list of (screen, table, detail) problems"""
+    problems = []
+    cursor = conn.cursor()
+    try:
+        for screen, sql, params, allowed_scans in QUERIES:
+            for step in alumni_db.explain(cursor, sql, params):
+                table = step.get("table") or ""
+                access = step.get("type")
+                status = "ok"
+                if access == "ALL" and table not in allowed_scans and not table.startswith("<"):
+                    status = "FULL SCAN"
+                    problems.append((screen, table, f"rows={step.get('rows')} possible_keys={step.get('possible_keys')}"))
+                print(f"{status:9}  {screen:45} {table:28} type={access} key={step.get('key')}")
+    finally:
+        cursor.close()
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EXPLAIN the GUI's queries and flag full table scans")
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--password", default="admin@123")
+    parser.add_argument("--host", default=alumni_db.DB_HOST)
+    args = parser.parse_args(argv)
+
+    try:
+        conn = alumni_db.connect(args.user, args.password, host=args.host)
+    except mysql.connector.Error as err:
+        print(f"Could not connect: {err}", file=sys.stderr)
+        return 2
+    try:
+        problems = check(conn)
+    finally:
+        conn.close()
+
+    if problems:
+        print(f"\n{len(problems)} unexpected full table scan(s):")
+        for screen, table, detail in problems:
+            print(f"  {screen}: {table} ({detail})")
+        return 1
+    print("\nEvery query uses an index (or is expected to read its table in full).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
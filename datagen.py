@@ -0,0 +1,344 @@
+"""Load deterministic synthetic data into AlumniDB at a chosen scale, for benchmarking.
+
+    python datagen.py --user admin --password admin@123 --alumni 100000
+
+The same --seed and sizes always produce the same rows. The numbers are
+skewed the way real data is: a few departments, companies, colleges and
+events are far more popular than the rest, and a small share of alumni
+mentor and attend most. Generated ids start at ID_BASE so the seed rows
+from alumni_network_database.sql stay in place; --replace deletes the
+previously generated rows first. Event dates lie in the future because the
+before_event_insert trigger rejects past dates, so they are relative to
+the day of the load.
+
+Nothing is kept per generated row, so memory stays flat however large the
+tables: popular ids are spread over their range by a strided permutation
+rather than a shuffled list, and the mentorship and participation pairs are
+generated person by person, each with distinct partners, so they are unique
+without remembering the pairs already produced.
+
+Rows go in with executemany in chunks of --chunk-size, one transaction per
+chunk, with unique and foreign key checks off for the session; the
+generated data satisfies them by construction. Apply the migrations first
+so the indexes and attendance counters exist.
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import mysql.connector
+
+import alumni_db
+
+# Generated ids are offset past the seed data's ids
+ID_BASE = 1_000_000
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_SIZE = 5000
+
+FIRST_NAMES = ["Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Deepa", "Divya", "Farhan", "Gaurav", "Ishaan",
+               "Kavya", "Karan", "Lakshmi", "Manish", "Meera", "Neha", "Nikhil", "Pooja", "Pranav", "Priya",
+               "Rahul", "Ravi", "Riya", "Rohit", "Sanjay", "Shreya", "Sneha", "Suresh", "Tanvi", "Varun",
+               "Vikram", "Yash", "Zoya", "Anil", "Bhavna", "Chetan", "Esha", "Harish", "Jaya", "Kiran"]
+LAST_NAMES = ["Sharma", "Patel", "Kumar", "Nair", "Rao", "Reddy", "Iyer", "Gupta", "Singh", "Das",
+              "Mehta", "Joshi", "Verma", "Menon", "Pillai", "Shah", "Desai", "Kulkarni", "Bose", "Chopra"]
+DEPARTMENTS = ["Computer Science", "Electronics", "Mechanical", "Civil", "Mathematics", "Physics",
+               "Chemistry", "Biotechnology", "Information Science", "Electrical", "Aerospace", "Economics"]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Google", "Microsoft", "Amazon", "Accenture", "IBM", "Deloitte",
+             "HCL", "Cognizant", "Flipkart", "Oracle", "Intel", "Qualcomm", "Adobe", "Capgemini", "Zoho",
+             "Swiggy", "Razorpay", "Not Provided"]
+COLLEGES = ["IISc Bangalore", "IIT Bombay", "IIT Madras", "IIT Delhi", "NIT Trichy", "BITS Pilani",
+            "Stanford University", "MIT", "Carnegie Mellon", "University of Toronto", "TU Munich",
+            "National University of Singapore", "PES University", "RV College", "Anna University"]
+DEGREES = [("B.Tech", 4), ("M.Tech", 2), ("MBA", 2), ("MS", 2), ("PhD", 5), ("B.Sc", 3), ("M.Sc", 2)]
+COURSES = ["Computer Science", "Data Science", "Electronics", "Mechanical Engineering", "Finance",
+           "Machine Learning", "Structural Engineering", "Applied Mathematics", "Robotics", "Marketing"]
+EVENT_KINDS = ["Tech Symposium", "Career Fair", "Alumni Meet", "Hackathon", "Guest Lecture", "Workshop",
+               "Cultural Fest", "Sports Meet", "Startup Pitch", "Research Colloquium"]
+LOCATIONS = ["Auditorium", "Open Ground", "Convention Center", "Lab 101", "Seminar Hall", "Stadium", "Online"]
+STATUSES = ("Registered", "Attended", "Cancelled")
+STATUS_WEIGHTS = (0.3, 0.6, 0.1)
+
+# Popular ids: rank = n * u ** POPULARITY_SKEW, so half the picks fall in the top eighth
+POPULARITY_SKEW = 3.0
+# Pareto shape for how many mentees or events one person has; lower is more skewed
+PARTNER_COUNT_SHAPE = 1.5
+# Mean mentees per alumnus and events per student / alumnus
+MENTEES_PER_ALUMNUS = 0.25
+EVENTS_PER_STUDENT = 3
+EVENTS_PER_ALUMNUS = 2
+
+# Tables written, children first, for --replace
+GENERATED_TABLES = [
+    ("EventParticipationAlumni", "pid"), ("EventParticipationStudent", "pid"), ("Committee", "event_id"),
+    ("Mentorship", "mid"), ("Education", "alumni_id"), ("Event", "event_id"),
+    ("Student", "student_id"), ("Alumni", "alumni_id"), ("Department", "dept_id"),
+]
+
+
+def zipf_weights(n, exponent=1.1):
+    """Cumulative weights where item k is picked about 1/k^exponent as often as item 1"""
+    total = 0.0
+    cumulative = []
+    for k in range(1, n + 1):
+        total += 1.0 / k ** exponent
+        cumulative.append(total)
+    return cumulative
+
+
+def coprime_stride(n, rng):
+    """A stride s with gcd(s, n) == 1, so i -> (i * s + offset) % n visits each index once"""
+    if n <= 2:
+        return 1
+    while True:
+        stride = rng.randrange(1, n)
+        if math.gcd(stride, n) == 1:
+            return stride
+
+
+class Popularity:
+    """Picks ids from a range, a few of them far more often than the rest.
+
+    Ranks are mapped onto the range by a strided permutation, so the popular
+    ids are spread out and no per-id state is needed.
+    """
+
+    def __init__(self, ids, rng):
+        self.ids = ids
+        self.rng = rng
+        self.stride = coprime_stride(len(ids), rng)
+        self.offset = rng.randrange(len(ids))
+
+    def _rank(self):
+        return int(len(self.ids) * self.rng.random() ** POPULARITY_SKEW)
+
+    def _id(self, rank):
+        return self.ids[(rank * self.stride + self.offset) % len(self.ids)]
+
+    def pick_distinct(self, k):
+        """k different ids (k <= len(ids)); a rank already taken moves on to the next free one"""
+        taken = set()
+        for _ in range(k):
+            rank = self._rank()
+            while rank in taken:
+                rank = (rank + 1) % len(self.ids)
+            taken.add(rank)
+            yield self._id(rank)
+
+
+class SyntheticData:
+    """Generates the rows for one scale, table by table, from a single seeded RNG.
+
+    Each generator yields tuples in the column order of the matching INSERT
+    in INSERT_SQL. Call them in the order of TABLE_ORDER, since later tables
+    pick ids from earlier ones.
+    """
+
+    def __init__(self, alumni, students=None, events=None, seed=DEFAULT_SEED, today=None):
+        self.rng = random.Random(seed)
+        self.sizes = {
+            "alumni": alumni,
+            "students": students if students is not None else max(1, alumni // 2),
+            "events": events if events is not None else max(20, alumni // 500),
+        }
+        self.today = today or date.today()
+        self.department_ids = [ID_BASE + i for i in range(len(DEPARTMENTS))]
+        self.alumni_ids = range(ID_BASE, ID_BASE + self.sizes["alumni"])
+        self.student_ids = range(ID_BASE, ID_BASE + self.sizes["students"])
+        self.event_ids = range(ID_BASE, ID_BASE + self.sizes["events"])
+        self._popular_students = Popularity(self.student_ids, self.rng)
+        self._popular_events = Popularity(self.event_ids, self.rng)
+
+    def _partner_count(self, mean, partners):
+        """How many partners one person gets: skewed, averaging mean, at most half of partners"""
+        shape = PARTNER_COUNT_SHAPE
+        count = int(mean * (shape - 1) / shape * self.rng.paretovariate(shape) + self.rng.random())
+        return min(count, max(1, len(partners.ids) // 2))
+
+    def _name(self):
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def departments(self):
+        for dept_id, name in zip(self.department_ids, DEPARTMENTS):
+            yield dept_id, f"{name} (synthetic)", f"Dr. {self._name()}"
+
+    def alumni(self):
+        departments = (self.department_ids, zipf_weights(len(self.department_ids)))
+        companies = (COMPANIES, zipf_weights(len(COMPANIES)))
+        for alumni_id in self.alumni_ids:
+            name = self._name()
+            email = f"{name.lower().replace(' ', '.')}.{alumni_id}@alumni.example"
+            phone = f"9{alumni_id % 10 ** 9:09d}" if self.rng.random() < 0.8 else None
+            year = self.rng.randint(1990, self.today.year)
+            yield (alumni_id, name, email, phone, year,
+                   self.rng.choices(*companies)[0], self.rng.choices(*departments)[0])
+
+    def students(self):
+        departments = (self.department_ids, zipf_weights(len(self.department_ids)))
+        for student_id in self.student_ids:
+            name = self._name()
+            email = f"{name.lower().replace(' ', '.')}.{student_id}@univ.example"
+            phone = f"8{student_id % 10 ** 9:09d}" if self.rng.random() < 0.9 else None
+            year = self.rng.randint(max(2000, self.today.year - 6), self.today.year + 4)
+            yield student_id, name, email, phone, year, self.rng.choices(*departments)[0]
+
+    def education(self):
+        colleges = (COLLEGES, zipf_weights(len(COLLEGES)))
+        for alumni_id in self.alumni_ids:
+            start = self.rng.randint(1986, self.today.year - 2)
+            # One to three degrees, most alumni have one or two
+            for edu_id in range(1, self.rng.choices((1, 2, 3), (55, 35, 10))[0] + 1):
+                degree, years = self.rng.choice(DEGREES)
+                yield (edu_id, alumni_id, self.rng.choices(*colleges)[0], degree,
+                       self.rng.choice(COURSES), start, start + years)
+                start += years + self.rng.randint(0, 3)
+
+    def mentorships(self):
+        mid = ID_BASE
+        for alumni_id, student_id in self._pairs(self.alumni_ids, self._popular_students, MENTEES_PER_ALUMNUS):
+            start = self.today - timedelta(days=self.rng.randint(0, 5 * 365))
+            end = start + timedelta(days=self.rng.randint(30, 720)) if self.rng.random() < 0.6 else None
+            yield mid, alumni_id, student_id, start, end
+            mid += 1
+
+    def events(self):
+        for event_id in self.event_ids:
+            kind = self.rng.choice(EVENT_KINDS)
+            yield (event_id, f"{kind} {event_id - ID_BASE + 1}", f"Synthetic {kind.lower()}",
+                   self.rng.choice(LOCATIONS), self.today + timedelta(days=self.rng.randint(1, 730)))
+
+    def committees(self):
+        for event_id in self.event_ids:
+            for cid in range(1, self.rng.randint(1, 3) + 1):
+                yield cid, event_id, f"Committee {cid}", f"7{event_id % 10 ** 8:08d}{cid}", f"Prof. {self._name()}"
+
+    def student_participation(self):
+        return self._participation(self.student_ids, EVENTS_PER_STUDENT)
+
+    def alumni_participation(self):
+        return self._participation(self.alumni_ids, EVENTS_PER_ALUMNUS)
+
+    def _participation(self, people, mean):
+        # A person may register for many events but only once for each
+        pid = ID_BASE
+        for person_id, event_id in self._pairs(people, self._popular_events, mean):
+            yield pid, event_id, person_id, self.rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+            pid += 1
+
+    def _pairs(self, people, partners, mean):
+        """(person, partner) pairs, each at most once: every person gets distinct partners"""
+        for person_id in people:
+            for partner_id in partners.pick_distinct(self._partner_count(mean, partners)):
+                yield person_id, partner_id
+
+
+INSERT_SQL = {
+    "Department": "INSERT INTO Department (dept_id, name, hod) VALUES (%s, %s, %s)",
+    "Alumni": """INSERT INTO Alumni (alumni_id, name, email, phone_number, graduation_year, company, dept_id)
+                 VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+    "Student": """INSERT INTO Student (student_id, name, email, phone, batch_year, dept_id)
+                  VALUES (%s, %s, %s, %s, %s, %s)""",
+    "Education": """INSERT INTO Education (edu_id, alumni_id, college_name, degree, course, start_year, end_year)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+    "Mentorship": "INSERT INTO Mentorship (mid, alumni_id, student_id, start_date, end_date) VALUES (%s, %s, %s, %s, %s)",
+    "Event": "INSERT INTO Event (event_id, name, description, location, date) VALUES (%s, %s, %s, %s, %s)",
+    "Committee": "INSERT INTO Committee (cid, event_id, name, phone, head) VALUES (%s, %s, %s, %s, %s)",
+    "EventParticipationStudent": """INSERT INTO EventParticipationStudent (pid, event_id, student_id, resp_status)
+                                    VALUES (%s, %s, %s, %s)""",
+    "EventParticipationAlumni": """INSERT INTO EventParticipationAlumni (pid, event_id, alumni_id, resp_status)
+                                   VALUES (%s, %s, %s, %s)""",
+}
+
+# (table, SyntheticData method), parents before children
+TABLE_ORDER = [
+    ("Department", "departments"), ("Alumni", "alumni"), ("Student", "students"), ("Education", "education"),
+    ("Mentorship", "mentorships"), ("Event", "events"), ("Committee", "committees"),
+    ("EventParticipationStudent", "student_participation"), ("EventParticipationAlumni", "alumni_participation"),
+]
+
+
+def delete_generated(conn):
+    """Remove rows left by an earlier load (ids from ID_BASE up)"""
+    cursor = conn.cursor()
+    try:
+        for table, column in GENERATED_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE {column} >= %s", (ID_BASE,))
+            conn.commit()
+    finally:
+        cursor.close()
+
+
+def load(conn, data, chunk_size=DEFAULT_CHUNK_SIZE, report=print):
+    """Insert every generated table; returns {table: (rows, seconds)}"""
+    timings = {}
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+        for table, method in TABLE_ORDER:
+            start = time.monotonic()
+            rows = 0
+            chunk = []
+            for row in getattr(data, method)():
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    cursor.executemany(INSERT_SQL[table], chunk)
+                    conn.commit()
+                    rows += len(chunk)
+                    chunk = []
+            if chunk:
+                cursor.executemany(INSERT_SQL[table], chunk)
+                conn.commit()
+                rows += len(chunk)
+            elapsed = time.monotonic() - start
+            timings[table] = (rows, elapsed)
+            report(f"{table:28} {rows:>10,} rows  {elapsed:7.1f} s  {rows / elapsed if elapsed else 0:>9,.0f} rows/s")
+        cursor.execute("ANALYZE TABLE " + ", ".join(table for table, _ in TABLE_ORDER))
+        cursor.fetchall()
+    finally:
+        try:
+            cursor.execute("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+        finally:
+            cursor.close()
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load deterministic synthetic data for benchmarking")
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--password", default="admin@123")
+    parser.add_argument("--host", default=alumni_db.DB_HOST)
+    parser.add_argument("--alumni", type=int, default=100_000, help="alumni rows; other tables scale from it")
+    parser.add_argument("--students", type=int, help="student rows (default: half the alumni)")
+    parser.add_argument("--events", type=int, help="event rows (default: one per 500 alumni, at least 20)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--replace", action="store_true", help="delete previously generated rows first")
+    args = parser.parse_args(argv)
+
+    data = SyntheticData(args.alumni, args.students, args.events, seed=args.seed)
+    try:
+        conn = alumni_db.connect(args.user, args.password, host=args.host)
+    except mysql.connector.Error as err:
+        print(f"Could not connect: {err}", file=sys.stderr)
+        return 2
+    try:
+        if args.replace:
+            delete_generated(conn)
+        start = time.monotonic()
+        timings = load(conn, data, args.chunk_size)
+        total = sum(rows for rows, _ in timings.values())
+        print(f"\nLoaded {total:,} rows in {time.monotonic() - start:.1f} s (seed {args.seed})")
+        return 0
+    except mysql.connector.Error as err:
+        print(f"Load failed: {err}", file=sys.stderr)
+        if err.errno == 1062:
+            print("Rows from an earlier load are still there; rerun with --replace.", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
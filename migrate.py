@@ -0,0 +1,151 @@
+"""Apply the versioned schema migrations in migrations/ to AlumniDB.
+
+Each file is named NNN_description.sql and runs once; applied versions are
+recorded in the schema_migrations table. Run it after alumni_network_database.sql
+with a user that may alter the schema:
+
+    python migrate.py --user admin --password admin@123
+
+admin cannot pass privileges on, so the roles' grants on objects the
+migrations create are in role_grants.sql, which root runs afterwards.
+
+A migration that failed partway can be run again once the cause is fixed.
+The migrations guard what they create with IF NOT EXISTS / OR REPLACE where
+MySQL has it; indexes and columns cannot be, so one that already exists is
+taken to be left over from the earlier attempt and skipped.
+"""
+import argparse
+import os
+import re
+import sys
+
+import mysql.connector
+from mysql.connector import errorcode
+
+import alumni_db
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+_FILE_RE = re.compile(r"^(\d+)_\w+\.sql$")
+
+# Errors that mean the statement's index or column is already there
+ALREADY_APPLIED = {errorcode.ER_DUP_KEYNAME, errorcode.ER_DUP_FIELDNAME}
+
+
+def split_statements(sql):
+    """Split a MySQL script into statements, honouring DELIMITER lines, quotes and comments"""
+    statements = []
+    delimiter = ";"
+    current = []
+    quote = None
+    for line in sql.splitlines(keepends=True):
+        if quote is None and line.strip().upper().startswith("DELIMITER "):
+            delimiter = line.split()[1]
+            continue
+        i = 0
+        while i < len(line):
+            ch = line[i]
+            if quote:
+                current.append(ch)
+                if ch == "\\":
+                    current.append(line[i + 1:i + 2])
+                    i += 1
+                elif ch == quote:
+                    quote = None
+            elif ch in ("'", '"', "`"):
+                quote = ch
+                current.append(ch)
+            elif line.startswith("--", i) or ch == "#":
+                break  # comment runs to end of line
+            elif line.startswith(delimiter, i):
+                stmt = "".join(current).strip()
+                if stmt:
+                    statements.append(stmt)
+                current = []
+                i += len(delimiter)
+                continue
+            else:
+                current.append(ch)
+            i += 1
+        if quote is None and current and not current[-1].endswith("\n"):
+            current.append("\n")
+    stmt = "".join(current).strip()
+    if stmt:
+        statements.append(stmt)
+    return statements
+
+
+def list_migrations():
+    """Return (version, path) for every migration file, oldest first"""
+    found = []
+    for name in os.listdir(MIGRATIONS_DIR):
+        match = _FILE_RE.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(MIGRATIONS_DIR, name)))
+    return sorted(found)
+
+
+def applied_versions(cursor):
+    cursor.execute("""CREATE TABLE IF NOT EXISTS schema_migrations (
+                          version INT PRIMARY KEY,
+                          name VARCHAR(255) NOT NULL,
+                          applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                      )""")
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def apply_migration(conn, version, path):
+    # MySQL commits DDL implicitly, so a migration that fails halfway is rerun
+    # from the top; the version is only recorded once every statement ran
+    with open(path, encoding="utf-8") as f:
+        statements = split_statements(f.read())
+    cursor = conn.cursor()
+    try:
+        for stmt in statements:
+            try:
+                cursor.execute(stmt)
+            except mysql.connector.Error as err:
+                if err.errno not in ALREADY_APPLIED:
+                    raise
+                print(f"  skipped, already in place: {err.msg}")
+                continue
+            if cursor.with_rows:
+                cursor.fetchall()
+        cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                       (version, os.path.basename(path)))
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--password", default="admin@123")
+    parser.add_argument("--host", default=alumni_db.DB_HOST)
+    parser.add_argument("--dry-run", action="store_true", help="only list pending migrations")
+    args = parser.parse_args(argv)
+
+    conn = alumni_db.connect(args.user, args.password, host=args.host)
+    try:
+        cursor = conn.cursor()
+        done = applied_versions(cursor)
+        cursor.close()
+        pending = [(v, p) for v, p in list_migrations() if v not in done]
+        if not pending:
+            print("Schema is up to date.")
+            return 0
+        for version, path in pending:
+            print(f"{'Pending' if args.dry_run else 'Applying'} {os.path.basename(path)}")
+            if not args.dry_run:
+                apply_migration(conn, version, path)
+        return 0
+    except mysql.connector.Error as err:
+        print(f"Migration failed: {err}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+-- =====================================================
+-- 001: Secondary indexes for the columns the GUI filters,
+--      joins, groups and sorts on
+-- =====================================================
+USE AlumniDB;
+
+-- Alumni.name: type-ahead pickers (name LIKE 'prefix%' ORDER BY name LIMIT n)
+CREATE INDEX idx_alumni_name ON Alumni (name);
+
+-- Alumni.company: count_alumni_company groups by company; the index is covering,
+-- so the GROUP BY reads the index instead of the table
+CREATE INDEX idx_alumni_company ON Alumni (company);
+
+-- Alumni.dept_id: filter_alumni_dept_gui filters by department and sorts by name
+CREATE INDEX idx_alumni_dept_name ON Alumni (dept_id, name);
+
+-- Student.name: type-ahead pickers. Student.dept_id is already indexed by its foreign key.
+CREATE INDEX idx_student_name ON Student (name);
+
+-- Event.name: view_alumni_by_event_gui looks the event up by name; pickers search it
+CREATE INDEX idx_event_name ON Event (name);
+
+-- Participation by event and status: count_event_participants counts
+-- (event_id, 'Attended'); view_alumni_by_event_gui needs the participants of
+-- one event, which the trailing person id makes index-only
+CREATE INDEX idx_eps_event_status ON EventParticipationStudent (event_id, resp_status, student_id);
+CREATE INDEX idx_epa_event_status ON EventParticipationAlumni (event_id, resp_status, alumni_id);
@@ -0,0 +1,10 @@
+-- =====================================================
+-- 002: Full-text indexes for alumni search
+-- =====================================================
+USE AlumniDB;
+
+-- search_alumni_gui matches words (and word prefixes) in name, email and company ...
+CREATE FULLTEXT INDEX ft_alumni_profile ON Alumni (name, email, company);
+
+-- ... and in the colleges and courses of the alumni's education records
+CREATE FULLTEXT INDEX ft_education_college_course ON Education (college_name, course);
@@ -0,0 +1,24 @@
+-- =====================================================
+-- 003: Set-based alumni attendance
+-- =====================================================
+USE AlumniDB;
+
+-- Attendance per alumnus is counted with (alumni_id, resp_status) lookups;
+-- the index covers both the single-alumnus count and the grouped leaderboard
+CREATE INDEX idx_epa_alumni_status ON EventParticipationAlumni (alumni_id, resp_status);
+
+-- Events attended by every alumnus, computed in one grouped pass over the
+-- index instead of one total_events_attended() call per row
+CREATE OR REPLACE VIEW AlumniAttendanceLeaderboard AS
+SELECT A.alumni_id,
+       A.name,
+       COALESCE(T.events_attended, 0) AS events_attended
+FROM Alumni A
+LEFT JOIN (
+    SELECT alumni_id, COUNT(*) AS events_attended
+    FROM EventParticipationAlumni
+    WHERE resp_status = 'Attended'
+    GROUP BY alumni_id
+) T ON T.alumni_id = A.alumni_id;
+
+-- The alumni role's SELECT on the view is in role_grants.sql
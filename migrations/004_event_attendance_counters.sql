@@ -0,0 +1,206 @@
+-- =====================================================
+-- 004: Per-event participation counters kept current by triggers
+-- =====================================================
+USE AlumniDB;
+
+CREATE TABLE IF NOT EXISTS EventAttendanceCounter (
+    event_id INT PRIMARY KEY,
+    student_registered INT NOT NULL DEFAULT 0,
+    student_attended INT NOT NULL DEFAULT 0,
+    student_cancelled INT NOT NULL DEFAULT 0,
+    alumni_registered INT NOT NULL DEFAULT 0,
+    alumni_attended INT NOT NULL DEFAULT 0,
+    alumni_cancelled INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (event_id) REFERENCES Event(event_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+-- Backfill from the existing participation rows (REPLACE recounts every
+-- event if an earlier run got this far)
+REPLACE INTO EventAttendanceCounter
+SELECT e.event_id,
+       COALESCE(s.registered, 0), COALESCE(s.attended, 0), COALESCE(s.cancelled, 0),
+       COALESCE(a.registered, 0), COALESCE(a.attended, 0), COALESCE(a.cancelled, 0)
+FROM Event e
+LEFT JOIN (
+    SELECT event_id,
+           SUM(resp_status = 'Registered') AS registered,
+           SUM(resp_status = 'Attended') AS attended,
+           SUM(resp_status = 'Cancelled') AS cancelled
+    FROM EventParticipationStudent GROUP BY event_id
+) s ON s.event_id = e.event_id
+LEFT JOIN (
+    SELECT event_id,
+           SUM(resp_status = 'Registered') AS registered,
+           SUM(resp_status = 'Attended') AS attended,
+           SUM(resp_status = 'Cancelled') AS cancelled
+    FROM EventParticipationAlumni GROUP BY event_id
+) a ON a.event_id = e.event_id;
+
+-- -----------------------------------------------------
+-- Student participation
+-- -----------------------------------------------------
+DROP TRIGGER IF EXISTS eps_after_insert;
+DROP TRIGGER IF EXISTS eps_after_update;
+DROP TRIGGER IF EXISTS eps_after_delete;
+
+DELIMITER //
+CREATE TRIGGER eps_after_insert
+AFTER INSERT ON EventParticipationStudent
+FOR EACH ROW
+BEGIN
+    INSERT INTO EventAttendanceCounter (event_id, student_registered, student_attended, student_cancelled)
+    VALUES (NEW.event_id,
+            IF(NEW.resp_status = 'Registered', 1, 0),
+            IF(NEW.resp_status = 'Attended', 1, 0),
+            IF(NEW.resp_status = 'Cancelled', 1, 0))
+    ON DUPLICATE KEY UPDATE
+        student_registered = student_registered + IF(NEW.resp_status = 'Registered', 1, 0),
+        student_attended = student_attended + IF(NEW.resp_status = 'Attended', 1, 0),
+        student_cancelled = student_cancelled + IF(NEW.resp_status = 'Cancelled', 1, 0);
+END //
+
+-- Covers RSVP changes from update_participation_status_gui and moves between events
+CREATE TRIGGER eps_after_update
+AFTER UPDATE ON EventParticipationStudent
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.event_id <=> NEW.event_id AND OLD.resp_status <=> NEW.resp_status) THEN
+        UPDATE EventAttendanceCounter
+        SET student_registered = student_registered - IF(OLD.resp_status = 'Registered', 1, 0),
+            student_attended = student_attended - IF(OLD.resp_status = 'Attended', 1, 0),
+            student_cancelled = student_cancelled - IF(OLD.resp_status = 'Cancelled', 1, 0)
+        WHERE event_id = OLD.event_id;
+
+        INSERT INTO EventAttendanceCounter (event_id, student_registered, student_attended, student_cancelled)
+        VALUES (NEW.event_id,
+                IF(NEW.resp_status = 'Registered', 1, 0),
+                IF(NEW.resp_status = 'Attended', 1, 0),
+                IF(NEW.resp_status = 'Cancelled', 1, 0))
+        ON DUPLICATE KEY UPDATE
+            student_registered = student_registered + IF(NEW.resp_status = 'Registered', 1, 0),
+            student_attended = student_attended + IF(NEW.resp_status = 'Attended', 1, 0),
+            student_cancelled = student_cancelled + IF(NEW.resp_status = 'Cancelled', 1, 0);
+    END IF;
+END //
+
+CREATE TRIGGER eps_after_delete
+AFTER DELETE ON EventParticipationStudent
+FOR EACH ROW
+BEGIN
+    UPDATE EventAttendanceCounter
+    SET student_registered = student_registered - IF(OLD.resp_status = 'Registered', 1, 0),
+        student_attended = student_attended - IF(OLD.resp_status = 'Attended', 1, 0),
+        student_cancelled = student_cancelled - IF(OLD.resp_status = 'Cancelled', 1, 0)
+    WHERE event_id = OLD.event_id;
+END //
+DELIMITER ;
+
+-- -----------------------------------------------------
+-- Alumni participation
+-- -----------------------------------------------------
+DROP TRIGGER IF EXISTS epa_after_insert;
+DROP TRIGGER IF EXISTS epa_after_update;
+DROP TRIGGER IF EXISTS epa_after_delete;
+
+DELIMITER //
+CREATE TRIGGER epa_after_insert
+AFTER INSERT ON EventParticipationAlumni
+FOR EACH ROW
+BEGIN
+    INSERT INTO EventAttendanceCounter (event_id, alumni_registered, alumni_attended, alumni_cancelled)
+    VALUES (NEW.event_id,
+            IF(NEW.resp_status = 'Registered', 1, 0),
+            IF(NEW.resp_status = 'Attended', 1, 0),
+            IF(NEW.resp_status = 'Cancelled', 1, 0))
+    ON DUPLICATE KEY UPDATE
+        alumni_registered = alumni_registered + IF(NEW.resp_status = 'Registered', 1, 0),
+        alumni_attended = alumni_attended + IF(NEW.resp_status = 'Attended', 1, 0),
+        alumni_cancelled = alumni_cancelled + IF(NEW.resp_status = 'Cancelled', 1, 0);
+END //
+
+CREATE TRIGGER epa_after_update
+AFTER UPDATE ON EventParticipationAlumni
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.event_id <=> NEW.event_id AND OLD.resp_status <=> NEW.resp_status) THEN
+        UPDATE EventAttendanceCounter
+        SET alumni_registered = alumni_registered - IF(OLD.resp_status = 'Registered', 1, 0),
+            alumni_attended = alumni_attended - IF(OLD.resp_status = 'Attended', 1, 0),
+            alumni_cancelled = alumni_cancelled - IF(OLD.resp_status = 'Cancelled', 1, 0)
+        WHERE event_id = OLD.event_id;
+
+        INSERT INTO EventAttendanceCounter (event_id, alumni_registered, alumni_attended, alumni_cancelled)
+        VALUES (NEW.event_id,
+                IF(NEW.resp_status = 'Registered', 1, 0),
+                IF(NEW.resp_status = 'Attended', 1, 0),
+                IF(NEW.resp_status = 'Cancelled', 1, 0))
+        ON DUPLICATE KEY UPDATE
+            alumni_registered = alumni_registered + IF(NEW.resp_status = 'Registered', 1, 0),
+            alumni_attended = alumni_attended + IF(NEW.resp_status = 'Attended', 1, 0),
+            alumni_cancelled = alumni_cancelled + IF(NEW.resp_status = 'Cancelled', 1, 0);
+    END IF;
+END //
+
+CREATE TRIGGER epa_after_delete
+AFTER DELETE ON EventParticipationAlumni
+FOR EACH ROW
+BEGIN
+    UPDATE EventAttendanceCounter
+    SET alumni_registered = alumni_registered - IF(OLD.resp_status = 'Registered', 1, 0),
+        alumni_attended = alumni_attended - IF(OLD.resp_status = 'Attended', 1, 0),
+        alumni_cancelled = alumni_cancelled - IF(OLD.resp_status = 'Cancelled', 1, 0)
+    WHERE event_id = OLD.event_id;
+END //
+DELIMITER ;
+
+-- -----------------------------------------------------
+-- Foreign-key cascades do not fire triggers, so deleting a student or an
+-- alumnus subtracts their participations before the cascade removes them.
+-- (Deleting an event removes its counter row through the FK above.)
+-- -----------------------------------------------------
+DROP TRIGGER IF EXISTS student_before_delete_counters;
+DROP TRIGGER IF EXISTS alumni_before_delete_counters;
+
+DELIMITER //
+CREATE TRIGGER student_before_delete_counters
+BEFORE DELETE ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE EventAttendanceCounter C
+    JOIN (
+        SELECT event_id,
+               SUM(resp_status = 'Registered') AS registered,
+               SUM(resp_status = 'Attended') AS attended,
+               SUM(resp_status = 'Cancelled') AS cancelled
+        FROM EventParticipationStudent
+        WHERE student_id = OLD.student_id
+        GROUP BY event_id
+    ) P ON P.event_id = C.event_id
+    SET C.student_registered = C.student_registered - P.registered,
+        C.student_attended = C.student_attended - P.attended,
+        C.student_cancelled = C.student_cancelled - P.cancelled;
+END //
+
+CREATE TRIGGER alumni_before_delete_counters
+BEFORE DELETE ON Alumni
+FOR EACH ROW
+BEGIN
+    UPDATE EventAttendanceCounter C
+    JOIN (
+        SELECT event_id,
+               SUM(resp_status = 'Registered') AS registered,
+               SUM(resp_status = 'Attended') AS attended,
+               SUM(resp_status = 'Cancelled') AS cancelled
+        FROM EventParticipationAlumni
+        WHERE alumni_id = OLD.alumni_id
+        GROUP BY event_id
+    ) P ON P.event_id = C.event_id
+    SET C.alumni_registered = C.alumni_registered - P.registered,
+        C.alumni_attended = C.alumni_attended - P.attended,
+        C.alumni_cancelled = C.alumni_cancelled - P.cancelled;
+END //
+DELIMITER ;
+
+-- The alumni role's SELECT on the counters is in role_grants.sql
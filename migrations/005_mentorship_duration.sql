@@ -0,0 +1,20 @@
+-- =====================================================
+-- 005: Mentorship duration as an indexed generated column
+-- =====================================================
+USE AlumniDB;
+
+-- duration_days replaces the per-row mentorship_duration() call. It is NULL
+-- while a mentorship is ongoing: a generated column cannot use CURDATE(), so
+-- the "so far" figure for open mentorships is computed in the query, from
+-- start_date, and ranked through idx_mentorship_open instead.
+ALTER TABLE Mentorship
+    ADD COLUMN duration_days INT AS (DATEDIFF(end_date, start_date)) STORED;
+
+-- Longest completed mentorships and "at least N days" filters
+CREATE INDEX idx_mentorship_duration ON Mentorship (duration_days);
+
+-- Average duration per alumnus, read from the index alone
+CREATE INDEX idx_mentorship_alumni_duration ON Mentorship (alumni_id, duration_days, start_date);
+
+-- Ongoing mentorships (end_date IS NULL), longest first = earliest start_date first
+CREATE INDEX idx_mentorship_open ON Mentorship (end_date, start_date);
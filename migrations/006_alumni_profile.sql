@@ -0,0 +1,45 @@
+-- =====================================================
+-- 006: Alumni profile in one round trip
+-- =====================================================
+USE AlumniDB;
+
+-- Everything the profile page shows about one alumnus, as five result sets
+-- in this order: core record, education, mentorships, event participation
+-- and attended-event count. Each is a lookup on an alumni_id index.
+DROP PROCEDURE IF EXISTS alumni_profile;
+
+DELIMITER //
+CREATE PROCEDURE alumni_profile(IN alumniId INT)
+READS SQL DATA
+BEGIN
+    SELECT A.alumni_id, A.name, A.email, A.phone_number, A.graduation_year, A.company,
+           D.name AS department
+    FROM Alumni A
+    LEFT JOIN Department D ON D.dept_id = A.dept_id
+    WHERE A.alumni_id = alumniId;
+
+    SELECT edu_id, college_name, degree, course, start_year, end_year
+    FROM Education
+    WHERE alumni_id = alumniId
+    ORDER BY start_year, edu_id;
+
+    SELECT M.mid, S.name AS student_name, M.start_date, M.end_date,
+           COALESCE(M.duration_days, DATEDIFF(CURDATE(), M.start_date)) AS days
+    FROM Mentorship M
+    JOIN Student S ON S.student_id = M.student_id
+    WHERE M.alumni_id = alumniId
+    ORDER BY M.start_date, M.mid;
+
+    SELECT P.pid, E.event_id, E.name AS event_name, E.date, P.resp_status
+    FROM EventParticipationAlumni P
+    JOIN Event E ON E.event_id = P.event_id
+    WHERE P.alumni_id = alumniId
+    ORDER BY E.date, P.pid;
+
+    SELECT COUNT(*) AS events_attended
+    FROM EventParticipationAlumni
+    WHERE alumni_id = alumniId AND resp_status = 'Attended';
+END //
+DELIMITER ;
+
+-- EXECUTE for the alumni and student roles is in role_grants.sql
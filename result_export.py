@@ -0,0 +1,194 @@
+"""Streaming export of a query's result to CSV, JSON Lines, Parquet or a text table.
+
+The query is re-run on an unbuffered cursor (alumni_db.RowStream) and rows
+are written as they arrive, a fixed-size batch at a time, so memory use does
+not depend on the size of the result. Output goes to a temporary file that
+only replaces the target once the export has finished.
+"""
+import csv
+import json
+import os
+import time
+
+from mysql.connector import FieldType
+
+import alumni_db
+import table_format
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # only needed for Parquet output
+    pyarrow = None
+
+# Rows fetched from the server and written per batch
+DEFAULT_BATCH_SIZE = 5000
+
+FORMATS = {".csv": "CSV", ".jsonl": "JSON Lines", ".parquet": "Parquet", ".txt": "Text table"}
+
+
+class ExportError(Exception):
+    """The export cannot be started, e.g. an unknown format or missing library"""
+
+
+# =============================================
+#  Writers
+# =============================================
+class CsvWriter:
+    def __init__(self, path, columns, types):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class JsonLinesWriter:
+    """One JSON object per row; dates, decimals and the like are written as strings"""
+
+    def __init__(self, path, columns, types):
+        self._file = open(path, "w", encoding="utf-8")
+        self._columns = columns
+
+    def write(self, rows):
+        self._file.writelines(json.dumps(dict(zip(self._columns, row)), default=str) + "\n"
+                              for row in rows)
+
+    def close(self):
+        self._file.close()
+
+
+class TextWriter:
+    """A fixed-width table; column widths come from the first batch"""
+
+    def __init__(self, path, columns, types):
+        self._file = open(path, "w", encoding="utf-8")
+        self._columns = columns
+        self._table = None
+
+    def write(self, rows):
+        if self._table is None:
+            self._table = table_format.TextTable(self._columns, rows)
+            self._file.write(self._table.header())
+        self._file.write(self._table.rows(rows))
+
+    def close(self):
+        if self._table is None:
+            self._file.write(table_format.TextTable(self._columns).header())
+        self._file.close()
+
+
+class ParquetWriter:
+    """Writes each batch as a row group, with a schema taken from the cursor's column types"""
+
+    def __init__(self, path, columns, types):
+        if pyarrow is None:
+            raise ExportError("Parquet export needs pyarrow (pip install pyarrow)")
+        self._schema = pyarrow.schema([(name, self._arrow_type(code)) for name, code in zip(columns, types)])
+        self._text = [field.type == pyarrow.string() for field in self._schema]
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write(self, rows):
+        arrays = []
+        for i, (field, text) in enumerate(zip(self._schema, self._text)):
+            values = [row[i] for row in rows]
+            if text:
+                values = [None if v is None else str(v) for v in values]
+            arrays.append(pyarrow.array(values, type=field.type))
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+    @staticmethod
+    def _arrow_type(code):
+        if code in (FieldType.TINY, FieldType.SHORT, FieldType.INT24, FieldType.LONG,
+                    FieldType.LONGLONG, FieldType.YEAR):
+            return pyarrow.int64()
+        if code in (FieldType.FLOAT, FieldType.DOUBLE, FieldType.DECIMAL, FieldType.NEWDECIMAL):
+            return pyarrow.float64()
+        if code in (FieldType.DATE, FieldType.NEWDATE):
+            return pyarrow.date32()
+        if code in (FieldType.DATETIME, FieldType.TIMESTAMP):
+            return pyarrow.timestamp("us")
+        return pyarrow.string()
+
+
+WRITERS = {".csv": CsvWriter, ".jsonl": JsonLinesWriter, ".parquet": ParquetWriter, ".txt": TextWriter}
+
+
+# =============================================
+#  Export
+# =============================================
+class ResultExport:
+    """Export the rows of query to path; the file extension picks the format.
+
+    run() streams batch_size rows at a time from the server to the writer.
+    A cancelled or failed export removes its partial output and closes the
+    stream, which throws its connection away rather than reading the rest.
+    The stream runs on a connection of its own, opened with pool's
+    credentials, so a long export does not hold one of pool's connections.
+    """
+
+    def __init__(self, pool, query, params, path, batch_size=DEFAULT_BATCH_SIZE):
+        self.extension = os.path.splitext(path)[1].lower()
+        if self.extension not in WRITERS:
+            raise ExportError(f"Unsupported export format '{self.extension}' "
+                              f"(use {', '.join(FORMATS)})")
+        if self.extension == ".parquet" and pyarrow is None:
+            raise ExportError("Parquet export needs pyarrow (pip install pyarrow)")
+        self.pool = pool
+        self.query = query
+        self.params = params
+        self.path = path
+        self.batch_size = batch_size
+        self.stats = {"rows": 0, "elapsed": 0.0, "cancelled": False, "path": path}
+
+    def run(self, progress=None, cancelled=None):
+        """Write the whole result and return the final stats.
+
+        progress(stats) is called after every batch; cancelled() is checked
+        between batches and abandons the export when it returns True.
+        """
+        start = time.monotonic()
+        partial = self.path + ".part"
+        own = alumni_db.ConnectionPool(self.pool.user, self.pool.password, size=1,
+                                       host=self.pool.host, database=self.pool.database)
+        try:
+            stream = alumni_db.RowStream(own, self.query, self.params)
+        except BaseException:
+            own.close()
+            raise
+        writer = None
+        finished = False
+        try:
+            writer = WRITERS[self.extension](partial, stream.columns, stream.types)
+            while True:
+                rows = stream.fetch(self.batch_size)
+                if rows:
+                    writer.write(rows)
+                    self.stats["rows"] += len(rows)
+                self.stats["elapsed"] = time.monotonic() - start
+                if progress:
+                    progress(dict(self.stats))
+                if len(rows) < self.batch_size:
+                    break
+                if cancelled and cancelled():
+                    self.stats["cancelled"] = True
+                    return self.stats
+            writer.close()
+            writer = None
+            os.replace(partial, self.path)
+            finished = True
+            return self.stats
+        finally:
+            stream.close()
+            own.close()
+            if writer is not None:
+                writer.close()
+            if not finished and os.path.exists(partial):
+                os.remove(partial)
@@ -0,0 +1,18 @@
+-- =====================================================
+-- Role grants on objects created by the migrations
+-- =====================================================
+-- Run as root after migrate.py: admin has no GRANT OPTION, so the
+-- migrations cannot hand these out themselves. Safe to run again.
+--
+--     mysql -u root -p < role_grants.sql
+USE AlumniDB;
+
+-- 003: attendance leaderboard
+GRANT SELECT ON AlumniDB.AlumniAttendanceLeaderboard TO 'alumni'@'localhost';
+
+-- 004: per-event attendance counters
+GRANT SELECT ON AlumniDB.EventAttendanceCounter TO 'alumni'@'localhost';
+
+-- 006: alumni profile; students may already read every table it shows
+GRANT EXECUTE ON PROCEDURE AlumniDB.alumni_profile TO 'alumni'@'localhost';
+GRANT EXECUTE ON PROCEDURE AlumniDB.alumni_profile TO 'student'@'localhost';
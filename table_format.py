@@ -0,0 +1,63 @@
+"""Fixed-width plain-text tables for result rows.
+
+Column widths are settled up front, from the headings and a sample of the
+rows, and turned into one format string. Each row is then a single
+str.format call and a block of rows is one str.join, so formatting costs
+the same per row however many rows there are, and a large result can be
+formatted a chunk at a time with the same widths. A value longer than its
+column is written in full and pushes the rest of its line to the right;
+nothing is cut off.
+"""
+import itertools
+
+# Widest a column is padded to, in characters
+MAX_WIDTH = 40
+
+# Rows looked at to size the columns
+SAMPLE_ROWS = 1000
+
+SEPARATOR = " | "
+
+
+def cell_text(value):
+    return "NULL" if value is None else str(value)
+
+
+def column_widths(columns, sample, max_width=MAX_WIDTH):
+    """Width of each column: its longest heading or sampled value, at most max_width"""
+    widths = [len(str(name)) for name in columns]
+    for row in sample:
+        for i, value in enumerate(row):
+            length = len(cell_text(value))
+            if length > widths[i]:
+                widths[i] = length
+    return [max(1, min(width, max_width)) for width in widths]
+
+
+class TextTable:
+    """Formats rows under the given headings with widths taken from sample.
+
+    header() is the heading line and a rule under it; rows(chunk) formats
+    any number of rows, so a result can be written out in chunks.
+    """
+
+    def __init__(self, columns, sample=(), max_width=MAX_WIDTH):
+        self.columns = list(columns)
+        self.widths = column_widths(self.columns, itertools.islice(sample, SAMPLE_ROWS), max_width)
+        self._line = SEPARATOR.join(f"{{:<{w}}}" for w in self.widths).format
+
+    def header(self):
+        rule = "-+-".join("-" * w for w in self.widths)
+        return f"{self._line(*map(str, self.columns)).rstrip()}\n{rule}\n"
+
+    def rows(self, rows):
+        line = self._line
+        return "".join([line(*map(cell_text, row)).rstrip() + "\n" for row in rows])
+
+    def format(self, rows):
+        return self.header() + self.rows(rows)
+
+
+def format_table(columns, rows, max_width=MAX_WIDTH):
+    """The whole result as one string, sized from its first SAMPLE_ROWS rows"""
+    return TextTable(columns, rows[:SAMPLE_ROWS], max_width).format(rows)